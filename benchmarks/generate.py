@@ -0,0 +1,211 @@
+# ABOUTME: Synthetic monorepo and framework generator for benchmarks
+# ABOUTME: Builds deterministic trees of configurable size with a matching framework
+
+"""
+Generate synthetic projects and frameworks for benchmarking.
+
+Everything is derived from a seeded RNG, so the same parameters always
+produce the same tree.
+
+Usage:
+    python -m benchmarks.generate /tmp/monorepo --projects 200 --checks 2000
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+import yaml
+
+FRAMEWORK_ID = "synthetic"
+
+PRINCIPLES = ["transparency", "fairness", "privacy", "accountability", "safety"]
+
+# Packages dependency checks look for; projects declare a random subset
+KNOWN_PACKAGES = [
+    "shap", "lime", "eli5", "interpret", "fairlearn", "aif360", "themis-ml",
+    "opacus", "diffprivlib", "great-expectations", "evidently", "alibi",
+]
+
+
+def generate_framework(frameworks_dir: Path, checks: int, seed: int = 0) -> Path:
+    """
+    Write a framework with the given number of checks plus a registry for it.
+
+    Args:
+        frameworks_dir: Directory to create <id>/framework.yaml and registry.yaml in
+        checks: Number of checks, alternating file-exists and dependency-check
+        seed: RNG seed
+
+    Returns:
+        Path to the registry.yaml
+    """
+    rng = random.Random(seed)
+    check_specs = []
+
+    for i in range(checks):
+        principle = PRINCIPLES[i % len(PRINCIPLES)]
+        check = {
+            "id": f"{principle}-{i:05d}",
+            "name": f"Synthetic check {i}",
+            "principle": principle,
+            "severity": rng.choice(["error", "warning", "info"]),
+            "description": "Synthetic benchmark check",
+        }
+        if i % 2 == 0:
+            check["type"] = "file-exists"
+            check["config"] = {
+                "paths": [f"docs/DOC_{rng.randrange(50)}.md", f"DOC_{rng.randrange(50)}.md"]
+            }
+        else:
+            check["type"] = "dependency-check"
+            check["config"] = {
+                "packages": rng.sample(KNOWN_PACKAGES, 3),
+                "require_any": True,
+            }
+        check_specs.append(check)
+
+    spec = {
+        "metadata": {
+            "id": FRAMEWORK_ID,
+            "name": "Synthetic Benchmark Framework",
+            "version": "1.0.0",
+            "description": "Generated for benchmarks",
+        },
+        "principles": [
+            {"id": p, "name": p.title(), "weight": "high"} for p in PRINCIPLES
+        ],
+        "checks": check_specs,
+    }
+
+    framework_dir = frameworks_dir / FRAMEWORK_ID
+    framework_dir.mkdir(parents=True, exist_ok=True)
+    (framework_dir / "framework.yaml").write_text(yaml.safe_dump(spec, sort_keys=False))
+
+    registry_path = frameworks_dir / "registry.yaml"
+    registry_path.write_text(yaml.safe_dump({
+        "frameworks": {
+            "internal": [{
+                "id": FRAMEWORK_ID,
+                "name": "Synthetic Benchmark Framework",
+                "version": "1.0.0",
+                "status": "active",
+                "category": "benchmark",
+            }]
+        }
+    }))
+    return registry_path
+
+
+def manifest_contents(size: int, seed: int = 0) -> dict[str, str]:
+    """
+    Manifests declaring `size` dependencies each.
+
+    Args:
+        size: Number of dependencies per manifest
+        seed: RNG seed
+
+    Returns:
+        Manifest file name to content
+    """
+    rng = random.Random(seed)
+    names = [f"package-{i}" for i in range(size - 4)] + rng.sample(KNOWN_PACKAGES, 4)
+    rng.shuffle(names)
+    pins = [f"{name}>={rng.randrange(1, 9)}.{rng.randrange(20)}" for name in names]
+
+    deps = "".join(f'    "{pin}",\n' for pin in pins)
+    hashes = [f"sha256:{rng.getrandbits(256):064x}" for _ in range(4)]
+    poetry_lock = "".join(
+        f'[[package]]\nname = "{name}"\nversion = "1.0.0"\nfiles = [\n'
+        + "".join(f'    {{file = "{name}-1.0.0.whl", hash = "{h}"}},\n' for h in hashes)
+        + "]\n\n"
+        for name in names
+    )
+    pipfile_lock = json.dumps({
+        "_meta": {"hash": {"sha256": hashes[0]}, "pipfile-spec": 6},
+        "default": {name: {"hashes": hashes, "version": "==1.0.0"} for name in names},
+        "develop": {},
+    }, indent=4)
+
+    return {
+        "poetry.lock": poetry_lock,
+        "Pipfile.lock": pipfile_lock,
+        "requirements.txt": "# Generated\n" + "".join(f"{pin}\n" for pin in pins),
+        "pyproject.toml": (
+            '[project]\nname = "synthetic"\nversion = "0.1.0"\n'
+            f"dependencies = [\n{deps}]\n"
+        ),
+        "setup.py": (
+            "from setuptools import setup\n\n"
+            f"setup(\n    name=\"synthetic\",\n    install_requires=[\n{deps}    ],\n)\n"
+        ),
+    }
+
+
+def generate_monorepo(
+    root: Path,
+    projects: int,
+    files: int,
+    manifest_size: int,
+    seed: int = 0,
+) -> list[Path]:
+    """
+    Write a monorepo of projects configured for the synthetic framework.
+
+    Args:
+        root: Directory to create projects under
+        projects: Number of projects
+        files: Source and doc files per project
+        manifest_size: Dependencies declared per manifest
+        seed: RNG seed
+
+    Returns:
+        Project directories
+    """
+    rng = random.Random(seed)
+    config = yaml.safe_dump({
+        "version": "1.0",
+        "frameworks": [{"id": FRAMEWORK_ID, "compliance_level": "standard"}],
+    })
+    manifests = manifest_contents(manifest_size, seed)
+    project_paths = []
+
+    for p in range(projects):
+        project = root / f"services/svc-{p:04d}"
+        (project / "docs").mkdir(parents=True, exist_ok=True)
+        (project / ".ai-ethics.yaml").write_text(config)
+
+        for name in rng.sample(sorted(manifests), rng.randrange(1, len(manifests) + 1)):
+            (project / name).write_text(manifests[name])
+
+        for f in range(files):
+            if f % 4 == 0:
+                (project / "docs" / f"DOC_{rng.randrange(50)}.md").write_text("# Doc\n")
+            else:
+                module = project / "src" / f"pkg_{f % 8}" / f"mod_{f}.py"
+                module.parent.mkdir(parents=True, exist_ok=True)
+                module.write_text(f"import shap\n\n\ndef f_{f}():\n    return {f}\n")
+
+        project_paths.append(project)
+
+    return project_paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("root", type=Path)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--manifest-size", type=int, default=50)
+    parser.add_argument("--checks", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    registry = generate_framework(args.root / "frameworks", args.checks, args.seed)
+    generate_monorepo(args.root, args.projects, args.files, args.manifest_size, args.seed)
+    print(f"Wrote {args.projects} projects under {args.root}; registry at {registry}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# ABOUTME: Benchmark runner measuring registry, engine, parser and CLI performance
+# ABOUTME: Writes machine-readable JSON results and compares them against a baseline
+
+"""
+Run the benchmark suite.
+
+Generates a synthetic monorepo, times each benchmark and writes a JSON
+results file tagged with the current commit. Pass --compare to diff against
+a previous results file; the exit status is non-zero if anything regressed
+beyond --threshold.
+
+Usage:
+    python -m benchmarks.run --output benchmarks/results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.run --compare benchmarks/results/<baseline>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from benchmarks.generate import FRAMEWORK_ID, generate_framework, generate_monorepo
+from benchmarks.generate import manifest_contents
+
+REPO_ROOT = Path(__file__).parent.parent
+
+Benchmark = Callable[[], Any]
+
+
+def measure(fn: Benchmark, repeat: int, number: int = 1) -> dict[str, Any]:
+    """
+    Time a benchmark.
+
+    Args:
+        fn: Zero-argument callable to time
+        repeat: Number of samples
+        number: Calls per sample
+
+    Returns:
+        Per-call seconds as min, median and mean, plus the sample count
+    """
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number)
+
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _benchmarks(root: Path, projects: list[Path], manifest_size: int) -> dict[str, Benchmark]:
+    """Build the named benchmarks over a generated tree"""
+    from ethica.checks import manifests
+    from ethica.core import spec_cache
+    from ethica.core.checker import CheckEngine
+    from ethica.core.fleet import run_fleet
+    from ethica.core.registry import FrameworkRegistry
+
+    registry_path = root / "frameworks" / "registry.yaml"
+    registry = FrameworkRegistry(registry_path)
+    spec = registry.load_framework_spec(FRAMEWORK_ID)
+    engine = CheckEngine(spec)
+    contents = manifest_contents(manifest_size)
+
+    def load_spec_uncached() -> None:
+        # Drop the in-process memo so the on-disk spec cache is exercised
+        spec_cache._memory.clear()
+        FrameworkRegistry(registry_path).load_framework_spec(FRAMEWORK_ID)
+
+    env = dict(
+        os.environ,
+        ETHICA_CONFIG_DIR=str(root),
+        ETHICA_CACHE_DIR=str(root / ".cache"),
+        PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])),
+    )
+
+    def cli(*args: str, report: bool = False) -> Benchmark:
+        command = [sys.executable, "-m", "ethica", *args]
+
+        def run_command() -> subprocess.CompletedProcess[bytes]:
+            completed = subprocess.run(command, cwd=projects[0], env=env, capture_output=True)
+            # Timing an error path would be meaningless. Checks that fail exit
+            # 1 too, so commands that write a report must have written one.
+            if report:
+                try:
+                    json.loads(completed.stdout)
+                    ok = completed.returncode in (0, 1)
+                except ValueError:
+                    ok = False
+            else:
+                ok = completed.returncode == 0
+            if not ok:
+                raise RuntimeError(
+                    f"ethica {' '.join(args)} exited {completed.returncode}: "
+                    f"{(completed.stderr or completed.stdout).decode(errors='replace')[-500:]}"
+                )
+            return completed
+
+        return run_command
+
+    return {
+        "registry.init": lambda: FrameworkRegistry(registry_path),
+        "registry.load_framework_spec": load_spec_uncached,
+        "engine.load_checks": engine._load_checks,
+        "engine.run_checks": lambda: engine.run_checks(projects[0]),
+        "fleet.run_fleet": lambda: run_fleet(
+            root, framework=FRAMEWORK_ID, registry=registry, keep_checks=False
+        ),
+        "parser.requirements": lambda: manifests.parse_requirements(contents["requirements.txt"]),
+        "parser.pyproject": lambda: manifests.parse_pyproject_toml(contents["pyproject.toml"]),
+        "parser.setup_py": lambda: manifests.parse_setup_py(contents["setup.py"]),
+        "parser.poetry_lock": lambda: list(
+            manifests.parse_toml_lock(contents["poetry.lock"].splitlines(True))
+        ),
+        "parser.pipfile_lock": lambda: list(
+            manifests.parse_pipfile_lock([contents["Pipfile.lock"]])
+        ),
+        "cli.version": cli("version"),
+        "cli.check": cli("check", "--output", "json", "--no-cache", report=True),
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Generate the tree and run every selected benchmark"""
+    with tempfile.TemporaryDirectory(prefix="ethica-bench-") as tmp:
+        root = Path(tmp)
+        generate_framework(root / "frameworks", args.checks, args.seed)
+        projects = generate_monorepo(
+            root, args.projects, args.files, args.manifest_size, args.seed
+        )
+
+        results = {}
+        for name, fn in _benchmarks(root, projects, args.manifest_size).items():
+            if args.filter and args.filter not in name:
+                continue
+            fn()  # warm up
+            number = 1 if name.startswith(("cli.", "fleet.")) else args.number
+            results[name] = measure(fn, args.repeat, number)
+            print(f"{name:32} {results[name]['min'] * 1000:10.3f} ms", file=sys.stderr)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "params": {
+                "projects": args.projects,
+                "files": args.files,
+                "manifest_size": args.manifest_size,
+                "checks": args.checks,
+                "seed": args.seed,
+            },
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Compare two result files on per-call minimum time.
+
+    Args:
+        baseline: Earlier results
+        current: New results
+        threshold: Ratio above which a benchmark counts as regressed
+
+    Returns:
+        Names of regressed benchmarks
+    """
+    if baseline["meta"]["params"] != current["meta"]["params"]:
+        print("warning: benchmark parameters differ from the baseline", file=sys.stderr)
+
+    regressed = []
+    for name, stats in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = stats["min"] / before["min"] if before["min"] > 0 else float("inf")
+        marker = "REGRESSED" if ratio > threshold else ""
+        print(f"{name:32} {ratio:6.2f}x {marker}", file=sys.stderr)
+        if ratio > threshold:
+            regressed.append(name)
+
+    return regressed
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--manifest-size", type=int, default=200)
+    parser.add_argument("--checks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10, help="Calls per sample")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    current = run(args)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+    else:
+        print(json.dumps(current, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(baseline, current, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
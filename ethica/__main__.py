@@ -1,27 +1,76 @@
 # ABOUTME: CLI entry point for ethica command
-# ABOUTME: Sets up typer app and registers all command groups
+# ABOUTME: Sets up typer app and registers command groups that load on first use
 
 """
 Main CLI entry point for ethica.
+
+Command modules pull in rich, yaml and the check engine, so they are only
+imported when the command that needs them runs. This keeps startup fast for
+pre-commit hooks and `ethica version`.
 """
 
+import importlib
+from typing import Any, Optional
+
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
+
+# Command name -> (module, attribute, short help). Attributes are either a
+# command function or a Typer sub-app.
+LAZY_COMMANDS = {
+    "init": ("ethica.cli.init", "init_command", "Initialize ethics compliance in your project"),
+    "check": ("ethica.cli.check", "check_command", "Run ethics compliance checks on your project"),
+    "frameworks": ("ethica.cli.frameworks", "app", "Manage ethics frameworks"),
+    "history": (
+        "ethica.cli.history",
+        "history_command",
+        "Evaluate a framework at every commit of a range and write a time series",
+    ),
+    "serve": (
+        "ethica.cli.serve",
+        "serve_command",
+        "Run a check daemon that keeps frameworks loaded between checks",
+    ),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Command group that imports command modules on demand"""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return list(LAZY_COMMANDS) + super().list_commands(ctx)
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Optional[Any]:
+        if cmd_name not in LAZY_COMMANDS:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, attr, short_help = LAZY_COMMANDS[cmd_name]
+        target = getattr(importlib.import_module(module_name), attr)
+
+        # A group for sub-apps, a plain command otherwise
+        command: Any
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+        else:
+            wrapper = typer.Typer()
+            wrapper.command(name=cmd_name, short_help=short_help)(target)
+            command = typer.main.get_command(wrapper)
+
+        command.name = cmd_name
+        return command
 
-from ethica.cli import init, check, frameworks
 
 app = typer.Typer(
     name="ethica",
+    cls=LazyGroup,
     help="Framework-agnostic platform for AI ethics compliance checking",
     no_args_is_help=True,
 )
 
-console = Console()
 
-# Register command groups
-app.command(name="init")(init.init_command)
-app.command(name="check")(check.check_command)
-app.add_typer(frameworks.app, name="frameworks")
+@app.callback()
+def callback() -> None:
+    """Framework-agnostic platform for AI ethics compliance checking"""
 
 
 @app.command()
@@ -29,7 +78,7 @@ def version() -> None:
     """Show version information"""
     from ethica import __version__
 
-    console.print(f"ethica version {__version__}")
+    typer.echo(f"ethica version {__version__}")
 
 
 def main() -> None:
@@ -10,6 +10,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+from ethica.core.context import ProjectContext
+from ethica.core.metrics import CheckMetrics
+
 
 class CheckSeverity(Enum):
     """Severity level of a check"""
@@ -25,6 +28,8 @@ class CheckStatus(Enum):
     PASSED = "passed"
     FAILED = "failed"
     SKIPPED = "skipped"
+    # Stopped by a time limit before it could finish
+    TIMEOUT = "timeout"
 
 
 class CheckResult:
@@ -38,6 +43,7 @@ class CheckResult:
         message: str,
         severity: CheckSeverity,
         suggestion: Optional[str] = None,
+        metrics: Optional[CheckMetrics] = None,
     ) -> None:
         self.check_id = check_id
         self.name = name
@@ -45,10 +51,12 @@ class CheckResult:
         self.message = message
         self.severity = severity
         self.suggestion = suggestion
+        # Set by the engine when profiling
+        self.metrics = metrics
 
     def to_dict(self) -> dict[str, Any]:
         """Convert result to dictionary"""
-        return {
+        data: dict[str, Any] = {
             "id": self.check_id,
             "name": self.name,
             "status": self.status.value,
@@ -56,11 +64,38 @@ class CheckResult:
             "severity": self.severity.value,
             "suggestion": self.suggestion,
         }
+        if self.metrics is not None:
+            data["metrics"] = self.metrics.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CheckResult":
+        """Rebuild a result from to_dict output"""
+        return cls(
+            check_id=data["id"],
+            name=data["name"],
+            status=CheckStatus(data["status"]),
+            message=data["message"],
+            severity=CheckSeverity(data["severity"]),
+            suggestion=data.get("suggestion"),
+            metrics=CheckMetrics.from_dict(data["metrics"]) if "metrics" in data else None,
+        )
 
 
 class BaseCheck(ABC):
     """Base class for all compliance checks"""
 
+    # CPU-bound checks run in a process pool instead of a thread when the
+    # engine runs checks concurrently
+    cpu_bound = False
+
+    # Relative cost, used to run cheap checks first when a run may stop early
+    cost = 1
+
+    # Whether results may be reused from the result cache while the files
+    # the check probed are unchanged
+    cacheable = True
+
     def __init__(self, check_spec: dict[str, Any]) -> None:
         """
         Initialize check from specification.
@@ -68,6 +103,7 @@ class BaseCheck(ABC):
         Args:
             check_spec: Check specification from framework YAML
         """
+        self.spec = check_spec
         self.check_id = check_spec["id"]
         self.name = check_spec["name"]
         self.principle = check_spec["principle"]
@@ -77,18 +113,47 @@ class BaseCheck(ABC):
         self.help_url = check_spec.get("help_url")
 
     @abstractmethod
-    def run(self, project_path: Path) -> CheckResult:
+    def run(self, project_path: Path, context: Optional[ProjectContext] = None) -> CheckResult:
         """
         Execute the check.
 
         Args:
             project_path: Path to the project directory
+            context: Shared project context for this run. If None, a fresh
+                context is created for this check alone.
 
         Returns:
             CheckResult with status and details
         """
         pass
 
+    @classmethod
+    def prepare(cls, checks: list["BaseCheck"]) -> None:
+        """
+        Set up state shared by every check of this type in a framework.
+
+        Called once by the engine after loading, e.g. to compile the
+        patterns of all checks together. The default does nothing.
+
+        Args:
+            checks: Loaded checks of this type, in framework order
+        """
+
+    def input_globs(self) -> list[str]:
+        """
+        Project paths and globs this check's result depends on.
+
+        Used to skip checks that a set of changed files cannot affect.
+        The default of everything is always safe.
+        """
+        return ["**"]
+
+    def _get_context(
+        self, project_path: Path, context: Optional[ProjectContext]
+    ) -> ProjectContext:
+        """Return the shared context, or a private one if none was given"""
+        return context if context is not None else ProjectContext(project_path)
+
     def _create_result(
         self,
         status: CheckStatus,
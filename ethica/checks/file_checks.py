@@ -5,15 +5,28 @@
 File-based compliance checks.
 """
 
+import re
 from pathlib import Path
+from typing import Any, Optional, Pattern
 
 from ethica.checks.base import BaseCheck, CheckResult, CheckStatus
+from ethica.core.context import ProjectContext
+from ethica.utils.globs import match_any
+
+# Patterns with backreferences can't share a combined regex, whose extra
+# groups would renumber them
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
 
 
 class FileExistsCheck(BaseCheck):
     """Check if specified files or directories exist"""
 
-    def run(self, project_path: Path) -> CheckResult:
+    def input_globs(self) -> list[str]:
+        """The configured paths and anything beneath them"""
+        paths: list[str] = self.config.get("paths", [])
+        return paths + [f"{path.rstrip('/')}/**" for path in paths]
+
+    def run(self, project_path: Path, context: Optional[ProjectContext] = None) -> CheckResult:
         """
         Check if any of the specified paths exist.
 
@@ -28,10 +41,11 @@ class FileExistsCheck(BaseCheck):
                 "No paths configured for check",
             )
 
+        context = self._get_context(project_path, context)
+
         # Check each path
         for path_str in paths:
-            full_path = project_path / path_str
-            if full_path.exists():
+            if context.exists(path_str):
                 return self._create_result(
                     CheckStatus.PASSED,
                     f"Found required file/directory at {path_str}",
@@ -49,3 +63,237 @@ class FileExistsCheck(BaseCheck):
             f"Required file/directory not found. Expected one of: {paths_formatted}",
             suggestion=suggestion,
         )
+
+
+class ContentMatcher:
+    """
+    Patterns from many content checks compiled into one regex.
+
+    Each file is scanned in a single pass however many checks read it, and
+    the scan stops as soon as every pattern that applies to the file has
+    been decided. Patterns with backreferences can't join the combined
+    regex and are searched one by one.
+    """
+
+    def __init__(self, checks: list["FileContentCheck"]) -> None:
+        """
+        Compile the patterns of every check.
+
+        Args:
+            checks: Content checks sharing this matcher
+        """
+        # (check_id, "required" | "forbidden", pattern) per pattern index
+        self.patterns: list[tuple[str, str, str]] = []
+        self.indexes: dict[str, list[int]] = {}
+        self.paths: dict[str, list[str]] = {}
+        self.errors: dict[str, str] = {}
+        self._regexes: list[Pattern[bytes]] = []
+        self._solo: set[int] = set()
+        # Alternative of each pattern in combined regexes, by pattern index
+        self._alternatives: dict[int, str] = {}
+        # Combined regex of each set of undecided patterns seen in a scan
+        self._combined: dict[frozenset[int], Pattern[bytes]] = {}
+
+        for check in checks:
+            flags = re.MULTILINE | (re.IGNORECASE if check.ignore_case else 0)
+            try:
+                compiled = [
+                    (kind, pattern, re.compile(pattern.encode(), flags))
+                    for kind in ("forbidden", "required")
+                    for pattern in check.config.get(kind, [])
+                ]
+            except re.error as e:
+                self.errors[check.check_id] = str(e)
+                continue
+
+            self.paths[check.check_id] = check.paths
+            self.indexes[check.check_id] = []
+            for kind, pattern, regex in compiled:
+                index = len(self.patterns)
+                self.patterns.append((check.check_id, kind, pattern))
+                self.indexes[check.check_id].append(index)
+                self._regexes.append(regex)
+                if _BACKREFERENCE.search(pattern):
+                    self._solo.add(index)
+                else:
+                    inline = "i" if check.ignore_case else ""
+                    self._alternatives[index] = f"(?P<p{index}>(?{inline}:{pattern}))"
+
+        if self._alternatives:
+            try:
+                self._combined_for(frozenset(self._alternatives))
+            except re.error:
+                # e.g. group names repeated across checks; search one by one
+                self._solo.update(range(len(self.patterns)))
+                self._alternatives.clear()
+
+    def _combined_for(self, indexes: frozenset[int]) -> Pattern[bytes]:
+        """One regex matching any of the given patterns, compiled once per set"""
+        combined = self._combined.get(indexes)
+        if combined is None:
+            combined = self._combined[indexes] = re.compile(
+                "|".join(self._alternatives[i] for i in sorted(indexes)).encode(), re.MULTILINE
+            )
+        return combined
+
+    def scan(self, context: ProjectContext, path: str) -> Optional[frozenset[int]]:
+        """
+        Patterns found in a project file, scanned once per context.
+
+        Args:
+            context: Project context
+            path: File relative to the project
+
+        Returns:
+            Indexes of the patterns found, or None if the file can't be read
+        """
+        return context.memoize(f"content:{id(self)}:{path}", lambda c: self._scan(c, path))
+
+    def _scan(self, context: ProjectContext, path: str) -> Optional[frozenset[int]]:
+        pending = {
+            index
+            for check_id, indexes in self.indexes.items()
+            if match_any(path, self.paths[check_id])
+            for index in indexes
+        }
+        found: set[int] = set()
+
+        with context.map_file(path) as data:
+            if data is None:
+                return None
+
+            # Each match decides a pattern, and the next search covers only
+            # the undecided ones, resuming where that match started: no
+            # undecided pattern matched earlier, but one may overlap the
+            # match, so the file is still read front to back only once
+            position = 0
+            combined = frozenset(pending - self._solo)
+            while combined:
+                match = self._combined_for(combined).search(data, position)
+                if match is None:
+                    break
+                self._decide(int(str(match.lastgroup)[1:]), pending, found)
+                position = match.start()
+                combined = frozenset(pending - self._solo)
+
+            for index in sorted(pending & self._solo):
+                if index in pending and self._regexes[index].search(data):
+                    self._decide(index, pending, found)
+
+        return frozenset(found)
+
+    def _decide(self, index: int, pending: set[int], found: set[int]) -> None:
+        """Record a found pattern; a forbidden one settles its whole check"""
+        found.add(index)
+        pending.discard(index)
+        check_id, kind, _ = self.patterns[index]
+        if kind == "forbidden":
+            pending.difference_update(self.indexes[check_id])
+
+
+class FileContentCheck(BaseCheck):
+    """Check that project files contain required patterns and no forbidden ones"""
+
+    # Reads whole files
+    cost = 3
+
+    # Regex scans over file contents hold the GIL
+    cpu_bound = True
+
+    def __init__(self, check_spec: dict[str, Any]) -> None:
+        super().__init__(check_spec)
+        self.paths: list[str] = self.config.get("paths", [])
+        self.ignore_case: bool = self.config.get("ignore_case", False)
+        self.matcher: Optional[ContentMatcher] = None
+
+    @classmethod
+    def prepare(cls, checks: list[BaseCheck]) -> None:
+        """Compile the patterns of all content checks into one shared matcher"""
+        content_checks = [check for check in checks if isinstance(check, FileContentCheck)]
+        matcher = ContentMatcher(content_checks)
+        for check in content_checks:
+            check.matcher = matcher
+
+    def input_globs(self) -> list[str]:
+        """The configured files and globs"""
+        return list(self.paths)
+
+    def run(self, project_path: Path, context: Optional[ProjectContext] = None) -> CheckResult:
+        """
+        Search the configured files for regex patterns.
+
+        Files are memory-mapped and scanned once for the patterns of every
+        content check in the framework.
+
+        Config:
+            paths: Files or globs to scan
+            required: Patterns that must each appear in at least one file
+            forbidden: Patterns that must not appear in any file
+            ignore_case: Match case-insensitively (default: false)
+        """
+        required = self.config.get("required", [])
+        forbidden = self.config.get("forbidden", [])
+
+        if not self.paths or not (required or forbidden):
+            return self._create_result(
+                CheckStatus.SKIPPED,
+                "No paths or patterns configured for check",
+            )
+
+        matcher = self.matcher
+        if matcher is None:
+            matcher = self.matcher = ContentMatcher([self])
+
+        if self.check_id in matcher.errors:
+            return self._create_result(
+                CheckStatus.FAILED,
+                f"Invalid pattern in check config: {matcher.errors[self.check_id]}",
+            )
+
+        context = self._get_context(project_path, context)
+        files = list(
+            dict.fromkeys(path for pattern in self.paths for path in context.glob(pattern))
+        )
+
+        if not files:
+            return self._create_result(
+                CheckStatus.SKIPPED,
+                f"No files found matching: {', '.join(self.paths)}",
+            )
+
+        patterns = matcher.patterns
+        own = matcher.indexes[self.check_id]
+        missing = [index for index in own if patterns[index][1] == "required"]
+
+        for path in files:
+            found = matcher.scan(context, path)
+            if not found:
+                continue
+            for index in own:
+                if index in found and patterns[index][1] == "forbidden":
+                    return self._create_result(
+                        CheckStatus.FAILED,
+                        f"Forbidden pattern '{patterns[index][2]}' found in {path}",
+                        suggestion=self._suggest(f"Remove content matching '{patterns[index][2]}'"),
+                    )
+            missing = [index for index in missing if index not in found]
+            if not missing and not forbidden:
+                break
+
+        if missing:
+            missing_formatted = ", ".join(f"'{patterns[index][2]}'" for index in missing)
+            return self._create_result(
+                CheckStatus.FAILED,
+                f"Required content not found in {', '.join(self.paths)}: {missing_formatted}",
+                suggestion=self._suggest(f"Add content matching {missing_formatted}"),
+            )
+
+        return self._create_result(
+            CheckStatus.PASSED,
+            f"Checked content of {len(files)} file(s)",
+        )
+
+    def _suggest(self, suggestion: str) -> str:
+        if self.help_url:
+            suggestion += f"\nSee: {self.help_url}"
+        return suggestion
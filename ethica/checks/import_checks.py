@@ -0,0 +1,107 @@
+# ABOUTME: Source-based compliance checks for Python imports
+# ABOUTME: Checks that project code actually imports required modules, not just declares them
+
+"""
+Import-usage compliance checks.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from ethica.checks.base import BaseCheck, CheckResult, CheckStatus
+from ethica.checks.imports import NOTEBOOK_GLOB, PYTHON_GLOB, ImportIndex
+from ethica.core.context import ProjectContext
+
+# Locations listed per module before the rest are summarized
+_MAX_LOCATIONS = 3
+
+
+class ImportUsageCheck(BaseCheck):
+    """Check if required modules are imported by the project's code"""
+
+    # Parses every source file on first use
+    cost = 4
+
+    # AST parsing holds the GIL
+    cpu_bound = True
+
+    def input_globs(self) -> list[str]:
+        """Every Python file, plus notebooks when they are scanned"""
+        if self.config.get("notebooks", False):
+            return [PYTHON_GLOB, NOTEBOOK_GLOB]
+        return [PYTHON_GLOB]
+
+    def run(self, project_path: Path, context: Optional[ProjectContext] = None) -> CheckResult:
+        """
+        Check if required modules are imported anywhere in the code.
+
+        Config:
+            modules: Dotted module names to look for; submodules count
+            require_any: If True, at least one module must be imported (default)
+            require_all: If True, all modules must be imported
+            notebooks: Also scan Jupyter notebooks (default: False)
+        """
+        modules = self.config.get("modules", [])
+        require_all = self.config.get("require_all", False)
+        notebooks = self.config.get("notebooks", False)
+
+        if not modules:
+            return self._create_result(
+                CheckStatus.SKIPPED,
+                "No modules configured for check",
+            )
+
+        # Imports are scanned once per project and shared
+        imports = self._get_context(project_path, context).import_index(notebooks)
+
+        found_modules = [module for module in modules if module in imports]
+        found_formatted = "; ".join(
+            f"{module} ({self._locations(imports, module)})" for module in found_modules
+        )
+
+        if require_all:
+            if len(found_modules) == len(modules):
+                return self._create_result(
+                    CheckStatus.PASSED,
+                    f"All required modules imported: {found_formatted}",
+                )
+            missing = [module for module in modules if module not in found_modules]
+            return self._create_result(
+                CheckStatus.FAILED,
+                f"Required modules not imported: {', '.join(missing)}"
+                + self._scan_errors(imports),
+                suggestion=f"Import: {', '.join(missing)}",
+            )
+
+        # require_any (default)
+        if found_modules:
+            return self._create_result(
+                CheckStatus.PASSED,
+                f"Found import(s): {found_formatted}",
+            )
+
+        modules_formatted = ", ".join(modules)
+        return self._create_result(
+            CheckStatus.FAILED,
+            f"No required modules imported in {imports.files} file(s). "
+            f"Expected at least one of: {modules_formatted}" + self._scan_errors(imports),
+            suggestion=f"Import one of: {modules_formatted}",
+        )
+
+    def _locations(self, imports: ImportIndex, module: str) -> str:
+        """Where a module is imported, abbreviated past a few locations"""
+        locations = imports.locations(module)
+        shown = ", ".join(locations[:_MAX_LOCATIONS])
+        if len(locations) > _MAX_LOCATIONS:
+            shown += f", +{len(locations) - _MAX_LOCATIONS} more"
+        return shown
+
+    def _scan_errors(self, imports: ImportIndex) -> str:
+        """Note files that couldn't be parsed, since they may hide imports"""
+        if not imports.errors:
+            return ""
+        paths = sorted(imports.errors)
+        details = "; ".join(f"{path}: {imports.errors[path]}" for path in paths[:_MAX_LOCATIONS])
+        if len(paths) > _MAX_LOCATIONS:
+            details += f"; +{len(paths) - _MAX_LOCATIONS} more"
+        return f" (could not parse {details})"
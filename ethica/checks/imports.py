@@ -0,0 +1,348 @@
+# ABOUTME: Import extraction from Python sources and notebooks, cached per file
+# ABOUTME: Builds the per-project index of which modules the code imports and where
+
+"""
+Source import scanning and the per-project import index.
+
+Imports are read with ast, so nothing is executed. Extraction runs in a
+process pool when many files need parsing, and each file's imports are cached
+on disk by size and mtime, so re-scanning a large tree only parses the files
+that changed.
+"""
+
+import ast
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from ethica.core.context import ProjectContext
+
+PYTHON_GLOB = "**/*.py"
+NOTEBOOK_GLOB = "**/*.ipynb"
+
+# Below this many files to parse, a process pool costs more than it saves
+PARALLEL_MIN_FILES = 256
+
+# Bump when extraction changes so stale per-file caches are ignored
+_CACHE_VERSION = 1
+
+# Files modified this recently may change again within the same mtime tick,
+# so their imports are not cached
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Module -> locations within a file: "12" for a line, "cell3:2" in notebooks
+FileImports = dict[str, list[str]]
+
+# Files scanned through filesystems that identify content, such as git
+# blobs, keyed by content ID, so walking history parses each blob once
+_BY_CONTENT_MAX = 65536
+_by_content: "OrderedDict[tuple[str, bool], tuple[FileImports, Optional[str]]]" = OrderedDict()
+_by_content_lock = threading.Lock()
+
+
+def extract_imports(source: str) -> FileImports:
+    """
+    Absolute imports in Python source, with the lines they are on.
+
+    Covers import and from-import statements plus importlib.import_module()
+    and __import__() with a literal name. Relative imports are skipped.
+
+    Args:
+        source: Python source code
+
+    Returns:
+        Dotted module name -> line numbers as strings
+
+    Raises:
+        SyntaxError: If the source can't be parsed
+    """
+    imports: FileImports = {}
+    tree = ast.parse(source)
+
+    # Import statements only occur in statement bodies, so expressions need
+    # walking only when the source may call a dynamic import
+    dynamic = "import_module" in source or "__import__" in source
+    nodes = ast.walk(tree) if dynamic else _statements(tree)
+
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.setdefault(alias.name, []).append(str(node.lineno))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0 and node.module:
+                imports.setdefault(node.module, []).append(str(node.lineno))
+        elif isinstance(node, ast.Call) and _is_dynamic_import(node):
+            module = node.args[0].value  # type: ignore[attr-defined]
+            imports.setdefault(module, []).append(str(node.lineno))
+
+    return imports
+
+
+def _statements(tree: ast.Module) -> Iterator[ast.AST]:
+    """Every statement in a module, including nested ones, without expressions"""
+    stack: list[ast.AST] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        yield node
+        for field in ("body", "orelse", "finalbody", "handlers", "cases"):
+            stack.extend(getattr(node, field, ()))
+
+
+def _is_dynamic_import(node: ast.Call) -> bool:
+    func = node.func
+    name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+    return (
+        name in ("import_module", "__import__")
+        and bool(node.args)
+        and isinstance(node.args[0], ast.Constant)
+        and isinstance(node.args[0].value, str)
+    )
+
+
+def extract_notebook_imports(source: str) -> FileImports:
+    """
+    Imports in the code cells of a Jupyter notebook.
+
+    IPython magics and shell escapes are blanked out; cells that still don't
+    parse are skipped.
+
+    Args:
+        source: Notebook JSON
+
+    Returns:
+        Dotted module name -> "cell<n>:<line>" locations, cells counted from 1
+
+    Raises:
+        ValueError: If the notebook isn't valid JSON
+    """
+    imports: FileImports = {}
+    cells = json.loads(source).get("cells", [])
+
+    for number, cell in enumerate(cells, 1):
+        if cell.get("cell_type") != "code":
+            continue
+        lines = cell.get("source", [])
+        if isinstance(lines, str):
+            lines = lines.splitlines(True)
+        code = "".join(
+            "\n" if line.lstrip().startswith(("%", "!", "?")) else line for line in lines
+        )
+        try:
+            cell_imports = extract_imports(code)
+        except SyntaxError:
+            continue
+        for module, found in cell_imports.items():
+            imports.setdefault(module, []).extend(f"cell{number}:{line}" for line in found)
+
+    return imports
+
+
+def _extract_file(path: str) -> tuple[FileImports, Optional[str]]:
+    """Read and scan one file; runs in worker processes"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        return {}, str(e)
+    return _extract_source(path, data)
+
+
+def _extract_source(path: str, data: bytes) -> tuple[FileImports, Optional[str]]:
+    """Scan one file's content"""
+    source = data.decode(errors="replace")
+    try:
+        if path.endswith(".ipynb"):
+            return extract_notebook_imports(source), None
+        return extract_imports(source), None
+    except SyntaxError as e:
+        return {}, f"line {e.lineno}: {e.msg}"
+    except ValueError as e:
+        return {}, str(e)
+
+
+class ImportIndex:
+    """Modules imported by a project's code and where each import is"""
+
+    def __init__(self) -> None:
+        # Module -> "path:location" for every import of it
+        self.modules: dict[str, list[str]] = {}
+        # Files that couldn't be scanned, with the reason
+        self.errors: dict[str, str] = {}
+        self.files = 0
+
+    def __contains__(self, module: str) -> bool:
+        return bool(self.locations(module))
+
+    def add_file(self, path: str, imports: FileImports) -> None:
+        """Record the imports found in one file"""
+        self.files += 1
+        for module, found in imports.items():
+            self.modules.setdefault(module, []).extend(f"{path}:{loc}" for loc in found)
+
+    def locations(self, module: str) -> list[str]:
+        """
+        Where a module or any of its submodules is imported.
+
+        Args:
+            module: Dotted module name, e.g. 'shap' or 'sklearn.metrics'
+
+        Returns:
+            "path:location" strings, sorted
+        """
+        prefix = module + "."
+        return sorted(
+            location
+            for name, found in self.modules.items()
+            if name == module or name.startswith(prefix)
+            for location in found
+        )
+
+    @classmethod
+    def build(cls, context: "ProjectContext", notebooks: bool = False) -> "ImportIndex":
+        """
+        Scan every Python file (and optionally notebook) in the project.
+
+        Args:
+            context: Project to index
+            notebooks: Also scan .ipynb files
+
+        Returns:
+            Index of imported modules
+        """
+        index = cls()
+        globs = [PYTHON_GLOB, NOTEBOOK_GLOB] if notebooks else [PYTHON_GLOB]
+
+        for pattern in globs:
+            scanned = context.memoize(f"imports:{pattern}", partial(_scan, pattern=pattern))
+            for path, (imports, error) in scanned.items():
+                index.add_file(path, imports)
+                if error is not None:
+                    index.errors[path] = error
+
+        return index
+
+
+def _scan(
+    context: "ProjectContext", pattern: str
+) -> dict[str, tuple[FileImports, Optional[str]]]:
+    """Imports of every file matching a glob, reusing the on-disk cache"""
+    cache_path = None
+    cached: dict[str, Any] = {}
+    if context.cache_dir is not None:
+        cache_path = context.cache_dir / f"imports-{pattern.rsplit('.', 1)[-1]}.json"
+        cached = _load_cache(cache_path)
+
+    scanned: dict[str, tuple[FileImports, Optional[str]]] = {}
+    signatures: dict[str, tuple[int, int]] = {}
+    stale = []
+
+    for path in context.glob(pattern):
+        st = context.stat(path)
+        if st is None:
+            continue
+        signatures[path] = (st.st_size, st.st_mtime_ns)
+        entry = cached.get(path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            scanned[path] = (entry[2], entry[3])
+        else:
+            stale.append(path)
+            context.count_read(st.st_size)
+
+    if context.fs.is_local:
+        absolute = [str(context.fs.local_path(path)) for path in stale]
+        for path, outcome in zip(stale, _extract_all(absolute)):
+            scanned[path] = outcome
+    else:
+        # Archive members can only be read through the context
+        for path in stale:
+            scanned[path] = _extract_member(context, path)
+
+    if cache_path is not None and (stale or len(cached) != len(scanned)):
+        now = time.time_ns()
+        entries = {
+            path: [size, mtime_ns, *scanned[path]]
+            for path, (size, mtime_ns) in signatures.items()
+            if now - mtime_ns > _RACY_WINDOW_NS
+        }
+        _write_cache(cache_path, entries)
+
+    return scanned
+
+
+def _extract_member(
+    context: "ProjectContext", path: str
+) -> tuple[FileImports, Optional[str]]:
+    """Scan a file read through the context's filesystem, memoized by content ID"""
+    content_id = context.fs.content_id(path)
+    key = (content_id or "", path.endswith(".ipynb"))
+    if content_id is not None:
+        with _by_content_lock:
+            outcome = _by_content.get(key)
+            if outcome is not None:
+                _by_content.move_to_end(key)
+                return outcome
+
+    try:
+        outcome = _extract_source(path, context.fs.read_bytes(path))
+    except OSError as e:
+        return {}, str(e)
+
+    if content_id is not None:
+        with _by_content_lock:
+            _by_content[key] = outcome
+            if len(_by_content) > _BY_CONTENT_MAX:
+                _by_content.popitem(last=False)
+    return outcome
+
+
+def _extract_all(paths: list[str]) -> list[tuple[FileImports, Optional[str]]]:
+    """Scan files, in a process pool when there are enough of them"""
+    # Imported here: the fleet module imports the engine, which imports this module
+    from ethica.core.fleet import available_cpus
+
+    workers = available_cpus()
+    # Fleet and sandbox workers already fill the CPUs, and daemonic ones can't fork a pool
+    nested = multiprocessing.parent_process() is not None
+    if len(paths) >= PARALLEL_MIN_FILES and workers > 1 and not nested:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(paths) // (workers * 4))
+                return list(pool.map(_extract_file, paths, chunksize=chunksize))
+        except (OSError, RuntimeError, AssertionError):
+            # No process support here (e.g. a sandbox or a daemonic process); scan serially
+            pass
+    return [_extract_file(path) for path in paths]
+
+
+def _load_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    return data.get("files", {})  # type: ignore[no-any-return]
+
+
+def _write_cache(path: Path, entries: dict[str, Any]) -> None:
+    """Write via a temp file so concurrent readers never see partial entries"""
+    try:
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Keep the cache out of version control
+            (path.parent / ".gitignore").write_text("*\n")
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps({"version": _CACHE_VERSION, "files": entries}))
+        os.replace(tmp_path, path)
+    except OSError:
+        # A read-only tree just means no caching
+        pass
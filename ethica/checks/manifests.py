@@ -0,0 +1,501 @@
+# ABOUTME: Project manifest parsing shared by dependency-style checks
+# ABOUTME: Indexes dependencies from requirements, pyproject, setup.py, lockfiles and metadata
+
+"""
+Manifest parsing and the per-project dependency index.
+
+pyproject.toml is read with tomllib (tomli before Python 3.11) and setup.py
+with ast, so nothing is executed. Lockfiles can run to tens of megabytes and
+are parsed incrementally from a line or chunk stream in bounded memory.
+"""
+
+import posixpath
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+if TYPE_CHECKING:
+    from ethica.core.context import ProjectContext
+
+# Requirements-style files, relative to the project root. Files they include
+# with -r are followed.
+REQUIREMENTS_FILES = [
+    "requirements.txt",
+    "requirements-dev.txt",
+    "requirements-test.txt",
+    "requirements_dev.txt",
+    "requirements/base.txt",
+    "requirements/dev.txt",
+    "requirements/prod.txt",
+    "requirements/test.txt",
+]
+
+PYPROJECT_FILE = "pyproject.toml"
+SETUP_PY_FILE = "setup.py"
+POETRY_LOCK_FILE = "poetry.lock"
+UV_LOCK_FILE = "uv.lock"
+PIPFILE_LOCK_FILE = "Pipfile.lock"
+PKG_INFO_FILE = "PKG-INFO"
+
+# Core metadata of a wheel, which has no other manifest
+WHEEL_METADATA_GLOB = "*.dist-info/METADATA"
+
+# Every file the manifest index may read, besides -r includes
+MANIFEST_FILES = REQUIREMENTS_FILES + [
+    PYPROJECT_FILE,
+    SETUP_PY_FILE,
+    POETRY_LOCK_FILE,
+    UV_LOCK_FILE,
+    PIPFILE_LOCK_FILE,
+    PKG_INFO_FILE,
+]
+
+# Include chains deeper than this are assumed to be cycles
+_MAX_INCLUDE_DEPTH = 16
+
+# The distribution name at the start of a PEP 508 requirement
+_REQUIREMENT_NAME = re.compile(r"\s*([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)")
+
+_EGG_FRAGMENT = re.compile(r"#egg=([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+# `name = "..."` directly inside a [[package]] table of poetry.lock / uv.lock
+_LOCK_PACKAGE_NAME = re.compile(r'^name\s*=\s*"([^"]+)"\s*$')
+
+# Pipfile.lock sections listing packages
+_PIPFILE_SECTIONS = ("default", "develop")
+
+# JSON strings and structural characters; group 1 is the closing quote, which
+# is missing when a string runs past the end of a chunk
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*(")?(?:\\\Z)?|[{}\[\]:,]')
+
+
+class ManifestError(ValueError):
+    """A manifest could not be parsed"""
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a package name per PEP 503"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def requirement_name(requirement: str) -> Optional[str]:
+    """
+    Distribution name of a PEP 508 requirement string.
+
+    Extras, version specifiers, markers and URLs are ignored, so
+    'pkg[extra]>=1; python_version < "3.10"' and 'pkg @ https://...' both
+    give 'pkg'.
+
+    Args:
+        requirement: Requirement string
+
+    Returns:
+        The name, or None if the string doesn't start with one
+    """
+    match = _REQUIREMENT_NAME.match(requirement)
+    return match.group(1) if match else None
+
+
+class ManifestIndex:
+    """Declared dependencies of a project and the file each was found in"""
+
+    def __init__(self) -> None:
+        self.sources: dict[str, str] = {}
+        # Manifests that exist but couldn't be parsed, with the reason
+        self.errors: dict[str, str] = {}
+
+    def __contains__(self, package: str) -> bool:
+        return normalize_name(package) in self.sources
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def add(self, package: str, source: str) -> None:
+        """Record a package, keeping the first file it was declared in"""
+        self.sources.setdefault(normalize_name(package), source)
+
+    def source(self, package: str) -> Optional[str]:
+        """File a package was declared in, or None if not declared"""
+        return self.sources.get(normalize_name(package))
+
+    @classmethod
+    def build(cls, context: "ProjectContext") -> "ManifestIndex":
+        """
+        Parse every manifest in the project once.
+
+        Args:
+            context: Project to index
+
+        Returns:
+            Index of normalized package names
+        """
+        index = cls()
+
+        for req_file in REQUIREMENTS_FILES:
+            index._add_requirements(context, req_file, set(), 0)
+
+        index._add_parsed(
+            context,
+            PYPROJECT_FILE,
+            lambda: parse_pyproject_toml(context.read_text(PYPROJECT_FILE)),
+        )
+        index._add_parsed(
+            context, SETUP_PY_FILE, lambda: parse_setup_py(context.read_text(SETUP_PY_FILE))
+        )
+        for lock_file in (POETRY_LOCK_FILE, UV_LOCK_FILE):
+
+            def parse_lock(f: str = lock_file) -> Iterable[str]:
+                return parse_toml_lock(context.iter_lines(f))
+
+            index._add_parsed(context, lock_file, parse_lock)
+        index._add_parsed(
+            context,
+            PIPFILE_LOCK_FILE,
+            lambda: parse_pipfile_lock(context.iter_chunks(PIPFILE_LOCK_FILE)),
+        )
+        index._add_parsed(
+            context, PKG_INFO_FILE, lambda: parse_core_metadata(context.iter_lines(PKG_INFO_FILE))
+        )
+        if context.fs.is_build_artifact:
+            # Only built wheels carry .dist-info; source trees aren't listed
+            for metadata in context.glob(WHEEL_METADATA_GLOB):
+
+                def parse_metadata(f: str = metadata) -> Iterable[str]:
+                    return parse_core_metadata(context.iter_lines(f))
+
+                index._add_parsed(context, metadata, parse_metadata)
+
+        return index
+
+    def _add_parsed(
+        self, context: "ProjectContext", path: str, parse: Callable[[], Iterable[str]]
+    ) -> None:
+        """Add packages from one manifest, recording parse errors"""
+        if not context.exists(path):
+            return
+        try:
+            for package in parse():
+                self.add(package, path)
+        except ManifestError as e:
+            self.errors[path] = str(e)
+
+    def _add_requirements(
+        self, context: "ProjectContext", path: str, seen: set[str], depth: int
+    ) -> None:
+        """Add packages from a requirements file and the files it includes"""
+        if path in seen or depth > _MAX_INCLUDE_DEPTH or not context.exists(path):
+            return
+        seen.add(path)
+
+        includes: list[str] = []
+        for package in parse_requirements(context.iter_lines(path), includes):
+            self.add(package, path)
+
+        for include in includes:
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(path), include))
+            if target.startswith("../") or posixpath.isabs(target):
+                # Only project files are tracked
+                continue
+            self._add_requirements(context, target, seen, depth + 1)
+
+
+def _logical_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Join backslash continuations and drop comments and blank lines"""
+    pending = ""
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line.endswith("\\"):
+            pending += line[:-1] + " "
+            continue
+        line = pending + line
+        pending = ""
+
+        # Comments start at line start or after whitespace (URLs keep '#egg=')
+        line = re.sub(r"(^|\s)#.*$", "", line).strip()
+        if line:
+            yield line
+
+    if pending.strip():
+        yield pending.strip()
+
+
+def parse_requirements(
+    source: Union[str, Iterable[str]], includes: Optional[list[str]] = None
+) -> list[str]:
+    """
+    Parse requirements.txt style content.
+
+    Handles version pins, hashes, extras, markers, continuation lines and
+    editable or URL requirements with an #egg= fragment.
+
+    Args:
+        source: File content, or an iterable of its lines
+        includes: If given, filled with paths named by -r/--requirement
+
+    Returns:
+        Declared package names
+    """
+    lines = source.splitlines() if isinstance(source, str) else source
+    dependencies = []
+
+    for line in _logical_lines(lines):
+        if line.startswith("-"):
+            option, _, value = line.partition(" ")
+            if "=" in option and not value:
+                option, _, value = option.partition("=")
+            value = value.strip()
+
+            if option in ("-r", "--requirement"):
+                if includes is not None and value:
+                    includes.append(value)
+            elif option in ("-e", "--editable"):
+                egg = _EGG_FRAGMENT.search(value)
+                if egg:
+                    dependencies.append(egg.group(1))
+            # Other options (-c, -i, --hash, ...) declare nothing
+            continue
+
+        if "://" in line.split("@")[0]:
+            # Bare URL requirement
+            egg = _EGG_FRAGMENT.search(line)
+            if egg:
+                dependencies.append(egg.group(1))
+            continue
+
+        name = requirement_name(line)
+        if name:
+            dependencies.append(name)
+
+    return dependencies
+
+
+def parse_pyproject_toml(content: str) -> list[str]:
+    """
+    Parse pyproject.toml content for dependencies.
+
+    Reads PEP 621 dependencies and optional-dependencies, PEP 735
+    dependency-groups, and Poetry dependency tables (including groups).
+
+    Args:
+        content: File content
+
+    Returns:
+        Declared package names
+
+    Raises:
+        ManifestError: If the file isn't valid TOML
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
+    try:
+        data = tomllib.loads(content)
+    except tomllib.TOMLDecodeError as e:
+        raise ManifestError(f"invalid TOML: {e}") from e
+
+    requirements: list[Any] = []
+    project = data.get("project", {})
+    requirements.extend(project.get("dependencies", []))
+    for group in project.get("optional-dependencies", {}).values():
+        requirements.extend(group)
+    for group in data.get("dependency-groups", {}).values():
+        # {include-group = "..."} entries refer to other groups
+        requirements.extend(r for r in group if isinstance(r, str))
+
+    dependencies = [name for name in map(_name_of, requirements) if name]
+
+    poetry = data.get("tool", {}).get("poetry", {})
+    tables = [poetry.get("dependencies", {}), poetry.get("dev-dependencies", {})]
+    tables.extend(g.get("dependencies", {}) for g in poetry.get("group", {}).values())
+    for table in tables:
+        dependencies.extend(name for name in table if name.lower() != "python")
+
+    return dependencies
+
+
+def _name_of(requirement: Any) -> Optional[str]:
+    return requirement_name(requirement) if isinstance(requirement, str) else None
+
+
+def parse_setup_py(content: str) -> list[str]:
+    """
+    Parse setup.py content for dependencies without running it.
+
+    Reads install_requires and extras_require from the setup() call.
+    Values may be literals or module-level names assigned a literal.
+
+    Args:
+        content: File content
+
+    Returns:
+        Declared package names
+
+    Raises:
+        ManifestError: If the file isn't valid Python
+    """
+    import ast
+
+    try:
+        tree = ast.parse(content)
+    except SyntaxError as e:
+        raise ManifestError(f"invalid Python: {e.msg} (line {e.lineno})") from e
+
+    # Module-level NAME = <literal> assignments, for install_requires=NAME
+    assignments: dict[str, ast.expr] = {}
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign):
+            for target in statement.targets:
+                if isinstance(target, ast.Name):
+                    assignments[target.id] = statement.value
+
+    def literal(node: ast.expr) -> Any:
+        if isinstance(node, ast.Name) and node.id in assignments:
+            node = assignments[node.id]
+        try:
+            return ast.literal_eval(node)
+        except ValueError:
+            return None
+
+    requirements: list[Any] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        func_name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if func_name != "setup":
+            continue
+
+        for keyword in node.keywords:
+            value = literal(keyword.value) if keyword.arg else None
+            if keyword.arg == "install_requires":
+                requirements.extend(_requirement_list(value))
+            elif keyword.arg == "extras_require" and isinstance(value, dict):
+                for group in value.values():
+                    requirements.extend(_requirement_list(group))
+
+    return [name for name in map(_name_of, requirements) if name]
+
+
+def _requirement_list(value: Any) -> list[Any]:
+    """setuptools accepts a list of requirements or a newline-separated string"""
+    if isinstance(value, str):
+        return [line for line in value.splitlines() if line.strip()]
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return []
+
+
+def parse_toml_lock(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Stream package names from poetry.lock or uv.lock.
+
+    Both list packages as [[package]] tables whose first key is name, so the
+    file is scanned line by line instead of being loaded whole.
+
+    Args:
+        lines: Lines of the lockfile
+
+    Yields:
+        Locked package names
+    """
+    in_package = False
+
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            in_package = line == "[[package]]"
+            continue
+        if in_package:
+            match = _LOCK_PACKAGE_NAME.match(line)
+            if match:
+                yield match.group(1)
+                in_package = False
+
+
+def parse_pipfile_lock(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Stream package names from Pipfile.lock.
+
+    Packages are the keys of the top-level "default" and "develop" objects.
+    The text is tokenized chunk by chunk, carrying over only a string cut off
+    at a chunk boundary, so memory stays bounded however large the file is.
+
+    Args:
+        chunks: The lockfile text in pieces
+
+    Yields:
+        Locked package names
+
+    Raises:
+        ManifestError: If the JSON structure is broken
+    """
+    # Containers by depth: True for objects
+    is_object: list[bool] = []
+    section: Optional[str] = None
+    # Whether the next string is an object key, and the last key seen
+    expect_key = False
+    key: Optional[str] = None
+    pending = ""
+
+    for chunk in chunks:
+        text = pending + chunk
+        pending = ""
+
+        for match in _JSON_TOKEN.finditer(text):
+            token = match.group()
+
+            if token[0] == '"':
+                if match.group(1) is None:
+                    # Cut off by the chunk boundary
+                    pending = text[match.start():]
+                    break
+                key = token[1:-1] if expect_key else None
+            elif token == ":":
+                if key is not None:
+                    if len(is_object) == 1:
+                        section = key
+                    elif len(is_object) == 2 and section in _PIPFILE_SECTIONS:
+                        yield key
+                key = None
+                expect_key = False
+            elif token in "{[":
+                is_object.append(token == "{")
+                expect_key = token == "{"
+            elif token in "}]":
+                if not is_object or is_object.pop() != (token == "}"):
+                    raise ManifestError("invalid JSON: mismatched brackets")
+                expect_key = False
+            else:  # ","
+                expect_key = bool(is_object) and is_object[-1]
+
+    if is_object or pending:
+        raise ManifestError("invalid JSON: unexpected end of file")
+
+
+def parse_core_metadata(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Stream dependency names from package core metadata.
+
+    Dependencies are the Requires-Dist headers of an sdist's PKG-INFO or a
+    wheel's .dist-info/METADATA. Only the header block before the first blank
+    line is read; the long description after it is skipped.
+
+    Args:
+        lines: The metadata file's lines
+
+    Yields:
+        Required package names
+    """
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line:
+            return
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "requires-dist":
+            match = _REQUIREMENT_NAME.match(value)
+            if match:
+                yield match.group(1)
@@ -5,19 +5,40 @@
 Run ethics compliance checks on a project.
 """
 
+import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
-import yaml
 from rich.console import Console
 from rich.table import Table
 
+from ethica.checks.base import BaseCheck, CheckResult
+from ethica.core.cache import ResultCache
 from ethica.core.checker import CheckEngine
+from ethica.core.config import with_custom_checks
+from ethica.core.fleet import run_fleet
+from ethica.core.gitfs import GitTreeFileSystem
+from ethica.core.framework_set import FrameworkSet
+from ethica.core.metrics import profile_report
+from ethica.core.planning import CheckPlan, ComplianceLevel
 from ethica.core.registry import FrameworkRegistry
+from ethica.core.sandbox import DEFAULT_CHECK_MEMORY_MB, DEFAULT_CHECK_TIMEOUT, SandboxLimits
+from ethica.core.selection import changed_files, run_changed
+from ethica.core.server import send_request
+from ethica.core.spec_cache import safe_load
+from ethica.core.vfs import FileSystem, open_filesystem
+from ethica.core.watch import WatchSession, create_watcher
+from ethica.reporting.ndjson import NDJSONWriter
+from ethica.reporting.writers import REPORT_FORMATS, write_report, write_reports
 
 console = Console()
 
+# Seconds to wait for the daemon to accept a request, and then for its response
+DAEMON_CONNECT_TIMEOUT = 2.0
+DAEMON_TIMEOUT = 600.0
+
 
 def check_command(
     framework: Optional[str] = typer.Option(
@@ -36,7 +57,7 @@ def check_command(
         "text",
         "--output",
         "-o",
-        help="Output format (text, json)",
+        help="Output format (text, json, ndjson, sarif, junit)",
     ),
     verbose: bool = typer.Option(
         False,
@@ -44,9 +65,146 @@ def check_command(
         "-v",
         help="Show detailed output",
     ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Check every project with a .ai-ethics.yaml under --root",
+    ),
+    root: Path = typer.Option(
+        Path("."),
+        "--root",
+        help="Root directory to search in recursive mode",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        help="Worker processes for recursive mode (default: available CPUs)",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of checks to run concurrently within a project",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore and don't update cached results in .ethica-cache/",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        "-w",
+        help="Keep running and re-check as project files change",
+    ),
+    daemon: bool = typer.Option(
+        False,
+        "--daemon",
+        help="Forward to a running 'ethica serve' daemon, if there is one",
+    ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help="Only re-run checks affected by files changed since this git ref",
+    ),
+    staged: bool = typer.Option(
+        False,
+        "--staged",
+        help="Only re-run checks affected by staged files (for pre-commit hooks)",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-check timing and I/O and report the slowest checks",
+    ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help="Stop as soon as the compliance level can no longer be reached",
+    ),
+    check_timeout: float = typer.Option(
+        DEFAULT_CHECK_TIMEOUT,
+        "--check-timeout",
+        help="Seconds each plugin check may run before it times out",
+    ),
+    check_memory: int = typer.Option(
+        DEFAULT_CHECK_MEMORY_MB,
+        "--check-memory",
+        help="Memory in MB each plugin check may allocate",
+    ),
+    deadline: Optional[float] = typer.Option(
+        None,
+        "--deadline",
+        help="Seconds for the whole run; checks not finished by then time out",
+    ),
+    target: Optional[Path] = typer.Option(
+        None,
+        "--target",
+        help="Check this directory or wheel, sdist, zip or tar archive instead of the current "
+        "directory (archives are read without extracting them)",
+    ),
+    rev: Optional[str] = typer.Option(
+        None,
+        "--rev",
+        help="Check a git commit, tag or branch straight from the object store, without a "
+        "checkout",
+    ),
 ) -> None:
     """Run ethics compliance checks on your project"""
 
+    if output not in ("text", "ndjson", *REPORT_FORMATS):
+        console.print(f"[red]Error:[/red] Unknown output format: {output}")
+        raise typer.Exit(1)
+
+    if recursive and profile:
+        console.print("[red]Error:[/red] --profile isn't supported with --recursive")
+        raise typer.Exit(1)
+
+    if fail_fast and (recursive or watch or changed_since or staged):
+        console.print(
+            "[red]Error:[/red] --fail-fast isn't supported with "
+            "--recursive, --watch, --changed-since or --staged"
+        )
+        raise typer.Exit(1)
+
+    if target is not None:
+        if recursive or watch or changed_since or staged:
+            console.print(
+                "[red]Error:[/red] --target isn't supported with "
+                "--recursive, --watch, --changed-since or --staged"
+            )
+            raise typer.Exit(1)
+        try:
+            open_filesystem(target).close()
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from None
+        # The result cache fingerprints files on disk, not archive members
+        no_cache = True
+
+    fs: Optional[FileSystem] = None
+    if rev is not None:
+        if target is not None or recursive or watch or changed_since or staged:
+            console.print(
+                "[red]Error:[/red] --rev isn't supported with "
+                "--target, --recursive, --watch, --changed-since or --staged"
+            )
+            raise typer.Exit(1)
+        try:
+            fs = GitTreeFileSystem(Path.cwd(), rev)
+        except RuntimeError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from None
+        no_cache = True
+
+    project_path = target if target is not None else Path.cwd()
+    limits = SandboxLimits(check_timeout, check_memory, deadline)
+
+    if recursive:
+        _check_fleet(root, framework, level, output, verbose, workers, not no_cache)
+        return
+
     # Load project configuration
     config_path = Path(".ai-ethics.yaml")
     if not config_path.exists():
@@ -57,91 +215,666 @@ def check_command(
         raise typer.Exit(1)
 
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = safe_load(f)
+
+    enabled = [entry for entry in config["frameworks"] if entry.get("enabled", True)]
+    if not enabled:
+        console.print("[red]Error:[/red] No enabled frameworks in .ai-ethics.yaml")
+        raise typer.Exit(1)
+
+    if framework is None and len(enabled) > 1:
+        if watch or changed_since or staged:
+            console.print(
+                "[red]Error:[/red] --watch, --changed-since and --staged check a single "
+                "framework; pass --framework to choose one"
+            )
+            raise typer.Exit(1)
+        _check_frameworks(
+            project_path,
+            enabled,
+            config,
+            level,
+            output,
+            verbose,
+            jobs,
+            no_cache,
+            profile,
+            fail_fast,
+            limits,
+            fs,
+        )
+        return
+
+    # The daemon runs framework checks only, with default limits
+    local_only = (
+        watch
+        or profile
+        or fail_fast
+        or deadline is not None
+        or target is not None
+        or fs is not None
+        or config.get("custom_checks")
+    )
+    if daemon and not local_only:
+        response = _check_via_daemon(framework, level, not no_cache, output)
+        if response is not None:
+            _report(
+                response["results"],
+                {"principles": response["principles"]},
+                output,
+                verbose,
+                config=config,
+            )
+            return
 
     # Get framework to check
-    framework_id = framework or config["frameworks"][0]["id"]
-    compliance_level = level or config["frameworks"][0]["compliance_level"]
+    framework_id = framework or enabled[0]["id"]
+    compliance_level = level or enabled[0].get("compliance_level", "standard")
 
     # Load framework and run checks
     registry = FrameworkRegistry()
-    framework_spec = registry.load_framework_spec(framework_id)
+    framework_spec = _load_framework(registry, framework_id, config)
+
+    # Frameworks without compliance levels run every check
+    compliance = None
+    if "compliance_levels" in framework_spec:
+        try:
+            compliance = ComplianceLevel.from_framework(framework_spec, compliance_level)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from None
 
-    console.print(f"\nChecking against [cyan]{framework_id}[/cyan] ({compliance_level} level)...\n")
+    if output == "text":
+        at = f" at [cyan]{rev}[/cyan]" if rev is not None else ""
+        console.print(
+            f"\nChecking{at} against [cyan]{framework_id}[/cyan] ({compliance_level} level)...\n"
+        )
 
     # Run checks
-    engine = CheckEngine(framework_spec)
-    results = engine.run_checks(Path.cwd())
+    engine = CheckEngine(framework_spec, jobs=jobs, profile=profile, limits=limits)
+
+    if watch:
+        if output != "text":
+            console.print("[red]Error:[/red] --watch only supports text output")
+            raise typer.Exit(1)
+        cache = None if no_cache else ResultCache(Path.cwd())
+        _watch(engine, framework_spec, verbose, cache, compliance)
+        return
+
+    if changed_since or staged:
+        _check_changed(
+            engine,
+            framework_spec,
+            output,
+            verbose,
+            changed_since,
+            staged,
+            no_cache,
+            config,
+            compliance,
+        )
+        return
+
+    # Stream each result as soon as its check finishes
+    writer = NDJSONWriter(sys.stdout) if output == "ndjson" else None
+
+    def on_result(check: BaseCheck, result: CheckResult) -> None:
+        if writer is not None:
+            writer.check(framework_id, check, result)
+
+    cache = None if no_cache else ResultCache(Path.cwd())
+    try:
+        if compliance is None:
+            results = engine.run_checks(project_path, cache=cache, on_result=on_result, fs=fs)
+        else:
+            results = CheckPlan(engine, compliance).run(
+                project_path, cache=cache, on_result=on_result, fail_fast=fail_fast, fs=fs
+            )
+    finally:
+        if cache is not None:
+            cache.close()
+        if fs is not None:
+            fs.close()
+
+    _report(
+        results,
+        framework_spec,
+        output,
+        verbose,
+        streamed=writer is not None,
+        profile=profile,
+        config=config,
+    )
+
+
+def _load_framework(
+    registry: FrameworkRegistry, framework_id: str, config: dict[str, Any]
+) -> dict[str, Any]:
+    """Load a framework spec with the project's custom checks added"""
+
+    try:
+        return with_custom_checks(registry.load_framework_spec(framework_id), config)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+
+def _check_frameworks(
+    project_path: Path,
+    entries: list[dict[str, Any]],
+    config: dict[str, Any],
+    level: Optional[str],
+    output: str,
+    verbose: bool,
+    jobs: int,
+    no_cache: bool,
+    profile: bool,
+    fail_fast: bool,
+    limits: SandboxLimits,
+    fs: Optional[FileSystem],
+) -> None:
+    """Check every enabled framework in one pass and display a merged report"""
+
+    registry = FrameworkRegistry()
+    specs: dict[str, dict[str, Any]] = {}
+    levels: dict[str, str] = {}
+    frameworks = []
+
+    for entry in entries:
+        framework_id = entry["id"]
+        if framework_id in specs:
+            continue
+        spec = _load_framework(registry, framework_id, config)
+        specs[framework_id] = spec
+        levels[framework_id] = level or entry.get("compliance_level", "standard")
+
+        compliance = None
+        if "compliance_levels" in spec:
+            try:
+                compliance = ComplianceLevel.from_framework(spec, levels[framework_id])
+            except ValueError as e:
+                console.print(f"[red]Error:[/red] {e}")
+                raise typer.Exit(1) from None
+        frameworks.append((spec, compliance))
+
+    if output == "text":
+        targets = ", ".join(
+            f"[cyan]{framework_id}[/cyan] ({levels[framework_id]} level)"
+            for framework_id in specs
+        )
+        console.print(f"\nChecking against {targets}...\n")
+
+    writer = NDJSONWriter(sys.stdout) if output == "ndjson" else None
+
+    def on_result(framework_id: str, check: BaseCheck, result: CheckResult) -> None:
+        if writer is not None:
+            writer.check(framework_id, check, result)
+
+    framework_set = FrameworkSet(frameworks, jobs=jobs, profile=profile, limits=limits)
+    cache = None if no_cache else ResultCache(Path.cwd())
+    try:
+        results = framework_set.run(
+            project_path, cache=cache, on_result=on_result, fail_fast=fail_fast, fs=fs
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+        if fs is not None:
+            fs.close()
+
+    if profile:
+        for report in results["frameworks"].values():
+            report["profile"] = profile_report(report)
+
+    if writer is not None:
+        writer.summary(results)
+    elif output in REPORT_FORMATS:
+        write_report(output, results)
+    else:
+        _display_frameworks_text_results(results, specs, levels, verbose, profile)
+    _write_configured_reports(results, config, output)
+
+    reached = all(
+        report.get("compliance", {}).get("reached", True)
+        for report in results["frameworks"].values()
+    )
+    if results["overall_status"] == "failed" or not reached:
+        raise typer.Exit(1)
+
+
+def _display_frameworks_text_results(
+    results: dict[str, Any],
+    specs: dict[str, dict[str, Any]],
+    levels: dict[str, str],
+    verbose: bool,
+    profile: bool,
+) -> None:
+    """Display a multi-framework report with one section per framework"""
+
+    for framework_id, report in results["frameworks"].items():
+        console.rule(f"[bold]{framework_id}[/bold] ({levels[framework_id]} level)")
+        for principle in report["principles"]:
+            _display_principle(principle, specs[framework_id], verbose)
+        _display_summary(report)
+        if profile:
+            _display_profile(report["profile"])
+        console.print()
+
+    color = results["overall_status_color"]
+    console.rule("[bold]All Frameworks[/bold]")
+    console.print(f"Overall Status: [{color}]{results['overall_status']}[/{color}]")
+    console.print(f"Checks Passed: {results['checks_passed']}/{results['total_checks']}")
+    console.print(
+        f"[dim]Ran {results['unique_checks']} distinct check(s); "
+        f"{results['checks_deduplicated']} shared between frameworks[/dim]"
+    )
+
+    if results["overall_status"] != "passed":
+        console.print(f"\n[yellow]Run with --verbose to see all check details[/yellow]")
+
+
+def _check_changed(
+    engine: CheckEngine,
+    framework_spec: dict[str, Any],
+    output: str,
+    verbose: bool,
+    since: Optional[str],
+    staged: bool,
+    no_cache: bool,
+    config: dict[str, Any],
+    compliance: Optional[ComplianceLevel],
+) -> None:
+    """Re-run checks affected by git changes, reusing last results for the rest"""
+
+    try:
+        changed = changed_files(Path.cwd(), since=since, staged=staged)
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    cache = None if no_cache else ResultCache(Path.cwd())
+    try:
+        results, ran = run_changed(engine, Path.cwd(), changed, cache, compliance)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    if output == "text":
+        console.print(
+            f"[dim]{len(changed)} changed file(s); "
+            f"ran {len(ran)} of {results['total_checks']} checks[/dim]\n"
+        )
+    _report(results, framework_spec, output, verbose, profile=engine.profile, config=config)
+
+
+def _check_via_daemon(
+    framework: Optional[str], level: Optional[str], use_cache: bool, output: str
+) -> Optional[dict[str, Any]]:
+    """Run the check on a daemon, or return None if none is running"""
+
+    request = {
+        "command": "check",
+        "project": str(Path.cwd()),
+        "framework": framework,
+        "level": level,
+        "use_cache": use_cache,
+    }
+
+    try:
+        response = send_request(
+            request, timeout=DAEMON_TIMEOUT, connect_timeout=DAEMON_CONNECT_TIMEOUT
+        )
+    except (OSError, ValueError):
+        # Includes socket.timeout: a wedged daemon falls back to a local run
+        return None
+
+    if not response.get("ok"):
+        console.print(f"[red]Error:[/red] {response.get('error')}")
+        raise typer.Exit(1)
+
+    if output == "text":
+        console.print(
+            f"\nChecking against [cyan]{response['framework_id']}[/cyan] "
+            f"({response['compliance_level']} level)...\n"
+        )
+    return response
+
+
+def _report(
+    results: dict[str, Any],
+    framework_spec: dict[str, Any],
+    output: str,
+    verbose: bool,
+    streamed: bool = False,
+    profile: bool = False,
+    config: Optional[dict[str, Any]] = None,
+) -> None:
+    """Display results and exit non-zero if any error-severity check failed"""
+
+    if profile:
+        results["profile"] = profile_report(results)
 
     # Display results
     if output == "text":
         _display_text_results(results, framework_spec, verbose)
-    elif output == "json":
-        _display_json_results(results)
+        if profile:
+            _display_profile(results["profile"])
+    elif output in REPORT_FORMATS:
+        write_report(output, results)
+    elif output == "ndjson":
+        _display_ndjson_results(results, streamed)
     else:
         console.print(f"[red]Error:[/red] Unknown output format: {output}")
         raise typer.Exit(1)
 
-    # Exit with error code if checks failed
-    total_failed = sum(
-        1 for principle in results["principles"]
-        for check in principle["checks"]
-        if check["status"] == "failed" and check["severity"] == "error"
+    if config is not None:
+        _write_configured_reports(results, config, output)
+
+    # Exit with error code if any error-severity check failed or the
+    # compliance level wasn't reached
+    if results["overall_status"] == "failed":
+        raise typer.Exit(1)
+    if not results.get("compliance", {}).get("reached", True):
+        raise typer.Exit(1)
+
+
+def _write_configured_reports(results: dict[str, Any], config: dict[str, Any], output: str) -> None:
+    """Write the report files listed under reporting.formats in .ai-ethics.yaml"""
+
+    reporting = config.get("reporting") or {}
+    formats = reporting.get("formats") or []
+    unknown = [f for f in formats if f not in ("text", *REPORT_FORMATS)]
+    if unknown:
+        console.print(
+            f"[red]Error:[/red] Unknown report format in .ai-ethics.yaml: {', '.join(unknown)}"
+        )
+        raise typer.Exit(1)
+
+    output_dir = Path(reporting.get("output_dir") or "ethics-reports")
+    try:
+        written = write_reports(results, formats, output_dir)
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Couldn't write reports: {e}")
+        raise typer.Exit(1) from None
+
+    if written and output == "text":
+        console.print(f"\nReports written: {', '.join(str(path) for path in written)}")
+
+
+def _check_fleet(
+    root: Path,
+    framework: Optional[str],
+    level: Optional[str],
+    output: str,
+    verbose: bool,
+    workers: Optional[int],
+    use_cache: bool,
+) -> None:
+    """Check every project under root and display a merged report"""
+
+    writer = NDJSONWriter(sys.stdout) if output == "ndjson" else None
+
+    def on_project(entry: dict[str, Any]) -> None:
+        if writer is None:
+            return
+        if "error" in entry:
+            writer.project_error(entry["path"], entry["error"])
+            return
+        for principle in entry["results"]["principles"]:
+            for check in principle["checks"]:
+                writer.check_dict(
+                    entry["framework_id"], principle["id"], check, project=entry["path"]
+                )
+
+    specs: dict[str, dict[str, Any]] = {}
+    fleet = run_fleet(
+        root,
+        framework=framework,
+        level=level,
+        workers=workers,
+        specs=specs,
+        use_cache=use_cache,
+        on_project=on_project,
+        keep_checks=writer is None,
     )
 
-    if total_failed > 0:
+    if fleet["total_projects"] == 0:
+        console.print(f"[red]Error:[/red] No .ai-ethics.yaml found under {root}")
+        raise typer.Exit(1)
+
+    if writer is not None:
+        writer.summary(fleet)
+    elif output in REPORT_FORMATS:
+        write_report(output, fleet)
+    else:
+        _display_fleet_text_results(fleet, specs, verbose)
+
+    if fleet["overall_status"] == "failed":
         raise typer.Exit(1)
 
 
+def _display_fleet_text_results(
+    fleet: dict[str, Any], specs: dict[str, dict[str, Any]], verbose: bool
+) -> None:
+    """Display a merged fleet report with one section per project"""
+
+    for project in fleet["projects"]:
+        console.rule(f"[bold]{project['path']}[/bold]")
+
+        if "error" in project:
+            console.print(f"[red]Error:[/red] {project['error']}\n")
+            continue
+
+        framework_id = project["framework_id"]
+        console.print(
+            f"Checked against [cyan]{framework_id}[/cyan] "
+            f"({project['compliance_level']} level)\n"
+        )
+        _display_text_results(project["results"], specs[framework_id], verbose)
+        console.print()
+
+    color = fleet["overall_status_color"]
+    console.rule("[bold]Fleet Summary[/bold]")
+    console.print(f"Overall Status: [{color}]{fleet['overall_status']}[/{color}]")
+    console.print(f"Projects Passed: {fleet['projects_passed']}/{fleet['total_projects']}")
+    if fleet["projects_failed"]:
+        console.print(f"Projects Failed: {fleet['projects_failed']}")
+    if fleet["projects_errored"]:
+        console.print(f"Projects With Errors: {fleet['projects_errored']}")
+
+
 def _display_text_results(results: dict, framework_spec: dict, verbose: bool) -> None:
     """Display results in text format"""
 
     for principle in results["principles"]:
-        # Get principle details from spec
-        principle_spec = next(
-            (p for p in framework_spec["principles"] if p["id"] == principle["id"]),
-            None
-        )
+        _display_principle(principle, framework_spec, verbose)
 
-        # Principle header
-        status_icon = "✓" if principle["status"] == "passed" else "✗"
-        status_color = "green" if principle["status"] == "passed" else "red"
+    _display_summary(results)
 
-        console.print(
-            f"[bold]{principle_spec['name']}[/bold] "
-            f"[{status_color}]{status_icon}[/{status_color}]"
-        )
-
-        # Show checks
-        for check in principle["checks"]:
-            if check["status"] == "passed":
-                if verbose:
-                    console.print(f"  [green]✓[/green] {check['name']}: {check['message']}")
-            elif check["status"] == "failed":
-                severity_color = "red" if check["severity"] == "error" else "yellow"
-                console.print(
-                    f"  [{severity_color}]✗[/{severity_color}] {check['name']}: {check['message']}"
-                )
-                if check.get("suggestion"):
-                    console.print(f"    [dim]→ {check['suggestion']}[/dim]")
-            elif check["status"] == "skipped":
-                if verbose:
-                    console.print(f"  [dim]○ {check['name']}: {check['message']}[/dim]")
+    if results["overall_status"] != "passed":
+        console.print(f"\n[yellow]Run with --verbose to see all check details[/yellow]")
 
-        console.print()
 
-    # Summary
+def _display_principle(
+    principle: dict[str, Any], framework_spec: dict[str, Any], verbose: bool
+) -> None:
+    """Display one principle section and its checks"""
+
+    # Get principle details from spec
+    principle_spec = next(
+        (p for p in framework_spec["principles"] if p["id"] == principle["id"]),
+        None
+    )
+
+    # Custom checks may use principles the framework doesn't define
+    title = principle_spec["name"] if principle_spec else principle["id"].replace("-", " ").title()
+
+    # Principle header
+    status_icon = "✓" if principle["status"] == "passed" else "✗"
+    status_color = "green" if principle["status"] == "passed" else "red"
+
+    console.print(
+        f"[bold]{title}[/bold] "
+        f"[{status_color}]{status_icon}[/{status_color}]"
+    )
+
+    # Show checks
+    for check in principle["checks"]:
+        if check["status"] == "passed":
+            if verbose:
+                console.print(f"  [green]✓[/green] {check['name']}: {check['message']}")
+        elif check["status"] == "failed":
+            severity_color = "red" if check["severity"] == "error" else "yellow"
+            console.print(
+                f"  [{severity_color}]✗[/{severity_color}] {check['name']}: {check['message']}"
+            )
+            if check.get("suggestion"):
+                console.print(f"    [dim]→ {check['suggestion']}[/dim]")
+        elif check["status"] == "timeout":
+            console.print(f"  [magenta]⧗[/magenta] {check['name']}: {check['message']}")
+        elif check["status"] == "skipped":
+            if verbose:
+                console.print(f"  [dim]○ {check['name']}: {check['message']}[/dim]")
+
+    console.print()
+
+
+def _display_summary(results: dict[str, Any]) -> None:
+    """Display overall status and pass rate"""
+
+    color = results["overall_status_color"]
     console.print(f"\n[bold]Summary:[/bold]")
-    console.print(f"Overall Status: [{results['overall_status_color']}]{results['overall_status']}[/{results['overall_status_color']}]")
+    console.print(f"Overall Status: [{color}]{results['overall_status']}[/{color}]")
     console.print(f"Pass Rate: {results['pass_rate']:.1%}")
     console.print(f"Checks Passed: {results['checks_passed']}/{results['total_checks']}")
+    if results.get("checks_timed_out"):
+        console.print(f"Checks Timed Out: [magenta]{results['checks_timed_out']}[/magenta]")
 
-    if results["overall_status"] != "passed":
-        console.print(f"\n[yellow]Run with --verbose to see all check details[/yellow]")
+    compliance = results.get("compliance")
+    if compliance is None:
+        return
+
+    if compliance["reached"]:
+        console.print(f"Compliance Level: [green]{compliance['name']} reached[/green]")
+    else:
+        console.print(f"Compliance Level: [red]{compliance['name']} not reached[/red]")
+        if compliance["unmet_principles"]:
+            console.print(
+                f"  [dim]→ Failed required checks in: "
+                f"{', '.join(compliance['unmet_principles'])}[/dim]"
+            )
+        if (
+            not compliance["stopped_early"]
+            and compliance["pass_rate"] < compliance["minimum_pass_rate"]
+        ):
+            console.print(
+                f"  [dim]→ Pass rate {compliance['pass_rate']:.1%} is below "
+                f"{compliance['minimum_pass_rate']:.0%}[/dim]"
+            )
+    if compliance["stopped_early"]:
+        console.print(
+            f"[dim]Stopped early: ran {compliance['checks_run']} of "
+            f"{compliance['checks_planned']} checks[/dim]"
+        )
+    if compliance["checks_pruned"]:
+        console.print(
+            f"[dim]{compliance['checks_pruned']} check(s) not needed for this level "
+            f"were skipped[/dim]"
+        )
+
+
+def _display_profile(report: dict[str, Any]) -> None:
+    """Display the slowest checks and principles"""
+
+    checks = Table(title="Slowest Checks", show_header=True)
+    checks.add_column("Check", style="cyan", no_wrap=True)
+    checks.add_column("Principle", no_wrap=True)
+    checks.add_column("Wall (ms)", justify="right")
+    checks.add_column("CPU (ms)", justify="right")
+    checks.add_column("Stats", justify="right")
+    checks.add_column("Bytes Read", justify="right")
+
+    for check in report["checks"]:
+        checks.add_row(
+            check["id"] + (" [dim](cached)[/dim]" if check["cached"] else ""),
+            check["principle"],
+            f"{check['wall_time'] * 1000:.2f}",
+            f"{check['cpu_time'] * 1000:.2f}",
+            str(check["files_stat"]),
+            f"{check['bytes_read']:,}",
+        )
+
+    principles = Table(title="Principles", show_header=True)
+    principles.add_column("Principle", style="cyan")
+    principles.add_column("Wall (ms)", justify="right")
+    principles.add_column("CPU (ms)", justify="right")
+    principles.add_column("Stats", justify="right")
+    principles.add_column("Bytes Read", justify="right")
+
+    for principle in report["principles"]:
+        principles.add_row(
+            principle["id"],
+            f"{principle['wall_time'] * 1000:.2f}",
+            f"{principle['cpu_time'] * 1000:.2f}",
+            str(principle["files_stat"]),
+            f"{principle['bytes_read']:,}",
+        )
+
+    console.print()
+    console.print(checks)
+    console.print(principles)
+
+
+def _watch(
+    engine: CheckEngine,
+    framework_spec: dict[str, Any],
+    verbose: bool,
+    cache: Optional[ResultCache],
+    compliance: Optional[ComplianceLevel],
+) -> None:
+    """Re-run affected checks whenever their input files change"""
+
+    project_path = Path.cwd()
+    session = WatchSession(engine, project_path, cache, compliance)
+    _display_text_results(session.start(), framework_spec, verbose)
+
+    watcher = create_watcher(project_path)
+    console.print("\n[dim]Watching for changes. Press Ctrl+C to stop.[/dim]")
+
+    try:
+        while True:
+            watcher.watch(session.watched_paths())
+            changed = watcher.wait()
+
+            started = time.perf_counter()
+            results, indexes = session.update(changed)
+            if not indexes:
+                continue
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            affected = {engine.checks[i].principle for i in indexes}
+            console.rule(
+                f"[dim]{time.strftime('%H:%M:%S')} {', '.join(sorted(changed))} changed, "
+                f"re-ran {len(indexes)} check(s) in {elapsed_ms:.1f} ms[/dim]"
+            )
+            for principle in results["principles"]:
+                if principle["id"] in affected:
+                    _display_principle(principle, framework_spec, verbose)
+            _display_summary(results)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def _display_ndjson_results(results: dict[str, Any], streamed: bool) -> None:
+    """Write NDJSON lines for any results not already streamed, then the summary"""
 
+    writer = NDJSONWriter(sys.stdout)
 
-def _display_json_results(results: dict) -> None:
-    """Display results in JSON format"""
-    import json
+    if not streamed:
+        for principle in results["principles"]:
+            for check in principle["checks"]:
+                writer.check_dict(results["framework_id"], principle["id"], check)
 
-    console.print(json.dumps(results, indent=2))
+    writer.summary(results)
@@ -5,10 +5,11 @@
 Manage and inspect ethics frameworks.
 """
 
+from typing import Optional
+
 import typer
 from rich.console import Console
 from rich.table import Table
-from rich.panel import Panel
 
 from ethica.core.registry import FrameworkRegistry
 
@@ -17,11 +18,16 @@ console = Console()
 
 
 @app.command("list")
-def list_frameworks() -> None:
+def list_frameworks(
+    tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Only show frameworks with tag"),
+    category: Optional[str] = typer.Option(
+        None, "--category", "-c", help="Only show frameworks in category"
+    ),
+) -> None:
     """List all available frameworks"""
 
     registry = FrameworkRegistry()
-    frameworks = registry.list_frameworks()
+    frameworks = registry.list_frameworks(tag=tag, category=category)
 
     if not frameworks:
         console.print("[yellow]No frameworks found[/yellow]")
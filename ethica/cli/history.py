@@ -0,0 +1,121 @@
+# ABOUTME: Implementation of 'ethica history' command
+# ABOUTME: Evaluates a framework at every commit of a range and writes a time series
+
+"""
+Chart compliance over a project's git history.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from ethica.core.checker import CheckEngine
+from ethica.core.config import load_project_config, with_custom_checks
+from ethica.core.history import ComplianceHistory
+from ethica.core.planning import CheckPlan, ComplianceLevel
+from ethica.core.registry import FrameworkRegistry
+from ethica.reporting.timeseries import TIMESERIES_FORMATS, TimeSeriesWriter
+
+# Progress and errors go to stderr so the time series can be piped
+console = Console(stderr=True)
+
+
+def history_command(
+    revisions: str = typer.Argument(
+        "HEAD",
+        help="Revision range to evaluate, e.g. HEAD or v1.0..main",
+    ),
+    framework: Optional[str] = typer.Option(
+        None,
+        "--framework",
+        "-f",
+        help="Override framework from config",
+    ),
+    level: Optional[str] = typer.Option(
+        None,
+        "--level",
+        "-l",
+        help="Override compliance level from config",
+    ),
+    output: str = typer.Option(
+        "csv",
+        "--output",
+        "-o",
+        help="Output format (csv, ndjson)",
+    ),
+    output_file: Optional[Path] = typer.Option(
+        None,
+        "--output-file",
+        help="Write the time series here instead of to stdout",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of checks to run concurrently within a commit",
+    ),
+) -> None:
+    """Evaluate a framework at every commit of a range and write a time series"""
+
+    if output not in TIMESERIES_FORMATS:
+        console.print(f"[red]Error:[/red] Unknown output format: {output}")
+        raise typer.Exit(1)
+
+    try:
+        config = load_project_config(Path.cwd())
+    except FileNotFoundError:
+        console.print(
+            "[red]Error:[/red] No .ai-ethics.yaml found. "
+            "Run [cyan]ethica init[/cyan] first."
+        )
+        raise typer.Exit(1) from None
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    enabled = [entry for entry in config["frameworks"] if entry.get("enabled", True)]
+    entry = next((e for e in enabled if e["id"] == framework), enabled[0] if enabled else {})
+    framework_id = framework or entry.get("id")
+    if framework_id is None:
+        console.print("[red]Error:[/red] No enabled frameworks in .ai-ethics.yaml")
+        raise typer.Exit(1)
+    compliance_level = level or entry.get("compliance_level", "standard")
+
+    try:
+        framework_spec = with_custom_checks(
+            FrameworkRegistry().load_framework_spec(framework_id), config
+        )
+        compliance = None
+        if "compliance_levels" in framework_spec:
+            compliance = ComplianceLevel.from_framework(framework_spec, compliance_level)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    engine = CheckEngine(framework_spec, jobs=jobs)
+    principles = list(dict.fromkeys(check.principle for check in engine.checks))
+    history = ComplianceHistory(CheckPlan(engine, compliance))
+
+    console.print(
+        f"Evaluating [cyan]{revisions}[/cyan] against [cyan]{framework_id}[/cyan] "
+        f"({compliance_level} level)..."
+    )
+
+    stream = open(output_file, "w", newline="") if output_file is not None else sys.stdout
+    try:
+        writer = TimeSeriesWriter(stream, output, principles)
+        points = history.run(Path.cwd(), revisions, on_point=writer.point)
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+    finally:
+        if output_file is not None:
+            stream.close()
+
+    console.print(
+        f"Evaluated {len(points)} commits: {history.checks_run} checks run, "
+        f"{history.checks_reused} reused"
+    )
@@ -11,7 +11,6 @@ from typing import Optional
 import typer
 import yaml
 from rich.console import Console
-from rich.panel import Panel
 
 console = Console()
 
@@ -0,0 +1,49 @@
+# ABOUTME: Implementation of 'ethica serve' command
+# ABOUTME: Runs the check daemon that 'ethica check --daemon' forwards to
+
+"""
+Run a long-lived check daemon.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from ethica.core.server import CheckServer, EnginePool, default_socket_path
+
+console = Console()
+
+
+def serve_command(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket to listen on (default: $XDG_RUNTIME_DIR/ethica.sock)",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of checks to run concurrently within each request",
+    ),
+) -> None:
+    """Run a check daemon that keeps frameworks loaded between checks"""
+
+    socket_path = socket_path or default_socket_path()
+
+    try:
+        server = CheckServer(socket_path, EnginePool(jobs=jobs))
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    console.print(f"Serving checks on [cyan]{socket_path}[/cyan]. Press Ctrl+C to stop.")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,278 @@
+# ABOUTME: On-disk cache of check results keyed by check spec and input digests
+# ABOUTME: Lets repeat runs on unchanged projects skip re-running checks entirely
+
+"""
+Incremental result cache for compliance checks.
+
+Each entry is keyed by the framework ID and version plus the full check spec,
+and records the exact project paths the check probed together with a
+fingerprint of each. A cached result is reused only while every recorded
+fingerprint still matches. Content digests are memoized by file size and
+mtime, so validating a warm cache only stats files.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional
+
+from ethica import __version__
+from ethica.checks.base import CheckResult
+from ethica.core.context import PROBE_EXISTS, PROBE_LIST, Probe
+from ethica.utils.paths import CACHE_DIRNAME
+
+# Eviction defaults
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+
+# Files modified this recently may change again within the same mtime tick,
+# so their digests are not memoized
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class ResultCache:
+    """Cache of check results for one project"""
+
+    def __init__(
+        self,
+        project_path: Path,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            project_path: Project whose results are cached
+            cache_dir: Cache location (default: <project>/.ethica-cache)
+            max_bytes: Total size of result entries to keep
+            max_age: Seconds after which entries are evicted
+        """
+        self.project_path = Path(project_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.project_path / CACHE_DIRNAME
+        self.results_dir = self.cache_dir / "results"
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._digests: Optional[dict[str, list[Any]]] = None
+        self._digests_dirty = False
+        self._stored = 0
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @staticmethod
+    def check_key(
+        framework_metadata: dict[str, Any],
+        check_spec: dict[str, Any],
+        provider: Optional[str] = None,
+    ) -> str:
+        """
+        Cache key for a check within a framework version and ethica release,
+        so upgrading ethica doesn't reuse results its checks might now decide
+        differently.
+
+        Args:
+            framework_metadata: The framework's metadata block
+            check_spec: Check specification from framework YAML
+            provider: Plugin that implements the check, with its version, so
+                upgrading the plugin doesn't reuse its old results
+
+        Returns:
+            Hex digest identifying the check
+        """
+        identity: dict[str, Any] = {
+            "ethica": __version__,
+            "framework": framework_metadata["id"],
+            "version": framework_metadata["version"],
+            "check": check_spec,
+        }
+        if provider is not None:
+            identity["provider"] = provider
+        payload = json.dumps(identity, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[tuple[CheckResult, set[Probe]]]:
+        """
+        Return the cached result if none of its inputs changed.
+
+        Args:
+            key: Key from check_key
+
+        Returns:
+            Cached CheckResult and the probes it was computed from, or None
+            on a miss
+        """
+        try:
+            entry = json.loads(self._entry_path(key).read_text())
+            probes: set[Probe] = set()
+            for kind, relative_path, fingerprint in entry["inputs"]:
+                if self._fingerprint(kind, relative_path) != fingerprint:
+                    return None
+                probes.add((kind, relative_path))
+            return CheckResult.from_dict(entry["result"]), probes
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def last_result(self, key: str) -> Optional[CheckResult]:
+        """
+        Return the most recent result for a check without validating its inputs.
+
+        Args:
+            key: Key from check_key
+
+        Returns:
+            Last stored CheckResult, or None if there is none
+        """
+        try:
+            entry = json.loads(self._entry_path(key).read_text())
+            return CheckResult.from_dict(entry["result"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, key: str, result: CheckResult, probes: set[Probe]) -> None:
+        """
+        Save a result with fingerprints of the paths the check probed.
+
+        Args:
+            key: Key from check_key
+            result: Result to cache
+            probes: (kind, path) probes recorded while the check ran
+        """
+        # Metrics describe one run, not the result
+        result_dict = result.to_dict()
+        result_dict.pop("metrics", None)
+
+        entry = {
+            "inputs": [
+                [kind, relative_path, self._fingerprint(kind, relative_path)]
+                for kind, relative_path in sorted(probes)
+            ],
+            "result": result_dict,
+        }
+
+        self._write_atomic(self._entry_path(key), json.dumps(entry))
+        with self._lock:
+            self._stored += 1
+
+    def close(self) -> None:
+        """Persist memoized digests and evict old entries if anything was written"""
+        if self._digests_dirty and self._digests is not None:
+            self._write_atomic(self.cache_dir / "digests.json", json.dumps(self._digests))
+            self._digests_dirty = False
+
+        if self._stored:
+            self.prune()
+            self._stored = 0
+
+    def prune(self) -> None:
+        """Evict entries older than max_age, then the oldest until under max_bytes"""
+        try:
+            entries = [
+                (e.stat().st_mtime, e.stat().st_size, e.path)
+                for e in os.scandir(self.results_dir)
+                if e.name.endswith(".json")
+            ]
+        except OSError:
+            return
+
+        cutoff = time.time() - self.max_age
+        total = sum(size for _, size, _ in entries)
+
+        for mtime, size, path in sorted(entries):
+            if mtime >= cutoff and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def _entry_path(self, key: str) -> Path:
+        return self.results_dir / f"{key}.json"
+
+    def _fingerprint(self, kind: str, relative_path: str) -> str:
+        """Current fingerprint of a probed path"""
+        path = self.project_path / relative_path
+        try:
+            st = path.stat()
+        except OSError:
+            return "missing"
+
+        if kind == PROBE_LIST:
+            return self._listing_digest(path) if stat.S_ISDIR(st.st_mode) else "file"
+        if stat.S_ISDIR(st.st_mode):
+            return "dir"
+        if kind == PROBE_EXISTS:
+            return "file"
+        return self._content_digest(relative_path, path, st)
+
+    def _listing_digest(self, path: Path) -> str:
+        """SHA-256 of a directory's sorted entry names"""
+        try:
+            names = sorted(os.listdir(path))
+        except OSError:
+            return "unreadable"
+        return hashlib.sha256("\0".join(names).encode(errors="surrogateescape")).hexdigest()
+
+    def _content_digest(self, relative_path: str, path: Path, st: os.stat_result) -> str:
+        """SHA-256 of a file, memoized by size and mtime"""
+        with self._lock:
+            digests = self._load_digests()
+            memo = digests.get(relative_path)
+        if memo and memo[0] == st.st_size and memo[1] == st.st_mtime_ns:
+            return str(memo[2])
+
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            return "unreadable"
+        hexdigest = digest.hexdigest()
+
+        if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+            with self._lock:
+                digests[relative_path] = [st.st_size, st.st_mtime_ns, hexdigest]
+                self._digests_dirty = True
+
+        return hexdigest
+
+    def _load_digests(self) -> dict[str, list[Any]]:
+        if self._digests is None:
+            try:
+                self._digests = json.loads((self.cache_dir / "digests.json").read_text())
+            except (OSError, ValueError):
+                self._digests = {}
+        return self._digests
+
+    def _write_atomic(self, path: Path, content: str) -> None:
+        """Write via a temp file so concurrent readers never see partial entries"""
+        try:
+            if not self.cache_dir.exists():
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # Keep the cache out of version control
+                (self.cache_dir / ".gitignore").write_text("*\n")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            # A read-only tree just means no caching
+            pass
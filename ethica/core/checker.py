@@ -5,134 +5,372 @@
 Check engine for running ethics compliance checks.
 """
 
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
-from ethica.checks.base import CheckStatus
-from ethica.checks.file_checks import FileExistsCheck
+from ethica.checks.base import BaseCheck, CheckResult, CheckStatus
+from ethica.checks.file_checks import FileContentCheck, FileExistsCheck
 from ethica.checks.dependency_checks import DependencyCheck
+from ethica.checks.import_checks import ImportUsageCheck
+from ethica.core.cache import ResultCache
+from ethica.core.context import Probe, ProjectContext
+from ethica.core.metrics import CheckHook, CheckMetrics
+from ethica.core.plugins import PluginError, UnavailableCheck, plugin_index, resolve_check_type
+from ethica.core.sandbox import SandboxLimits, SandboxPool, aborted_result
+from ethica.core.summary import SummaryReducer
+from ethica.core.vfs import FileSystem
+
+# Called with each check and its result as soon as the check finishes
+ResultCallback = Callable[[BaseCheck, CheckResult], None]
+
+# Returns True once the run can stop early
+StopCondition = Callable[[BaseCheck, CheckResult], bool]
 
 
 class CheckEngine:
     """Engine for running compliance checks"""
 
-    # Map check types to check classes
-    CHECK_TYPES = {
+    # Built-in check types; other types are looked up in installed plugins
+    CHECK_TYPES: dict[str, type[BaseCheck]] = {
         "file-exists": FileExistsCheck,
+        "file-content": FileContentCheck,
         "dependency-check": DependencyCheck,
+        "import-usage": ImportUsageCheck,
     }
 
-    def __init__(self, framework_spec: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        framework_spec: dict[str, Any],
+        jobs: int = 1,
+        profile: bool = False,
+        hooks: Optional[list[CheckHook]] = None,
+        limits: Optional[SandboxLimits] = None,
+    ) -> None:
         """
         Initialize check engine with framework specification.
 
         Args:
             framework_spec: Complete framework specification
+            jobs: Number of checks to run concurrently. Checks run in a
+                thread pool, except CPU-bound checks which get a process pool.
+                Results are identical to a serial run.
+            profile: Attach timing and I/O metrics to every result
+            hooks: Called around every check, e.g. to emit tracing spans
+            limits: Time and memory limits for checks from plugins, which
+                run in worker subprocesses, and the run deadline
+                (default: SandboxLimits())
         """
         self.framework_spec = framework_spec
+        self.jobs = max(1, jobs)
+        self.profile = profile
+        self.hooks = list(hooks or [])
+        self.limits = limits if limits is not None else SandboxLimits()
+        # id() of each check whose type came from a plugin -> PluginIndex.provider
+        self.sandboxed: dict[int, str] = {}
         self.checks = self._load_checks()
 
-    def _load_checks(self) -> list[Any]:
+    def _load_checks(self) -> list[BaseCheck]:
         """Load and instantiate all checks from framework spec"""
-        checks = []
+        checks: list[BaseCheck] = []
 
         for check_spec in self.framework_spec.get("checks", []):
             check_type = check_spec.get("type")
 
-            if check_type not in self.CHECK_TYPES:
-                # Skip unknown check types
+            check_class = self.CHECK_TYPES.get(check_type)
+            if check_class is None:
+                # Plugins are only looked up for types that aren't built in
+                try:
+                    check_class = resolve_check_type(check_type)
+                except PluginError as e:
+                    checks.append(UnavailableCheck(check_spec, str(e)))
+                    continue
+                check = check_class(check_spec)
+                self.sandboxed[id(check)] = plugin_index().provider(check_type)
+                checks.append(check)
                 continue
 
-            check_class = self.CHECK_TYPES[check_type]
-            check = check_class(check_spec)
-            checks.append(check)
+            checks.append(check_class(check_spec))
+
+        by_class: dict[type[BaseCheck], list[BaseCheck]] = {}
+        for check in checks:
+            by_class.setdefault(type(check), []).append(check)
+        for check_class, group in by_class.items():
+            check_class.prepare(group)
 
         return checks
 
-    def run_checks(self, project_path: Path) -> dict[str, Any]:
+    def cache_key(self, check: BaseCheck) -> str:
+        """
+        Result cache key for one of this engine's checks.
+
+        Args:
+            check: Check from self.checks
+
+        Returns:
+            Key from ResultCache.check_key, which for plugin checks covers
+            the plugin and its version
+        """
+        return ResultCache.check_key(
+            self.framework_spec["metadata"], check.spec, self.sandboxed.get(id(check))
+        )
+
+    def run_checks(
+        self,
+        project_path: Path,
+        cache: Optional[ResultCache] = None,
+        on_result: Optional[ResultCallback] = None,
+        fs: Optional[FileSystem] = None,
+    ) -> dict[str, Any]:
         """
         Run all checks and return aggregated results.
 
         Args:
             project_path: Path to project directory
+            cache: Result cache for the project. Checks whose inputs are
+                unchanged since they were cached are not re-run.
+            on_result: Called with each check and result as it completes
+            fs: Filesystem to read the project through, e.g. a git revision
+                (default: chosen from project_path)
 
         Returns:
             Dictionary with structured results
         """
-        # Group results by principle
-        principle_results: dict[str, Any] = {}
-
-        for check in self.checks:
-            result = check.run(project_path)
-
-            # Initialize principle if needed
-            if check.principle not in principle_results:
-                principle_results[check.principle] = {
-                    "id": check.principle,
-                    "checks": [],
-                    "passed": 0,
-                    "failed": 0,
-                    "skipped": 0,
-                }
-
-            # Add check result
-            principle_results[check.principle]["checks"].append(result.to_dict())
-
-            # Update counters
-            if result.status == CheckStatus.PASSED:
-                principle_results[check.principle]["passed"] += 1
-            elif result.status == CheckStatus.FAILED:
-                principle_results[check.principle]["failed"] += 1
-            elif result.status == CheckStatus.SKIPPED:
-                principle_results[check.principle]["skipped"] += 1
-
-        # Compute principle-level status
-        for principle_id, principle_data in principle_results.items():
-            if principle_data["failed"] > 0:
-                principle_data["status"] = "failed"
-            elif principle_data["passed"] > 0:
-                principle_data["status"] = "passed"
-            else:
-                principle_data["status"] = "skipped"
-
-        # Compute overall statistics
-        total_checks = len(self.checks)
-        total_passed = sum(p["passed"] for p in principle_results.values())
-        total_failed = sum(p["failed"] for p in principle_results.values())
-        total_skipped = sum(p["skipped"] for p in principle_results.values())
-
-        pass_rate = total_passed / total_checks if total_checks > 0 else 0.0
-
-        # Determine overall status
-        error_failures = sum(
-            1
-            for p in principle_results.values()
-            for check in p["checks"]
-            if check["status"] == "failed" and check["severity"] == "error"
+        outcomes = self.execute(project_path, cache=cache, on_result=on_result, fs=fs)
+        return self.aggregate([result for result, _ in outcomes])
+
+    def aggregate(self, results: list[CheckResult]) -> dict[str, Any]:
+        """
+        Build the structured report from per-check results.
+
+        Args:
+            results: One result per check, in the same order as self.checks
+
+        Returns:
+            Dictionary with structured results
+        """
+        return self.reduce(results).summary()
+
+    def reduce(
+        self,
+        results: list[CheckResult],
+        keep_checks: bool = True,
+        indexes: Optional[list[int]] = None,
+    ) -> SummaryReducer:
+        """
+        Summarize per-check results in a single pass.
+
+        Args:
+            results: One result per check, in the same order as self.checks
+            keep_checks: Retain per-check dicts for the detailed report
+            indexes: Positions in self.checks the results belong to, when
+                only some checks ran (default: all)
+
+        Returns:
+            Reducer that can be merged with others or turned into a report
+        """
+        metadata = self.framework_spec["metadata"]
+        reducer = SummaryReducer(metadata["id"], metadata["version"], keep_checks)
+        checks = self.checks if indexes is None else [self.checks[i] for i in indexes]
+
+        for check, result in zip(checks, results):
+            reducer.add(check.principle, result.to_dict())
+
+        return reducer
+
+    def execute(
+        self,
+        project_path: Path,
+        cache: Optional[ResultCache] = None,
+        indexes: Optional[list[int]] = None,
+        on_result: Optional[ResultCallback] = None,
+        until: Optional[StopCondition] = None,
+        fs: Optional[FileSystem] = None,
+    ) -> list[tuple[CheckResult, set[Probe]]]:
+        """
+        Run checks and report what each one probed.
+
+        Once the run deadline in self.limits passes, checks that haven't
+        started and sandboxed checks still running come back with status
+        TIMEOUT.
+
+        Args:
+            project_path: Path to project directory
+            cache: Result cache for the project
+            indexes: Positions in self.checks to run (default: all)
+            on_result: Called from this thread with each check and result in
+                completion order, which may differ from the returned order
+            until: Called like on_result; once it returns True, checks that
+                haven't started are not run. Checks already running finish
+                and are still passed to on_result.
+            fs: Filesystem to read the project through (default: chosen
+                from project_path)
+
+        Returns:
+            (result, probes) for each check run, in the order requested.
+            With until, checks that never ran are left out.
+        """
+        checks = self.checks if indexes is None else [self.checks[i] for i in indexes]
+
+        # Shared by all checks so project analysis happens once per run
+        context = ProjectContext(
+            project_path, cache_dir=cache.cache_dir if cache is not None else None, fs=fs
+        )
+
+        deadline_at = None
+        if self.limits.deadline is not None:
+            deadline_at = time.monotonic() + self.limits.deadline
+
+        sandboxed = sum(1 for check in checks if id(check) in self.sandboxed)
+        sandbox = (
+            SandboxPool(self.limits, min(self.jobs, sandboxed), deadline_at) if sandboxed else None
+        )
+
+        if self.jobs == 1 or len(checks) < 2:
+            outcomes = []
+            try:
+                for check in checks:
+                    outcome = self._run_check(
+                        check, project_path, context, cache, None, sandbox, deadline_at
+                    )
+                    if on_result is not None:
+                        on_result(check, outcome[0])
+                    outcomes.append(outcome)
+                    if until is not None and until(check, outcome[0]):
+                        break
+            finally:
+                if sandbox is not None:
+                    sandbox.close()
+            return outcomes
+
+        cpu_bound = sum(1 for check in checks if check.cpu_bound)
+        processes = (
+            ProcessPoolExecutor(max_workers=min(self.jobs, cpu_bound)) if cpu_bound else None
         )
 
-        if error_failures > 0:
-            overall_status = "failed"
-            overall_status_color = "red"
-        elif total_failed > 0:
-            overall_status = "passed with warnings"
-            overall_status_color = "yellow"
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(checks))) as threads:
+                futures = [
+                    threads.submit(
+                        self._run_check,
+                        check,
+                        project_path,
+                        context,
+                        cache,
+                        processes,
+                        sandbox,
+                        deadline_at,
+                    )
+                    for check in checks
+                ]
+                if on_result is not None or until is not None:
+                    positions = {future: i for i, future in enumerate(futures)}
+                    stopped = False
+                    for future in as_completed(futures):
+                        if future.cancelled():
+                            continue
+                        check, result = checks[positions[future]], future.result()[0]
+                        if on_result is not None:
+                            on_result(check, result)
+                        if until is not None and not stopped and until(check, result):
+                            stopped = True
+                            for pending in futures:
+                                pending.cancel()
+                # Collect in submission order so output matches a serial run
+                return [future.result() for future in futures if not future.cancelled()]
+        finally:
+            if processes is not None:
+                processes.shutdown()
+            if sandbox is not None:
+                sandbox.close()
+
+    def _run_check(
+        self,
+        check: BaseCheck,
+        project_path: Path,
+        context: ProjectContext,
+        cache: Optional[ResultCache],
+        processes: Optional[Executor] = None,
+        sandbox: Optional[SandboxPool] = None,
+        deadline_at: Optional[float] = None,
+    ) -> tuple[CheckResult, set[Probe]]:
+        """Run a single check, going through the cache if one is given"""
+        for hook in self.hooks:
+            hook.on_check_start(check)
+
+        started = time.perf_counter()
+        cpu_started = time.thread_time()
+        cached = None
+        # Whether the check ran to completion, so its result may be cached
+        complete = True
+
+        if cache is not None and not check.cacheable:
+            cache = None
+        if cache is not None:
+            key = self.cache_key(check)
+            cached = cache.lookup(key)
+
+        if cached is not None:
+            result, probes = cached
+            metrics = CheckMetrics(
+                time.perf_counter() - started,
+                time.thread_time() - cpu_started,
+                files_stat=len(probes),
+                bytes_read=0,
+                cached=True,
+            )
+        elif deadline_at is not None and time.monotonic() >= deadline_at:
+            result = aborted_result(
+                check,
+                CheckStatus.TIMEOUT,
+                f"Run deadline of {self.limits.deadline:g}s reached before the check started",
+            )
+            probes, complete = set(), False
+            metrics = CheckMetrics(0.0, 0.0, 0, 0)
+        elif sandbox is not None and id(check) in self.sandboxed:
+            result, probes, metrics, complete = sandbox.run(check, project_path, context.fs)
+        elif processes is not None and check.cpu_bound:
+            # The context can't cross process boundaries, so the worker builds
+            # its own and reports back what it probed
+            result, probes, metrics = processes.submit(
+                _run_isolated, check, project_path, context.fs
+            ).result()
         else:
-            overall_status = "passed"
-            overall_status_color = "green"
-
-        # Build result structure
-        result = {
-            "framework_id": self.framework_spec["metadata"]["id"],
-            "framework_version": self.framework_spec["metadata"]["version"],
-            "principles": list(principle_results.values()),
-            "total_checks": total_checks,
-            "checks_passed": total_passed,
-            "checks_failed": total_failed,
-            "checks_skipped": total_skipped,
-            "pass_rate": pass_rate,
-            "overall_status": overall_status,
-            "overall_status_color": overall_status_color,
-        }
-
-        return result
+            result, probes, metrics = _run_measured(check, project_path, context)
+
+        if cache is not None and cached is None and complete:
+            cache.store(key, result, probes)
+
+        if self.profile:
+            result.metrics = metrics
+        for hook in self.hooks:
+            hook.on_check_finish(check, result, metrics)
+
+        return result, probes
+
+
+def _run_measured(
+    check: BaseCheck, project_path: Path, context: ProjectContext
+) -> tuple[CheckResult, set[Probe], CheckMetrics]:
+    """Run a check, recording what it probed and what it cost"""
+    started = time.perf_counter()
+    cpu_started = time.thread_time()
+
+    with context.track() as probes, context.measure() as io:
+        result = check.run(project_path, context)
+
+    metrics = CheckMetrics(
+        time.perf_counter() - started,
+        time.thread_time() - cpu_started,
+        files_stat=io.stats,
+        bytes_read=io.bytes_read,
+    )
+    return result, probes, metrics
+
+
+def _run_isolated(
+    check: BaseCheck, project_path: Path, fs: Optional[FileSystem] = None
+) -> tuple[CheckResult, set[Probe], CheckMetrics]:
+    """Run a check in a worker process with a private context"""
+    return _run_measured(check, project_path, ProjectContext(project_path, fs=fs))
@@ -0,0 +1,107 @@
+# ABOUTME: Loading of per-project .ai-ethics.yaml configuration
+# ABOUTME: Shared by the check command, fleet mode and the daemon
+
+"""
+Project configuration loading.
+"""
+
+from pathlib import Path
+from typing import Any
+
+from ethica.core.spec_cache import safe_load
+
+CONFIG_FILENAME = ".ai-ethics.yaml"
+
+# Principle that custom checks are reported under unless they name one
+CUSTOM_PRINCIPLE = "custom"
+
+
+def load_project_config(project_path: Path) -> dict[str, Any]:
+    """
+    Load a project's .ai-ethics.yaml.
+
+    Args:
+        project_path: Project directory
+
+    Returns:
+        Parsed configuration
+
+    Raises:
+        FileNotFoundError: If the project has no config
+        ValueError: If the config has no frameworks
+    """
+    with open(Path(project_path) / CONFIG_FILENAME) as f:
+        config = safe_load(f) or {}
+
+    if not config.get("frameworks"):
+        raise ValueError(f"No frameworks configured in {Path(project_path) / CONFIG_FILENAME}")
+
+    return config
+
+
+def enabled_frameworks(config: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Framework entries of a config that aren't switched off with enabled: false.
+
+    Args:
+        config: Project configuration
+
+    Returns:
+        Enabled entries, in config order
+
+    Raises:
+        ValueError: If every framework is disabled
+    """
+    enabled = [entry for entry in config["frameworks"] if entry.get("enabled", True)]
+    if not enabled:
+        raise ValueError(f"No enabled frameworks in {CONFIG_FILENAME}")
+    return enabled
+
+
+def with_custom_checks(framework_spec: dict[str, Any], config: dict[str, Any]) -> dict[str, Any]:
+    """
+    Add a project's custom_checks to a framework spec.
+
+    Custom checks use the same fields as framework checks. Their type may be
+    built in or come from a plugin. Unless they name one of the framework's
+    principles they are reported under a 'custom' principle, which only
+    compliance levels requiring all principles include.
+
+    Args:
+        framework_spec: Framework specification (not modified)
+        config: Parsed project configuration
+
+    Returns:
+        The spec itself if the project has no custom checks, else a copy
+        with them appended
+
+    Raises:
+        ValueError: If a custom check has no id or type, or its id is
+            already used by the framework
+    """
+    custom = config.get("custom_checks") or []
+    if not custom:
+        return framework_spec
+
+    taken = {check["id"] for check in framework_spec.get("checks", [])}
+    checks = list(framework_spec.get("checks", []))
+    for entry in custom:
+        if not isinstance(entry, dict) or not entry.get("id") or not entry.get("type"):
+            raise ValueError(f"Custom checks in {CONFIG_FILENAME} need an id and a type: {entry}")
+        if entry["id"] in taken:
+            raise ValueError(
+                f"Custom check ID '{entry['id']}' is already used by "
+                f"{framework_spec['metadata']['id']}"
+            )
+        taken.add(entry["id"])
+        checks.append(
+            {
+                "name": entry["id"],
+                "principle": CUSTOM_PRINCIPLE,
+                "severity": "warning",
+                "description": "Project-specific check",
+                **entry,
+            }
+        )
+
+    return {**framework_spec, "checks": checks}
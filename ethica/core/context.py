@@ -0,0 +1,325 @@
+# ABOUTME: Project-scoped state shared by all checks in one run
+# ABOUTME: Memoizes expensive project analysis and records the paths checks probe
+
+"""
+Per-run project context passed to every check.
+"""
+
+import io
+import mmap
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from ethica.checks.imports import ImportIndex
+from ethica.checks.manifests import ManifestIndex
+from ethica.core.metrics import IOCounters
+from ethica.core.vfs import FileStat, FileSystem, open_filesystem
+from ethica.utils.globs import compile_glob, has_magic
+from ethica.utils.paths import SKIP_DIRS
+
+T = TypeVar("T")
+
+# Kinds of probe a check can make against a project path
+PROBE_EXISTS = "exists"
+PROBE_READ = "read"
+PROBE_LIST = "list"
+
+Probe = tuple[str, str]
+
+
+class ProjectContext:
+    """State for one project, built once per run and shared by all checks"""
+
+    def __init__(
+        self,
+        project_path: Path,
+        cache_dir: Optional[Path] = None,
+        fs: Optional[FileSystem] = None,
+    ) -> None:
+        """
+        Initialize context for a project.
+
+        Args:
+            project_path: Path to the project directory, or to an archive
+                such as a wheel or sdist to check without extracting it
+            cache_dir: Where analysis such as per-file import scans may be
+                cached across runs (default: not cached)
+            fs: Filesystem to read the project through (default: the one
+                open_filesystem picks for project_path)
+
+        Raises:
+            ValueError: If project_path is a file but not a supported archive
+        """
+        self.project_path = Path(project_path)
+        self.fs = fs if fs is not None else open_filesystem(self.project_path)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._memo: dict[str, tuple[Any, frozenset[Probe]]] = {}
+        self._memo_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def exists(self, relative_path: str) -> bool:
+        """Check whether a path exists in the project"""
+        self._record(PROBE_EXISTS, relative_path)
+        self._count(stats=1)
+        return self.fs.exists(relative_path)
+
+    def stat(self, relative_path: str) -> Optional[FileStat]:
+        """
+        Stat a project file whose content a value is derived from.
+
+        Recorded as a read, so cached results depend on the file's content.
+        Callers that then read the file themselves report it with count_read.
+
+        Returns:
+            The file's size and mtime, or None if it doesn't exist
+        """
+        self._record(PROBE_READ, relative_path)
+        self._count(stats=1)
+        return self.fs.stat(relative_path)
+
+    def count_read(self, bytes_read: int) -> None:
+        """Count project bytes read outside this context's own readers"""
+        self._count(bytes_read=bytes_read)
+
+    def read_text(self, relative_path: str) -> str:
+        """Read a project file as text, returning '' if it can't be read"""
+        self._record(PROBE_READ, relative_path)
+        self._count(stats=1)
+        try:
+            data = self.fs.read_bytes(relative_path)
+        except OSError:
+            return ""
+        self._count(bytes_read=len(data))
+        try:
+            return data.decode()
+        except UnicodeDecodeError:
+            return ""
+
+    def iter_lines(self, relative_path: str) -> Iterator[str]:
+        """
+        Stream a project file's lines, yielding nothing if it can't be read.
+
+        Undecodable bytes are replaced rather than failing the whole file.
+        """
+        self._record(PROBE_READ, relative_path)
+        self._count(stats=1)
+        try:
+            with self.fs.open(relative_path) as f:
+                for line in f:
+                    self._count(bytes_read=len(line))
+                    yield line.decode(errors="replace")
+        except OSError:
+            return
+
+    def iter_chunks(self, relative_path: str, size: int = 1 << 16) -> Iterator[str]:
+        """Stream a project file as text chunks of about `size` bytes"""
+        self._record(PROBE_READ, relative_path)
+        self._count(stats=1)
+        try:
+            with io.TextIOWrapper(
+                self.fs.open(relative_path), encoding="utf-8", errors="replace"
+            ) as f:
+                for chunk in iter(lambda: f.read(size), ""):
+                    self._count(bytes_read=len(chunk))
+                    yield chunk
+        except OSError:
+            return
+
+    @contextmanager
+    def map_file(self, relative_path: str) -> Iterator[Optional[Union[mmap.mmap, bytes]]]:
+        """
+        Memory-map a project file for read-only scanning.
+
+        Pages are loaded on demand, so regex scans over very large files
+        don't hold the whole file in memory. Files inside archives are read
+        into memory instead.
+
+        Yields:
+            The mapped file (b"" if it is empty), or None if it can't be read
+        """
+        self._record(PROBE_READ, relative_path)
+        self._count(stats=1)
+        local_path = self.fs.local_path(relative_path)
+        if local_path is None:
+            try:
+                content = self.fs.read_bytes(relative_path)
+            except OSError:
+                yield None
+                return
+            self._count(bytes_read=len(content))
+            yield content
+            return
+
+        try:
+            f = open(local_path, "rb")
+        except OSError:
+            yield None
+            return
+
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            self._count(bytes_read=size)
+            if size == 0:
+                yield b""
+                return
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                yield None
+                return
+            with data:
+                yield data
+
+    def glob(self, pattern: str) -> list[str]:
+        """
+        Project files matching a glob, sorted.
+
+        Only the directories below the pattern's fixed prefix are walked, no
+        deeper than the pattern can match, and SKIP_DIRS are never entered.
+        Each directory listed is recorded as a probe so adding or removing
+        files invalidates cached results.
+
+        Args:
+            pattern: Glob such as 'docs/**/*.md'
+
+        Returns:
+            Matching paths relative to the project
+        """
+        if not has_magic(pattern):
+            return [pattern] if self.exists(pattern) else []
+        return self.memoize(f"glob:{pattern}", lambda context: context._walk_glob(pattern))
+
+    def _walk_glob(self, pattern: str) -> list[str]:
+        parts = pattern.split("/")
+        prefix = []
+        for part in parts[:-1]:
+            if has_magic(part):
+                break
+            prefix.append(part)
+
+        base = "/".join(prefix) or "."
+        max_depth = None if "**" in pattern else len(parts) - len(prefix) - 1
+        regex = compile_glob(pattern)
+        matches = []
+
+        self._record(PROBE_LIST, base)
+        for relative_dir, dirnames, filenames in self.fs.walk(base):
+            self._record(PROBE_LIST, relative_dir)
+            self._count(stats=1)
+
+            if base == ".":
+                below = "" if relative_dir == "." else relative_dir
+            else:
+                below = relative_dir[len(base) + 1:]
+            depth = below.count("/") + 1 if below else 0
+            if max_depth is not None and depth >= max_depth:
+                dirnames.clear()
+            else:
+                dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+
+            for name in filenames:
+                path = name if relative_dir == "." else f"{relative_dir}/{name}"
+                if regex.match(path):
+                    matches.append(path)
+
+        return sorted(matches)
+
+    @property
+    def manifest_index(self) -> ManifestIndex:
+        """Declared dependencies, parsed on first access"""
+        return self.memoize("manifest_index", ManifestIndex.build)
+
+    def import_index(self, notebooks: bool = False) -> ImportIndex:
+        """Modules imported by the project's code, scanned on first use"""
+        return self.memoize(
+            f"import_index:{notebooks}", lambda context: ImportIndex.build(context, notebooks)
+        )
+
+    def memoize(self, name: str, build: Callable[["ProjectContext"], T]) -> T:
+        """
+        Compute a project-wide value once and share it between checks.
+
+        Paths probed while building the value are replayed into the probe
+        record of every check that uses it, so each check's inputs stay
+        complete even when it never touched the files itself. Safe to call
+        from several threads; the value is built only once.
+
+        Args:
+            name: Memo key
+            build: Function computing the value from this context
+
+        Returns:
+            The memoized value
+        """
+        entry = self._memo.get(name)
+        if entry is None:
+            with self._lock:
+                name_lock = self._memo_locks.setdefault(name, threading.Lock())
+            with name_lock:
+                entry = self._memo.get(name)
+                if entry is None:
+                    with self.track() as probes:
+                        value = build(self)
+                    entry = (value, frozenset(probes))
+                    self._memo[name] = entry
+
+        for probe in entry[1]:
+            self._record(*probe)
+
+        return entry[0]
+
+    @contextmanager
+    def track(self) -> Iterator[set[Probe]]:
+        """
+        Record every (kind, path) probe made by this thread while active.
+
+        Yields:
+            Set that fills with probes as the block runs
+        """
+        stack = self._scopes()
+        probes: set[Probe] = set()
+        stack.append(probes)
+        try:
+            yield probes
+        finally:
+            stack.pop()
+
+    @contextmanager
+    def measure(self) -> Iterator[IOCounters]:
+        """
+        Count project I/O made by this thread while active.
+
+        Yields:
+            Counters that fill as the block runs
+        """
+        if not hasattr(self._local, "counters"):
+            self._local.counters = []
+        counters = IOCounters()
+        self._local.counters.append(counters)
+        try:
+            yield counters
+        finally:
+            self._local.counters.pop()
+
+    def _count(self, stats: int = 0, bytes_read: int = 0) -> None:
+        """Add I/O to every active measurement scope of this thread"""
+        for counters in getattr(self._local, "counters", ()):
+            counters.stats += stats
+            counters.bytes_read += bytes_read
+
+    def _scopes(self) -> list[set[Probe]]:
+        """Tracking scopes for the current thread"""
+        if not hasattr(self._local, "scopes"):
+            self._local.scopes = []
+        return self._local.scopes  # type: ignore[no-any-return]
+
+    def _record(self, kind: str, relative_path: str) -> None:
+        """Add a probe to the innermost tracking scope, if any"""
+        scopes = self._scopes()
+        if scopes:
+            scopes[-1].add((kind, relative_path))
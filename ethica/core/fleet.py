@@ -0,0 +1,251 @@
+# ABOUTME: Fleet mode for checking every project in a monorepo in one run
+# ABOUTME: Discovers .ai-ethics.yaml files and runs projects in a process pool
+
+"""
+Fleet mode: discover and check many projects under a single root.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.config import CONFIG_FILENAME, enabled_frameworks, load_project_config
+from ethica.core.planning import CheckPlan, ComplianceLevel
+from ethica.core.registry import FrameworkRegistry
+from ethica.core.summary import FleetReducer, SummaryReducer
+from ethica.utils.paths import SKIP_DIRS
+
+# Per-worker state, populated by _init_worker
+_worker_specs: dict[str, dict[str, Any]] = {}
+_worker_plans: dict[tuple[str, Optional[str]], CheckPlan] = {}
+_worker_use_cache = False
+
+# A project's results, plus its compliance-level outcome when the framework
+# defines levels, or the error message if it couldn't be checked
+ProjectOutcome = Union[tuple[SummaryReducer, Optional[dict[str, Any]]], str]
+
+
+def discover_projects(root: Path) -> list[Path]:
+    """
+    Find every project directory under root that has a config file.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Sorted list of project directories
+    """
+    projects = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune in place so os.walk never descends into skipped directories
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        if CONFIG_FILENAME in filenames:
+            projects.append(Path(dirpath))
+
+    return sorted(projects)
+
+
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may actually use.
+
+    Respects CPU affinity and cgroup (v1 and v2) CPU quotas, so containers
+    limited to a fraction of the host do not oversubscribe.
+    """
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        count = min(count, math.ceil(quota))
+
+    return max(1, count)
+
+
+def _cgroup_cpu_quota() -> Optional[float]:
+    """Read the cgroup CPU quota as a number of CPUs, if one is set"""
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    try:
+        fields = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if fields[0] == "max":
+            return None
+        return int(fields[0]) / int(fields[1])
+    except (OSError, ValueError, IndexError, ZeroDivisionError):
+        pass
+
+    # cgroup v1: quota of -1 means unlimited
+    try:
+        quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        if quota > 0 and period > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
+def _init_worker(specs: dict[str, dict[str, Any]], use_cache: bool) -> None:
+    """Receive pre-loaded framework specs once per worker process"""
+    global _worker_specs, _worker_plans, _worker_use_cache
+    _worker_specs = specs
+    _worker_plans = {}
+    _worker_use_cache = use_cache
+
+
+def _check_project(task: tuple[str, str, Optional[ComplianceLevel]]) -> ProjectOutcome:
+    """
+    Run one project's checks using the worker's cached engines and plans.
+
+    Returns:
+        The project's results and compliance-level outcome, or the error
+        message if checking it failed, so one broken project doesn't abort
+        the fleet
+    """
+    project_path, framework_id, level = task
+
+    try:
+        key = (framework_id, level.id if level is not None else None)
+        plan = _worker_plans.get(key)
+        if plan is None:
+            plan = CheckPlan(CheckEngine(_worker_specs[framework_id]), level)
+            _worker_plans[key] = plan
+
+        if not _worker_use_cache:
+            outcomes = plan.engine.execute(Path(project_path), indexes=plan.indexes)
+        else:
+            with ResultCache(Path(project_path)) as cache:
+                outcomes = plan.engine.execute(
+                    Path(project_path), cache=cache, indexes=plan.indexes
+                )
+
+        return plan.summarize(
+            {index: result for index, (result, _) in zip(plan.indexes, outcomes)}
+        )
+    except Exception as e:
+        return str(e) or type(e).__name__
+
+
+def run_fleet(
+    root: Path,
+    framework: Optional[str] = None,
+    level: Optional[str] = None,
+    workers: Optional[int] = None,
+    registry: Optional[FrameworkRegistry] = None,
+    specs: Optional[dict[str, dict[str, Any]]] = None,
+    use_cache: bool = False,
+    on_project: Optional[Callable[[dict[str, Any]], None]] = None,
+    keep_checks: bool = True,
+) -> dict[str, Any]:
+    """
+    Check every project under root and merge the results.
+
+    Args:
+        root: Monorepo root to search for projects
+        framework: Framework ID overriding each project's config
+        level: Compliance level overriding each project's config
+        workers: Worker process count (defaults to available CPUs)
+        registry: Registry to load frameworks from
+        specs: Framework specs by ID, filled in as frameworks are loaded so
+            callers can reuse them for display
+        use_cache: Reuse cached results from each project's .ethica-cache
+        on_project: Called with each project entry as soon as it is complete
+        keep_checks: Keep per-check results in each project entry once
+            on_project has seen them. Without them only counters are kept.
+
+    Returns:
+        Merged report with one entry per project, fleet-wide totals and
+        per-framework totals
+    """
+    root = Path(root).resolve()
+    registry = registry or FrameworkRegistry()
+    projects = discover_projects(root)
+
+    specs = {} if specs is None else specs
+    fleet = FleetReducer()
+    entries: list[dict[str, Any]] = []
+    tasks: list[tuple[str, str, Optional[ComplianceLevel]]] = []
+    task_entries: list[dict[str, Any]] = []
+
+    # Read configs and load each framework spec exactly once
+    for project_path in projects:
+        entry: dict[str, Any] = {"path": project_path.relative_to(root).as_posix() or "."}
+        entries.append(entry)
+
+        try:
+            enabled = enabled_frameworks(load_project_config(project_path))
+            framework_id = framework or enabled[0]["id"]
+            entry["framework_id"] = framework_id
+            level_id = level or enabled[0].get("compliance_level", "standard")
+            entry["compliance_level"] = level_id
+            if framework_id not in specs:
+                specs[framework_id] = registry.load_framework_spec(framework_id)
+            # Frameworks without compliance levels run every check
+            compliance = None
+            if "compliance_levels" in specs[framework_id]:
+                compliance = ComplianceLevel.from_framework(specs[framework_id], level_id)
+        except Exception as e:
+            entry["error"] = str(e)
+            fleet.add_project(None)
+            if on_project is not None:
+                on_project(entry)
+            continue
+
+        tasks.append((str(project_path), framework_id, compliance))
+        task_entries.append(entry)
+
+    if workers is None:
+        workers = available_cpus()
+    workers = max(1, min(workers, len(tasks)))
+
+    if workers == 1:
+        # Not worth paying for process startup
+        _init_worker(specs, use_cache)
+        _collect(fleet, task_entries, map(_check_project, tasks), on_project, keep_checks)
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(specs, use_cache),
+        ) as executor:
+            results = executor.map(_check_project, tasks, chunksize=chunksize)
+            _collect(fleet, task_entries, results, on_project, keep_checks)
+
+    return {"root": str(root), "projects": entries, **fleet.summary()}
+
+
+def _collect(
+    fleet: FleetReducer,
+    entries: list[dict[str, Any]],
+    outcomes: Iterable[ProjectOutcome],
+    on_project: Optional[Callable[[dict[str, Any]], None]],
+    keep_checks: bool,
+) -> None:
+    """Attach results to their entries and fold them into the fleet as they arrive"""
+    for entry, outcome in zip(entries, outcomes):
+        if isinstance(outcome, str):
+            entry["error"] = outcome
+            fleet.add_project(None)
+            if on_project is not None:
+                on_project(entry)
+            continue
+
+        reducer, compliance = outcome
+        fleet.add_project(reducer, reached=compliance is None or compliance["reached"])
+        entry["results"] = reducer.summary()
+        if compliance is not None:
+            entry["results"]["compliance"] = compliance
+        if on_project is not None:
+            on_project(entry)
+        if not keep_checks:
+            entry["results"] = reducer.summary(include_checks=False)
+            if compliance is not None:
+                entry["results"]["compliance"] = compliance
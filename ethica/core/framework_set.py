@@ -0,0 +1,216 @@
+# ABOUTME: Single-pass evaluation of several frameworks against one project
+# ABOUTME: Deduplicates identical checks across frameworks and merges their reports
+
+"""
+Multi-framework runs.
+
+Frameworks often ask for the same evidence: a model card, a fairness library.
+A FrameworkSet runs each distinct check (same type, config and help URL) once,
+sharing one project context so every probe and manifest parse happens once,
+and attributes the result to every framework check that references it. Each
+framework still gets its own report and compliance level evaluation.
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ethica.checks.base import BaseCheck, CheckResult
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.metrics import CheckHook
+from ethica.core.planning import CheckPlan, ComplianceLevel
+from ethica.core.sandbox import SandboxLimits
+from ethica.core.summary import overall_status
+from ethica.core.vfs import FileSystem
+
+# Called with the framework ID, check and result as each result is attributed
+FrameworkResultCallback = Callable[[str, BaseCheck, CheckResult], None]
+
+
+def check_fingerprint(check_spec: dict[str, Any]) -> str:
+    """
+    Identity of what a check does, ignoring which framework it belongs to.
+
+    Args:
+        check_spec: Check specification from framework YAML
+
+    Returns:
+        Key shared by checks that always produce the same outcome
+    """
+    return json.dumps(
+        {
+            "type": check_spec.get("type"),
+            "config": check_spec.get("config", {}),
+            # Suggestions link to it
+            "help_url": check_spec.get("help_url"),
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def attribute(result: CheckResult, check: BaseCheck) -> CheckResult:
+    """Copy of a shared result labelled as one framework's check"""
+    attributed = copy.copy(result)
+    attributed.check_id = check.check_id
+    attributed.name = check.name
+    attributed.severity = check.severity
+    return attributed
+
+
+class FrameworkSet:
+    """Several frameworks checked in one pass with shared checks run once"""
+
+    def __init__(
+        self,
+        frameworks: list[tuple[dict[str, Any], Optional[ComplianceLevel]]],
+        jobs: int = 1,
+        profile: bool = False,
+        hooks: Optional[list[CheckHook]] = None,
+        limits: Optional[SandboxLimits] = None,
+    ) -> None:
+        """
+        Plan a combined run.
+
+        Args:
+            frameworks: Each framework spec with the level to evaluate it at
+                (None to run all its checks without a level)
+            jobs: Number of distinct checks to run concurrently
+            profile: Attach timing and I/O metrics to every result
+            hooks: Called around every distinct check run
+            limits: Limits for plugin checks and the run deadline
+        """
+        self.plans = [CheckPlan(CheckEngine(spec), level) for spec, level in frameworks]
+
+        unique_specs: list[dict[str, Any]] = []
+        positions: dict[str, int] = {}
+        # For each distinct check, the (plan, check index) pairs it stands for
+        self.references: list[list[tuple[int, int]]] = []
+
+        for p, plan in enumerate(self.plans):
+            framework_id = plan.engine.framework_spec["metadata"]["id"]
+            for i in plan.indexes:
+                spec = plan.engine.checks[i].spec
+                key = check_fingerprint(spec)
+                if key not in positions:
+                    positions[key] = len(unique_specs)
+                    # Check IDs are only unique within a framework
+                    unique_specs.append({**spec, "id": f"{framework_id}/{spec['id']}"})
+                    self.references.append([])
+                self.references[positions[key]].append((p, i))
+
+        metadata = [plan.engine.framework_spec["metadata"] for plan in self.plans]
+        combined = {
+            "metadata": {
+                "id": "+".join(m["id"] for m in metadata),
+                "version": "+".join(m["version"] for m in metadata),
+            },
+            "checks": unique_specs,
+        }
+        # Runs the distinct checks; its cache keys cover the whole set
+        self.engine = CheckEngine(combined, jobs=jobs, profile=profile, hooks=hooks, limits=limits)
+
+    @property
+    def framework_ids(self) -> list[str]:
+        """IDs of the frameworks in the set, in order"""
+        return [plan.engine.framework_spec["metadata"]["id"] for plan in self.plans]
+
+    def run(
+        self,
+        project_path: Path,
+        cache: Optional[ResultCache] = None,
+        on_result: Optional[FrameworkResultCallback] = None,
+        fail_fast: bool = False,
+        fs: Optional[FileSystem] = None,
+    ) -> dict[str, Any]:
+        """
+        Run every distinct check once and report per framework.
+
+        Args:
+            project_path: Path to project directory
+            cache: Result cache for the project
+            on_result: Called with each framework's result as it completes
+            fail_fast: Stop once no framework can reach its level
+            fs: Filesystem to read the project through
+
+        Returns:
+            Merged report from merge_reports
+        """
+        progresses = [plan.progress() for plan in self.plans]
+        results: list[dict[int, CheckResult]] = [{} for _ in self.plans]
+        positions = {id(check): u for u, check in enumerate(self.engine.checks)}
+        framework_ids = self.framework_ids
+
+        def record(shared: BaseCheck, result: CheckResult) -> None:
+            for p, i in self.references[positions[id(shared)]]:
+                check = self.plans[p].engine.checks[i]
+                attributed = attribute(result, check)
+                results[p][i] = attributed
+                progress = progresses[p]
+                if progress is not None:
+                    progress.add(check, attributed)
+                if on_result is not None:
+                    on_result(framework_ids[p], check, attributed)
+
+        def unreachable(shared: BaseCheck, result: CheckResult) -> bool:
+            return not any(progress is None or progress.reachable for progress in progresses)
+
+        order = sorted(range(len(self.engine.checks)), key=lambda u: self.engine.checks[u].cost)
+        self.engine.execute(
+            project_path,
+            cache=cache,
+            indexes=order,
+            on_result=record,
+            until=unreachable if fail_fast else None,
+            fs=fs,
+        )
+
+        reports = {
+            framework_ids[p]: plan.report(results[p], progresses[p])
+            for p, plan in enumerate(self.plans)
+        }
+        return merge_reports(
+            reports,
+            unique_checks=len(self.engine.checks),
+            referenced_checks=sum(len(refs) for refs in self.references),
+        )
+
+
+def merge_reports(
+    reports: dict[str, dict[str, Any]], unique_checks: int, referenced_checks: int
+) -> dict[str, Any]:
+    """
+    Combine per-framework reports into one.
+
+    Args:
+        reports: Report of each framework, by framework ID
+        unique_checks: Distinct checks run
+        referenced_checks: Framework checks those stood for
+
+    Returns:
+        Dict with each framework's report under "frameworks", summed check
+        counters, the worst overall status and deduplication counts
+    """
+    total = sum(report["total_checks"] for report in reports.values())
+    passed = sum(report["checks_passed"] for report in reports.values())
+    failed = sum(report["checks_failed"] for report in reports.values())
+    failed_frameworks = sum(
+        1 for report in reports.values() if report["overall_status"] == "failed"
+    )
+    status, color = overall_status(failed_frameworks, failed)
+
+    return {
+        "frameworks": reports,
+        "total_checks": total,
+        "checks_passed": passed,
+        "checks_failed": failed,
+        "checks_skipped": sum(report["checks_skipped"] for report in reports.values()),
+        "checks_timed_out": sum(report["checks_timed_out"] for report in reports.values()),
+        "pass_rate": passed / total if total > 0 else 0.0,
+        "overall_status": status,
+        "overall_status_color": color,
+        "unique_checks": unique_checks,
+        "checks_deduplicated": referenced_checks - unique_checks,
+    }
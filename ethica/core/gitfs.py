@@ -0,0 +1,264 @@
+# ABOUTME: Read-only filesystem over a git commit, served from the object store
+# ABOUTME: Lists files with git ls-tree and reads blobs through one git cat-file --batch pipe
+
+"""
+Checking a git revision without checking it out.
+
+A GitTreeFileSystem lists the commit's tree once with ``git ls-tree`` and
+reads file contents through a single long-running ``git cat-file --batch``
+process, started only when a check first reads a file. Blob contents are
+cached by SHA for the life of the process, so files unchanged between the
+revisions being checked are read from git once.
+"""
+
+import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+from ethica.core.vfs import ArchiveFileSystem, FileStat, _Node, _normalize
+
+# Git file modes that aren't regular files: symlinks and submodules
+_SKIPPED_MODES = ("120000", "160000")
+
+
+class BlobCache:
+    """Blob contents by SHA, bounded by their total size"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Total size to keep; least recently used blobs are
+                evicted first and blobs over a quarter of it aren't kept
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sha: str) -> Optional[bytes]:
+        """A cached blob, or None"""
+        with self._lock:
+            data = self._blobs.get(sha)
+            if data is not None:
+                self._blobs.move_to_end(sha)
+            return data
+
+    def put(self, sha: str, data: bytes) -> None:
+        """Cache a blob"""
+        if len(data) > self.max_bytes // 4:
+            return
+        with self._lock:
+            if sha in self._blobs:
+                return
+            self._blobs[sha] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self._blobs.popitem(last=False)
+                self.size -= len(evicted)
+
+
+# Shared by every tree in the process
+blob_cache = BlobCache()
+
+
+def git(repo_path: Path, *args: str, input: Optional[str] = None) -> str:
+    """
+    Run a git command and return its output.
+
+    Raises:
+        RuntimeError: If git isn't installed or the command fails
+    """
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=repo_path,
+            input=input,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except FileNotFoundError as e:
+        raise RuntimeError("git is not installed") from e
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"git {args[0]} failed: {e.stderr.strip()}") from e
+
+
+class _CatFile:
+    """A git cat-file --batch process, started on first read"""
+
+    def __init__(self, repo_path: Path) -> None:
+        self.repo_path = repo_path
+        self.process: Optional[subprocess.Popen[bytes]] = None
+
+    def read(self, sha: str) -> bytes:
+        """Content of an object"""
+        if self.process is None:
+            self.process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        stdin: IO[bytes] = self.process.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = self.process.stdout  # type: ignore[assignment]
+
+        stdin.write(sha.encode() + b"\n")
+        stdin.flush()
+        # "<sha> <type> <size>", or "<sha> missing"
+        header = stdout.readline().split()
+        if len(header) != 3:
+            raise FileNotFoundError(f"git object {sha} not found")
+        data = stdout.read(int(header[2]))
+        # Trailing newline after the content
+        stdout.read(1)
+        return data
+
+    def close(self) -> None:
+        if self.process is None:
+            return
+        self.process.stdin.close()  # type: ignore[union-attr]
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()  # type: ignore[union-attr]
+        self.process = None
+
+
+class GitTreeFileSystem(ArchiveFileSystem):
+    """Files of a git commit, read from the object store"""
+
+    # Paths are relative to the project directory, as in a checkout
+    strip_root = False
+    is_build_artifact = False
+
+    def __init__(self, project_path: Path, rev: str) -> None:
+        """
+        Initialize a view of a commit. The tree is listed on first use.
+
+        Args:
+            project_path: Project directory inside the repository's work tree
+            rev: Commit, tag or branch to read
+
+        Raises:
+            RuntimeError: If git fails or rev doesn't name a commit
+        """
+        super().__init__(Path(project_path))
+        self.rev = rev
+        commit, timestamp = git(
+            self.archive_path, "log", "-1", "--format=%H %ct", f"{rev}^{{commit}}", "--"
+        ).split()
+        self.commit = commit
+        self._mtime_ns = int(timestamp) * 10**9
+        # Whether the project is the repository's top level, where a checkout has .git
+        self.at_root = not git(self.archive_path, "rev-parse", "--show-prefix").strip()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "archive_path": self.archive_path,
+            "rev": self.rev,
+            "commit": self.commit,
+            "mtime_ns": self._mtime_ns,
+            "at_root": self.at_root,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        ArchiveFileSystem.__init__(self, state["archive_path"])
+        self.rev = state["rev"]
+        self.commit = state["commit"]
+        self._mtime_ns = state["mtime_ns"]
+        self.at_root = state["at_root"]
+
+    def _lookup(self, path: str) -> Union[_Node, tuple[FileStat, Any], None]:
+        # Trees never contain .git, but the project is in a repository by
+        # construction, so it is there as it would be in a checkout
+        if self.at_root and _normalize(path) == ".git":
+            return _Node()
+        return super()._lookup(path)
+
+    def _open_archive(self) -> Any:
+        return _CatFile(self.archive_path)
+
+    def _members(self, handle: Any) -> Iterator[tuple[str, bool, FileStat, Any]]:
+        # Run from the project directory, git lists just its subtree with
+        # paths relative to it
+        listing = git(self.archive_path, "ls-tree", "-r", "-z", "--long", self.commit)
+        for entry in listing.split("\0"):
+            if not entry:
+                continue
+            info, _, path = entry.partition("\t")
+            mode, object_type, sha, size = info.split()
+            if object_type != "blob" or mode in _SKIPPED_MODES:
+                continue
+            yield path, False, FileStat(int(size), self._mtime_ns), sha
+
+    def _read_member(self, handle: Any, member: Any) -> bytes:
+        data = blob_cache.get(member)
+        if data is None:
+            data = handle.read(member)
+            blob_cache.put(member, data)
+        return data
+
+    def blob_sha(self, path: str) -> Optional[str]:
+        """SHA of the blob at a path, or None if it isn't a file"""
+        found = self._lookup(path)
+        return found[1] if isinstance(found, tuple) else None
+
+    def content_id(self, path: str) -> Optional[str]:
+        return self.blob_sha(path)
+
+    def advance(
+        self,
+        commit: str,
+        timestamp: int,
+        changes: list[tuple[str, Optional[tuple[str, int]]]],
+    ) -> None:
+        """
+        Move the view to another commit by applying the changes leading to it.
+
+        Lets a walk over history update one tree in place instead of listing
+        every commit's tree. Files the changes don't touch keep their stat.
+
+        Args:
+            commit: Commit to move to
+            timestamp: Its commit time, in seconds since the epoch
+            changes: (path, (blob SHA, size)) for each file added or
+                modified and (path, None) for each file removed, with paths
+                relative to the project
+        """
+        root = self._index()
+        mtime_ns = timestamp * 10**9
+        with self._lock:
+            for path, blob in changes:
+                *dirs, name = path.split("/")
+                if blob is not None:
+                    node = root
+                    for part in dirs:
+                        node = node.dirs.setdefault(part, _Node())
+                    sha, size = blob
+                    node.files[name] = (FileStat(size, mtime_ns), sha)
+                    continue
+
+                # Git doesn't track empty directories, so drop any left behind
+                chain = [root]
+                for part in dirs:
+                    if part not in chain[-1].dirs:
+                        break
+                    chain.append(chain[-1].dirs[part])
+                else:
+                    chain[-1].files.pop(name, None)
+                    for parent, part in zip(reversed(chain[:-1]), reversed(dirs)):
+                        child = parent.dirs[part]
+                        if child.dirs or child.files:
+                            break
+                        del parent.dirs[part]
+
+            self.rev = commit
+            self.commit = commit
+            self._mtime_ns = mtime_ns
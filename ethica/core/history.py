@@ -0,0 +1,338 @@
+# ABOUTME: Compliance over a range of git history, one report per commit
+# ABOUTME: Reuses check results across commits by the blob SHAs of the paths each check probed
+
+"""
+Compliance history backfill.
+
+The commits of a range are walked oldest first along the first-parent line.
+The first commit's tree is listed once; every later commit is reached by
+applying its changes from one ``git log --raw`` to the same in-memory tree,
+so no commit is checked out or listed again.
+
+A check is re-run only when a commit changes something it probed:
+
+* If no path the check probed at the previous commit changed, its previous
+  result carries over without looking at the tree.
+* Otherwise the probed paths are fingerprinted (blob SHAs for files read,
+  presence for existence probes, entry names for directory listings) and
+  looked up among every earlier result of the check, so reverting a file
+  brings its old result back.
+
+Only checks whose inputs hold content not seen before actually run, and
+per-file import scans are memoized by blob SHA as well, so walking a long
+history costs about as much as processing its unique blobs.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+from ethica.checks.base import CheckResult, CheckStatus
+from ethica.core.context import PROBE_EXISTS, PROBE_LIST, Probe
+from ethica.core.gitfs import GitTreeFileSystem, git
+from ethica.core.planning import CheckPlan
+from ethica.core.vfs import _normalize
+
+# Git file modes that aren't regular files in a tree: none, symlinks and submodules
+_ABSENT_MODES = ("000000", "120000", "160000")
+
+# Called with each commit's point as soon as it is evaluated
+PointCallback = Callable[[dict[str, Any]], None]
+
+
+class HistoryCommit(NamedTuple):
+    """One commit of a history walk and what it changed"""
+
+    sha: str
+    timestamp: int
+    subject: str
+    # (path, (blob SHA, size)) for files added or modified, (path, None) for
+    # files removed; paths relative to the project
+    changes: list[tuple[str, Optional[tuple[str, int]]]]
+    # Paths that became or stopped being files
+    added_or_removed: frozenset[str]
+
+
+def commit_log(project_path: Path, revisions: str = "HEAD") -> list[HistoryCommit]:
+    """
+    Commits of a range with their changes to the project, oldest first.
+
+    Follows first parents, so merges appear once with everything they
+    brought in relative to the branch they were merged into.
+
+    Args:
+        project_path: Project directory inside a git work tree; changes
+            outside it are left out
+        revisions: Revision range, e.g. 'HEAD' or 'v1.0..main'
+
+    Returns:
+        The commits; the first one's changes are relative to its parent
+
+    Raises:
+        RuntimeError: If git fails, e.g. on a bad range
+    """
+    output = git(
+        project_path,
+        "log",
+        "--reverse",
+        "--first-parent",
+        "-m",
+        "--raw",
+        "--no-renames",
+        "--no-abbrev",
+        "--relative",
+        "-z",
+        "--format=%x00%H %ct %s",
+        revisions,
+        "--",
+    )
+
+    # Headers follow an empty field; raw entries are ':<modes> <shas> <status>'
+    # followed by the path
+    parsed: list[tuple[str, int, str, list[tuple[str, Optional[str]]], set[str]]] = []
+    fields = iter(output.split("\0"))
+    for field in fields:
+        if not field:
+            header = next(fields, "")
+            if header:
+                sha, timestamp, subject = (header.split(" ", 2) + [""])[:3]
+                parsed.append((sha, int(timestamp), subject, [], set()))
+            continue
+
+        path = next(fields)
+        old_mode, new_mode, _, new_sha, _ = field.lstrip("\n")[1:].split(" ")
+        _, _, _, changes, added_or_removed = parsed[-1]
+        was_file = old_mode not in _ABSENT_MODES
+        is_file = new_mode not in _ABSENT_MODES
+        changes.append((path, new_sha if is_file else None))
+        if was_file != is_file:
+            added_or_removed.add(path)
+
+    sizes = _blob_sizes(
+        project_path, {sha for *_, changes, _ in parsed for _, sha in changes if sha}
+    )
+    return [
+        HistoryCommit(
+            sha,
+            timestamp,
+            subject,
+            [(path, (blob, sizes[blob]) if blob else None) for path, blob in changes],
+            frozenset(added_or_removed),
+        )
+        for sha, timestamp, subject, changes, added_or_removed in parsed
+    ]
+
+
+def _blob_sizes(project_path: Path, shas: set[str]) -> dict[str, int]:
+    """Sizes of blobs, looked up with one git cat-file --batch-check"""
+    if not shas:
+        return {}
+    output = git(project_path, "cat-file", "--batch-check", input="\n".join(shas) + "\n")
+    sizes = {}
+    for line in output.splitlines():
+        sha, _, size = line.split(" ")
+        sizes[sha] = int(size)
+    return sizes
+
+
+class _Fingerprints:
+    """Fingerprints of probed paths at one commit, computed once each"""
+
+    def __init__(self, fs: GitTreeFileSystem) -> None:
+        self.fs = fs
+        self._seen: dict[Probe, str] = {}
+
+    def __call__(self, probe: Probe) -> str:
+        fingerprint = self._seen.get(probe)
+        if fingerprint is None:
+            fingerprint = self._seen[probe] = self._compute(*probe)
+        return fingerprint
+
+    def _compute(self, kind: str, path: str) -> str:
+        if kind == PROBE_LIST:
+            listing = next(self.fs.walk(path), None)
+            if listing is None:
+                return "file" if self.fs.exists(path) else "missing"
+            _, dirnames, filenames = listing
+            names = "\0".join(dirnames) + "\0/\0" + "\0".join(filenames)
+            return hashlib.sha256(names.encode(errors="surrogateescape")).hexdigest()
+
+        sha = self.fs.blob_sha(path)
+        if sha is not None:
+            return "file" if kind == PROBE_EXISTS else sha
+        return "dir" if self.fs.exists(path) else "missing"
+
+
+class _ResultMemo:
+    """Every result of each check, keyed by fingerprints of what it probed"""
+
+    def __init__(self) -> None:
+        # Check position -> probes (sorted) -> their fingerprints -> result
+        self._entries: dict[int, dict[tuple[Probe, ...], dict[tuple[str, ...], CheckResult]]] = {}
+
+    def lookup(
+        self, index: int, fingerprints: _Fingerprints
+    ) -> Optional[tuple[CheckResult, set[Probe]]]:
+        for probes, results in self._entries.get(index, {}).items():
+            result = results.get(tuple(fingerprints(probe) for probe in probes))
+            if result is not None:
+                return result, set(probes)
+        return None
+
+    def store(
+        self, index: int, probes: set[Probe], fingerprints: _Fingerprints, result: CheckResult
+    ) -> None:
+        ordered = tuple(sorted(probes))
+        key = tuple(fingerprints(probe) for probe in ordered)
+        self._entries.setdefault(index, {}).setdefault(ordered, {})[key] = result
+
+
+class _Touched:
+    """Which probes a commit's changes could give a different fingerprint"""
+
+    def __init__(self, commit: HistoryCommit) -> None:
+        self.changed = {path for path, _ in commit.changes}
+        self.added_or_removed = commit.added_or_removed
+        # Directories whose entries may have changed
+        self.relisted: set[str] = set()
+        for path in commit.added_or_removed:
+            parts = path.split("/")
+            self.relisted.add(".")
+            self.relisted.update("/".join(parts[:i]) for i in range(1, len(parts)))
+
+    def __call__(self, probes: set[Probe]) -> bool:
+        for kind, path in probes:
+            path = _normalize(path) or "."
+            if kind == PROBE_LIST:
+                if path in self.relisted:
+                    return True
+            elif kind == PROBE_EXISTS:
+                if path in self.added_or_removed or path in self.relisted:
+                    return True
+            elif path in self.changed:
+                return True
+        return False
+
+
+class ComplianceHistory:
+    """Evaluates a check plan at every commit of a range"""
+
+    def __init__(self, plan: CheckPlan) -> None:
+        """
+        Initialize a history run.
+
+        Args:
+            plan: Checks to run and the compliance level to evaluate
+        """
+        self.plan = plan
+        self.checks_run = 0
+        self.checks_reused = 0
+
+    def run(
+        self,
+        project_path: Path,
+        revisions: str = "HEAD",
+        on_point: Optional[PointCallback] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Evaluate every commit of a range.
+
+        Args:
+            project_path: Project directory inside a git work tree
+            revisions: Revision range, e.g. 'HEAD' or 'v1.0..main'
+            on_point: Called with each commit's point as soon as it is ready
+
+        Returns:
+            One point per commit, oldest first, from point()
+
+        Raises:
+            RuntimeError: If git fails, e.g. on a bad range
+        """
+        commits = commit_log(project_path, revisions)
+        if not commits:
+            return []
+
+        engine = self.plan.engine
+        memo = _ResultMemo()
+        # Result and probes of each check at the previous commit
+        last: dict[int, tuple[CheckResult, set[Probe]]] = {}
+        points = []
+
+        fs = GitTreeFileSystem(project_path, commits[0].sha)
+        try:
+            for position, commit in enumerate(commits):
+                if position > 0:
+                    fs.advance(commit.sha, commit.timestamp, commit.changes)
+                fingerprints = _Fingerprints(fs)
+                touched = _Touched(commit)
+
+                results: dict[int, CheckResult] = {}
+                to_run = []
+                for index in self.plan.indexes:
+                    if not engine.checks[index].cacheable:
+                        to_run.append(index)
+                        continue
+                    previous = last.get(index)
+                    if previous is None or touched(previous[1]):
+                        previous = memo.lookup(index, fingerprints)
+                    if previous is None:
+                        to_run.append(index)
+                    else:
+                        results[index] = previous[0]
+                        last[index] = previous
+
+                outcomes = engine.execute(project_path, indexes=to_run, fs=fs) if to_run else []
+                for index, (result, probes) in zip(to_run, outcomes):
+                    results[index] = result
+                    # Timeouts say nothing about the content
+                    if engine.checks[index].cacheable and result.status != CheckStatus.TIMEOUT:
+                        memo.store(index, probes, fingerprints, result)
+                        last[index] = (result, probes)
+
+                self.checks_run += len(to_run)
+                self.checks_reused += len(self.plan.indexes) - len(to_run)
+
+                progress = self.plan.progress()
+                if progress is not None:
+                    for index in self.plan.indexes:
+                        progress.add(engine.checks[index], results[index])
+                data = point(commit, self.plan.report(results, progress), len(to_run))
+                if on_point is not None:
+                    on_point(data)
+                points.append(data)
+        finally:
+            fs.close()
+
+        return points
+
+
+def point(commit: HistoryCommit, report: dict[str, Any], checks_run: int) -> dict[str, Any]:
+    """
+    One commit's entry in the time series.
+
+    Args:
+        commit: The commit
+        report: Report for the commit from CheckPlan.report
+        checks_run: How many checks had to run rather than being reused
+
+    Returns:
+        Flat summary of the report with the commit's SHA, date and subject
+    """
+    data: dict[str, Any] = {
+        "commit": commit.sha,
+        "date": datetime.fromtimestamp(commit.timestamp, timezone.utc).isoformat(),
+        "subject": commit.subject,
+        "overall_status": report["overall_status"],
+        "pass_rate": report["pass_rate"],
+        "total_checks": report["total_checks"],
+        "checks_passed": report["checks_passed"],
+        "checks_failed": report["checks_failed"],
+        "checks_skipped": report["checks_skipped"],
+        "checks_timed_out": report["checks_timed_out"],
+    }
+    if "compliance" in report:
+        data["compliance_reached"] = report["compliance"]["reached"]
+    data["principles"] = {p["id"]: p["status"] for p in report["principles"]}
+    data["checks_run"] = checks_run
+    return data
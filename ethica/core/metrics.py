@@ -0,0 +1,128 @@
+# ABOUTME: Per-check timing and I/O metrics, run hooks and the profile report
+# ABOUTME: Lets slow runs be traced to the checks and principles responsible
+
+"""
+Check instrumentation.
+
+Every check run by the engine is timed (wall and CPU) and the project I/O it
+makes through ProjectContext is counted. Metrics are attached to results when
+the engine profiles, and are always passed to any registered CheckHook, e.g.
+to forward spans to a tracing system.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from ethica.checks.base import BaseCheck, CheckResult
+
+
+class IOCounters:
+    """Project I/O made while a measurement scope is active"""
+
+    def __init__(self) -> None:
+        self.stats = 0
+        self.bytes_read = 0
+
+
+class CheckMetrics:
+    """Cost of running one check"""
+
+    def __init__(
+        self,
+        wall_time: float,
+        cpu_time: float,
+        files_stat: int,
+        bytes_read: int,
+        cached: bool = False,
+    ) -> None:
+        """
+        Initialize metrics.
+
+        Args:
+            wall_time: Elapsed seconds
+            cpu_time: CPU seconds used by the thread running the check
+            files_stat: Project paths stat'ed
+            bytes_read: Bytes of project files read
+            cached: Whether the result came from the result cache
+        """
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.files_stat = files_stat
+        self.bytes_read = bytes_read
+        self.cached = cached
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to dictionary"""
+        return {
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "files_stat": self.files_stat,
+            "bytes_read": self.bytes_read,
+            "cached": self.cached,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CheckMetrics":
+        """Rebuild metrics from to_dict output"""
+        return cls(
+            wall_time=data["wall_time"],
+            cpu_time=data["cpu_time"],
+            files_stat=data["files_stat"],
+            bytes_read=data["bytes_read"],
+            cached=data.get("cached", False),
+        )
+
+
+class CheckHook:
+    """
+    Callbacks around each check run.
+
+    Subclass and override either method. With concurrent jobs, hooks are
+    called from worker threads, so implementations must be thread-safe.
+    """
+
+    def on_check_start(self, check: "BaseCheck") -> None:
+        """Called just before a check runs (or is looked up in the cache)"""
+
+    def on_check_finish(
+        self, check: "BaseCheck", result: "CheckResult", metrics: CheckMetrics
+    ) -> None:
+        """Called with the result and its metrics once a check completes"""
+
+
+def profile_report(results: dict[str, Any], limit: Optional[int] = 10) -> dict[str, Any]:
+    """
+    Rank the slowest checks and principles of a profiled run.
+
+    Args:
+        results: Report from a profiling engine's run_checks
+        limit: Number of checks to list (None for all)
+
+    Returns:
+        Dict with "checks" (slowest first, with principle and metrics),
+        "principles" (summed metrics, slowest first) and "total" metrics
+    """
+    checks = []
+    principles = []
+    total: dict[str, Any] = {"wall_time": 0.0, "cpu_time": 0.0, "files_stat": 0, "bytes_read": 0}
+
+    for principle in results["principles"]:
+        sums: dict[str, Any] = {"id": principle["id"], **dict.fromkeys(total, 0)}
+        for check in principle.get("checks", []):
+            metrics = check.get("metrics")
+            if metrics is None:
+                continue
+            checks.append({"id": check["id"], "principle": principle["id"], **metrics})
+            for key in total:
+                sums[key] += metrics[key]
+                total[key] += metrics[key]
+        principles.append(sums)
+
+    checks.sort(key=lambda c: c["wall_time"], reverse=True)
+    principles.sort(key=lambda p: p["wall_time"], reverse=True)
+
+    return {
+        "checks": checks if limit is None else checks[:limit],
+        "principles": principles,
+        "total": total,
+    }
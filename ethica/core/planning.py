@@ -0,0 +1,281 @@
+# ABOUTME: Compliance-level planning: which checks a level needs and whether it was reached
+# ABOUTME: Prunes unneeded checks, runs cheap checks first and can stop once a level is lost
+
+"""
+Compliance-level-aware check planning.
+
+A framework's compliance_levels name the principles each level requires and
+the minimum share of checks that must pass. A level is reached when no
+error-severity check of a required principle fails and the pass rate over
+the level's checks meets the minimum. Checks of principles a level doesn't
+require are not run.
+"""
+
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from ethica.checks.base import BaseCheck, CheckResult, CheckSeverity, CheckStatus
+from ethica.core.cache import ResultCache
+from ethica.core.summary import SummaryReducer
+from ethica.core.vfs import FileSystem
+
+if TYPE_CHECKING:
+    from ethica.core.checker import CheckEngine, ResultCallback
+
+
+class ComplianceLevel:
+    """Requirements of one compliance level of a framework"""
+
+    def __init__(
+        self,
+        level_id: str,
+        name: str,
+        required_principles: Optional[list[str]],
+        minimum_pass_rate: float,
+    ) -> None:
+        """
+        Initialize a level.
+
+        Args:
+            level_id: Level ID, e.g. 'standard'
+            name: Display name
+            required_principles: Principle IDs the level requires (None for all)
+            minimum_pass_rate: Share of the level's checks that must pass
+        """
+        self.id = level_id
+        self.name = name
+        self.required_principles = required_principles
+        self.minimum_pass_rate = minimum_pass_rate
+
+    @classmethod
+    def from_framework(cls, framework_spec: dict[str, Any], level_id: str) -> "ComplianceLevel":
+        """
+        Look up a level in a framework spec.
+
+        Args:
+            framework_spec: Complete framework specification
+            level_id: Level to look up
+
+        Returns:
+            The level
+
+        Raises:
+            ValueError: If the framework doesn't define the level
+        """
+        levels = framework_spec.get("compliance_levels", {})
+        if level_id not in levels:
+            available = ", ".join(levels) or "none"
+            raise ValueError(
+                f"Unknown compliance level '{level_id}' for "
+                f"{framework_spec['metadata']['id']}. Available: {available}"
+            )
+
+        level = levels[level_id]
+        required = level.get("required_principles", "all")
+        return cls(
+            level_id,
+            level.get("name", level_id),
+            None if required == "all" else list(required),
+            float(level.get("minimum_check_pass_rate", 0.0)),
+        )
+
+    def requires(self, principle: str) -> bool:
+        """Whether checks of a principle count towards this level"""
+        return self.required_principles is None or principle in self.required_principles
+
+
+class LevelProgress:
+    """Tracks whether a level is still reachable as check results arrive"""
+
+    def __init__(self, level: ComplianceLevel, planned: int) -> None:
+        """
+        Initialize progress for a run.
+
+        Args:
+            level: Level being checked
+            planned: Number of checks the level needs
+        """
+        self.level = level
+        self.planned = planned
+        self.passed = 0
+        self.completed = 0
+        # Required principles with a failed or timed-out error-severity check
+        self.unmet_principles: list[str] = []
+
+    def add(self, check: BaseCheck, result: CheckResult) -> None:
+        """Count one completed check"""
+        self.completed += 1
+        if result.status == CheckStatus.PASSED:
+            self.passed += 1
+        elif (
+            result.status in (CheckStatus.FAILED, CheckStatus.TIMEOUT)
+            and result.severity == CheckSeverity.ERROR
+            and check.principle not in self.unmet_principles
+        ):
+            self.unmet_principles.append(check.principle)
+
+    @property
+    def reachable(self) -> bool:
+        """Whether the level can still be reached if every remaining check passes"""
+        if self.unmet_principles:
+            return False
+        best_case = self.passed + (self.planned - self.completed)
+        return best_case >= math.ceil(self.level.minimum_pass_rate * self.planned - 1e-9)
+
+    def evaluate(self) -> dict[str, Any]:
+        """The level's outcome for the checks seen so far"""
+        pass_rate = self.passed / self.planned if self.planned else 0.0
+        return {
+            "id": self.level.id,
+            "name": self.level.name,
+            "reached": self.completed == self.planned and self.reachable,
+            "pass_rate": pass_rate,
+            "minimum_pass_rate": self.level.minimum_pass_rate,
+            "unmet_principles": list(self.unmet_principles),
+            "checks_planned": self.planned,
+            "checks_run": self.completed,
+        }
+
+
+class CheckPlan:
+    """The checks a compliance level needs, cheapest first"""
+
+    def __init__(self, engine: "CheckEngine", level: Optional[ComplianceLevel] = None) -> None:
+        """
+        Plan a run.
+
+        Args:
+            engine: Engine with the framework loaded
+            level: Level to plan for (default: run every check and don't
+                evaluate a level)
+        """
+        self.engine = engine
+        self.level = level
+        needed = [
+            i
+            for i, check in enumerate(engine.checks)
+            if level is None or level.requires(check.principle)
+        ]
+        # sorted() is stable, so equal-cost checks keep framework order
+        self.indexes = sorted(needed, key=lambda i: engine.checks[i].cost)
+        self.pruned = len(engine.checks) - len(needed)
+
+    def progress(self) -> Optional[LevelProgress]:
+        """Fresh level tracking for one run, or None without a level"""
+        return LevelProgress(self.level, len(self.indexes)) if self.level is not None else None
+
+    def run(
+        self,
+        project_path: Path,
+        cache: Optional[ResultCache] = None,
+        on_result: Optional["ResultCallback"] = None,
+        fail_fast: bool = False,
+        fs: Optional[FileSystem] = None,
+    ) -> dict[str, Any]:
+        """
+        Run the planned checks and evaluate the level.
+
+        Args:
+            project_path: Path to project directory
+            cache: Result cache for the project
+            on_result: Called with each check and result as it completes
+            fail_fast: Stop starting checks once the level can't be reached
+            fs: Filesystem to read the project through
+
+        Returns:
+            Report from report()
+        """
+        progress = self.progress()
+        positions = {id(self.engine.checks[i]): i for i in self.indexes}
+        results: dict[int, CheckResult] = {}
+
+        def record(check: BaseCheck, result: CheckResult) -> None:
+            results[positions[id(check)]] = result
+            if progress is not None:
+                progress.add(check, result)
+            if on_result is not None:
+                on_result(check, result)
+
+        def unreachable(check: BaseCheck, result: CheckResult) -> bool:
+            return progress is not None and not progress.reachable
+
+        self.engine.execute(
+            project_path,
+            cache=cache,
+            indexes=self.indexes,
+            on_result=record,
+            until=unreachable if fail_fast and progress is not None else None,
+            fs=fs,
+        )
+        return self.report(results, progress)
+
+    def report(
+        self, results: dict[int, CheckResult], progress: Optional[LevelProgress]
+    ) -> dict[str, Any]:
+        """
+        Build the report for a run of this plan.
+
+        Args:
+            results: Result of each check that ran, by position in engine.checks
+            progress: Level tracking fed with the same results
+
+        Returns:
+            Report in the shape run_checks returns, over the checks that ran
+            and in framework order, plus a "compliance" entry with the
+            level's outcome when there is a level
+        """
+        report = self._reduce(results).summary()
+        compliance = self._compliance(progress)
+        if compliance is not None:
+            report["compliance"] = compliance
+        return report
+
+    def summarize(
+        self, results: dict[int, CheckResult]
+    ) -> tuple[SummaryReducer, Optional[dict[str, Any]]]:
+        """
+        Counters and the level's outcome for results of every planned check,
+        e.g. when some were reused rather than run.
+
+        Args:
+            results: Result of each planned check, by position in engine.checks
+
+        Returns:
+            Reducer over the checks in framework order, and the "compliance"
+            entry report() would add (None without a level)
+        """
+        progress = self.progress()
+        if progress is not None:
+            for index in self.indexes:
+                progress.add(self.engine.checks[index], results[index])
+        return self._reduce(results), self._compliance(progress)
+
+    def evaluate(self, results: dict[int, CheckResult]) -> dict[str, Any]:
+        """
+        Build the report for results of every planned check.
+
+        Args:
+            results: Result of each planned check, by position in engine.checks
+
+        Returns:
+            Report in the shape report() returns
+        """
+        reducer, compliance = self.summarize(results)
+        report = reducer.summary()
+        if compliance is not None:
+            report["compliance"] = compliance
+        return report
+
+    def _reduce(self, results: dict[int, CheckResult]) -> SummaryReducer:
+        ran = sorted(results)
+        return self.engine.reduce([results[i] for i in ran], indexes=ran)
+
+    def _compliance(self, progress: Optional[LevelProgress]) -> Optional[dict[str, Any]]:
+        if progress is None:
+            return None
+        return {
+            **progress.evaluate(),
+            "checks_pruned": self.pruned,
+            "stopped_early": progress.completed < progress.planned,
+        }
@@ -0,0 +1,236 @@
+# ABOUTME: Discovery and lazy loading of check types provided by installed plugins
+# ABOUTME: Keeps a cached index of entry points so discovery costs nothing at startup
+
+"""
+Check type plugins.
+
+Packages provide check types through the ``ethica.checks`` entry point group,
+mapping a type name to a BaseCheck subclass:
+
+    [project.entry-points."ethica.checks"]
+    license-header = "acme_checks:LicenseHeaderCheck"
+
+Scanning installed distributions for entry points is slow, so the type names
+and their targets are cached in the user cache directory and only rebuilt when
+a sys.path directory changes, e.g. because a package was installed. A plugin
+module is imported the first time a loaded framework uses one of its types.
+"""
+
+import json
+import os
+import sys
+import threading
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Optional
+
+from ethica import __version__
+from ethica.checks.base import BaseCheck, CheckResult, CheckStatus
+from ethica.core.context import ProjectContext
+from ethica.utils.paths import user_cache_dir
+
+ENTRY_POINT_GROUP = "ethica.checks"
+
+# Bumped whenever the index file layout changes
+_FORMAT = 2
+
+_index: Optional["PluginIndex"] = None
+_loaded: dict[str, type[BaseCheck]] = {}
+_lock = threading.Lock()
+
+
+class PluginError(Exception):
+    """A plugin check type that can't be used"""
+
+
+class PluginIndex:
+    """Check type names provided by installed plugins and where to load them from"""
+
+    def __init__(self, entries: dict[str, str], versions: Optional[dict[str, str]] = None) -> None:
+        """
+        Initialize an index.
+
+        Args:
+            entries: Target ('module:attribute') of each check type
+            versions: Name and version of the distribution providing each
+                check type, where known
+        """
+        self.entries = entries
+        self.versions = versions or {}
+
+    def __contains__(self, check_type: str) -> bool:
+        return check_type in self.entries
+
+    @classmethod
+    def discover(cls) -> "PluginIndex":
+        """Build the index by scanning installed distributions"""
+        from importlib.metadata import entry_points
+
+        if sys.version_info >= (3, 10):
+            group = entry_points(group=ENTRY_POINT_GROUP)
+        else:
+            # Python 3.9 returns a dict of groups
+            group = entry_points().get(ENTRY_POINT_GROUP, [])
+
+        entries: dict[str, str] = {}
+        versions: dict[str, str] = {}
+        for entry_point in group:
+            # Earlier sys.path entries win, as they would on import
+            if entry_point.name in entries:
+                continue
+            entries[entry_point.name] = entry_point.value
+            # EntryPoint.dist is new in Python 3.10
+            dist = getattr(entry_point, "dist", None)
+            if dist is not None:
+                versions[entry_point.name] = f"{dist.name} {dist.version}"
+        return cls(entries, versions)
+
+    @classmethod
+    def load(cls, cache_path: Optional[Path] = None) -> "PluginIndex":
+        """
+        Load the cached index, rebuilding it if the environment changed.
+
+        Args:
+            cache_path: Index file (default: plugins.json in the user cache dir)
+
+        Returns:
+            The index
+        """
+        cache_path = cache_path or user_cache_dir() / "plugins.json"
+        signature = _environment_signature()
+
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached["format"] == _FORMAT and cached["signature"] == signature:
+                return cls(dict(cached["entries"]), dict(cached["versions"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        index = cls.discover()
+        document = {
+            "format": _FORMAT,
+            "signature": signature,
+            "entries": index.entries,
+            "versions": index.versions,
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(document))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # An unwritable cache dir just means discovering every time
+            pass
+        return index
+
+    def provider(self, check_type: str) -> str:
+        """
+        What implements a check type: its target and, where known, the
+        name and version of the distribution providing it.
+
+        Args:
+            check_type: Check type name
+
+        Returns:
+            e.g. 'acme_checks:LicenseCheck (acme-checks 1.0)'
+        """
+        target = self.entries.get(check_type, "")
+        version = self.versions.get(check_type)
+        return f"{target} ({version})" if version else target
+
+    def load_check_type(self, check_type: str) -> type[BaseCheck]:
+        """
+        Import the class implementing a check type.
+
+        Args:
+            check_type: Check type name
+
+        Returns:
+            BaseCheck subclass
+
+        Raises:
+            PluginError: If no plugin provides the type or it can't be loaded
+        """
+        target = self.entries.get(check_type)
+        if target is None:
+            raise PluginError(
+                f"Unknown check type '{check_type}'. Is the plugin that provides it installed?"
+            )
+
+        module_name, _, attribute = target.partition(":")
+        try:
+            value: Any = import_module(module_name.strip())
+            for part in attribute.strip().split(".") if attribute else []:
+                value = getattr(value, part)
+        except Exception as e:
+            raise PluginError(f"Could not load check type '{check_type}' from {target}: {e}") from e
+
+        if not (isinstance(value, type) and issubclass(value, BaseCheck)):
+            raise PluginError(f"Check type '{check_type}' ({target}) is not a BaseCheck subclass")
+        return value
+
+
+def _environment_signature() -> list[list[Any]]:
+    """Identity of the installed distributions: each sys.path entry and its mtime"""
+    signature: list[list[Any]] = [["ethica", __version__]]
+    for entry in sys.path:
+        try:
+            # Installing or removing a package adds or removes a .dist-info
+            # directory, which bumps its parent's mtime
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        signature.append([entry, mtime])
+    return signature
+
+
+def plugin_index() -> PluginIndex:
+    """The process-wide plugin index, loaded on first use"""
+    global _index
+    with _lock:
+        if _index is None:
+            _index = PluginIndex.load()
+        return _index
+
+
+def resolve_check_type(check_type: str) -> type[BaseCheck]:
+    """
+    Class for a check type provided by a plugin, importing it on first use.
+
+    Args:
+        check_type: Check type name
+
+    Returns:
+        BaseCheck subclass
+
+    Raises:
+        PluginError: If no plugin provides the type or it can't be loaded
+    """
+    check_class = _loaded.get(check_type)
+    if check_class is None:
+        check_class = plugin_index().load_check_type(check_type)
+        _loaded[check_type] = check_class
+    return check_class
+
+
+def reset() -> None:
+    """Forget the loaded index and classes, e.g. after installing a plugin"""
+    global _index
+    with _lock:
+        _index = None
+        _loaded.clear()
+
+
+class UnavailableCheck(BaseCheck):
+    """Stands in for a check whose type can't be loaded and reports why"""
+
+    # Installing the plugin must take effect on the next run
+    cacheable = False
+
+    def __init__(self, check_spec: dict[str, Any], reason: str) -> None:
+        super().__init__(check_spec)
+        self.reason = reason
+
+    def run(self, project_path: Path, context: Optional[ProjectContext] = None) -> CheckResult:
+        """Skip with the reason the check type is unavailable"""
+        return self._create_result(CheckStatus.SKIPPED, self.reason)
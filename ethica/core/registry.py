@@ -1,64 +1,142 @@
 # ABOUTME: Framework registry for loading and managing ethics frameworks
-# ABOUTME: Provides access to built-in and custom frameworks
+# ABOUTME: Merges built-in, user and project registries into hash indexes for O(1) lookup
 
 """
 Framework registry for loading ethics framework specifications.
 """
 
-import yaml
 from pathlib import Path
 from typing import Any, Optional
 
+from ethica.core.spec_cache import load_yaml
+from ethica.utils.paths import PROJECT_DIRNAME, user_config_dir
+
+REGISTRY_FILENAME = "registry.yaml"
+
+
+def default_search_paths(project_path: Optional[Path] = None) -> list[Path]:
+    """
+    Registry files searched when none is given, lowest precedence first.
+
+    Args:
+        project_path: Project whose registry comes last (default: current directory)
+
+    Returns:
+        Built-in, user and project registry paths
+    """
+    package_dir = Path(__file__).parent.parent.parent
+    return [
+        package_dir / "frameworks" / REGISTRY_FILENAME,
+        user_config_dir() / "frameworks" / REGISTRY_FILENAME,
+        (project_path or Path.cwd()) / PROJECT_DIRNAME / "frameworks" / REGISTRY_FILENAME,
+    ]
+
 
 class FrameworkRegistry:
     """Registry for managing ethics frameworks"""
 
-    def __init__(self, registry_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        registry_path: Optional[Path] = None,
+        search_paths: Optional[list[Path]] = None,
+    ) -> None:
         """
         Initialize the framework registry.
 
         Args:
-            registry_path: Path to registry.yaml. If None, uses built-in registry.
+            registry_path: Path to registry.yaml. If None, uses built-in registry
+                merged with the user and project registries.
+            search_paths: Registry files to merge, lowest precedence first.
+                Overrides registry_path and the default search paths.
         """
-        if registry_path is None:
-            # Default to built-in frameworks directory
-            package_dir = Path(__file__).parent.parent.parent
-            self.frameworks_dir = package_dir / "frameworks"
-            registry_path = self.frameworks_dir / "registry.yaml"
-        else:
-            self.frameworks_dir = registry_path.parent
-            registry_path = Path(registry_path)
+        if search_paths is None:
+            search_paths = [Path(registry_path)] if registry_path else default_search_paths()
 
-        self.registry_path = registry_path
+        self.search_paths = [Path(p) for p in search_paths]
+        self.registry_path = self.search_paths[0]
+        self.frameworks_dir = self.registry_path.parent
+        self._signature: tuple[Any, ...] = ()
         self._load_registry()
 
     def _load_registry(self) -> None:
-        """Load the framework registry from YAML"""
-        if not self.registry_path.exists():
-            # If no registry exists, create an empty one
-            self.registry: dict[str, Any] = {"frameworks": {}}
-            return
+        """Load every registry file and build the lookup indexes"""
+        self.registry: dict[str, Any] = {"frameworks": {}}
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._dirs: dict[str, Path] = {}
+        self._by_tag: dict[str, list[str]] = {}
+        self._by_category: dict[str, list[str]] = {}
+
+        for registry_path in self.search_paths:
+            if not registry_path.exists():
+                continue
+
+            registry = load_yaml(registry_path) or {}
+            for category, fw_list in (registry.get("frameworks") or {}).items():
+                # Skip empty categories (where fw_list is None)
+                if fw_list is None:
+                    continue
+                for fw in fw_list:
+                    entry = fw.copy()
+                    entry["category"] = category
+                    # Later search paths override earlier ones
+                    self._by_id[entry["id"]] = entry
+                    self._dirs[entry["id"]] = registry_path.parent
+
+        for framework_id, entry in self._by_id.items():
+            self.registry["frameworks"].setdefault(entry["category"], []).append(entry)
+            self._by_category.setdefault(entry["category"], []).append(framework_id)
+            for tag in entry.get("tags") or []:
+                self._by_tag.setdefault(tag, []).append(framework_id)
+
+        self._signature = self._stat_signature()
+
+    def _stat_signature(self) -> tuple[Any, ...]:
+        """Identity of every registry file, for cheap change detection"""
+        signature: list[tuple[str, Optional[int], Optional[int]]] = []
+        for registry_path in self.search_paths:
+            try:
+                st = registry_path.stat()
+                signature.append((str(registry_path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((str(registry_path), None, None))
+        return tuple(signature)
+
+    def refresh(self) -> bool:
+        """
+        Rebuild the indexes if any registry file was added, removed or changed.
 
-        with open(self.registry_path, "r") as f:
-            self.registry = yaml.safe_load(f) or {"frameworks": {}}
+        Returns:
+            True if the registry was reloaded
+        """
+        if self._stat_signature() == self._signature:
+            return False
+        self._load_registry()
+        return True
 
-    def list_frameworks(self) -> list[dict[str, Any]]:
+    def list_frameworks(
+        self, tag: Optional[str] = None, category: Optional[str] = None
+    ) -> list[dict[str, Any]]:
         """
         List all available frameworks.
 
+        Args:
+            tag: Only include frameworks with this tag
+            category: Only include frameworks in this category
+
         Returns:
             List of framework metadata dictionaries
         """
-        frameworks = []
-        for category, fw_list in self.registry.get("frameworks", {}).items():
-            # Skip empty categories (where fw_list is None)
-            if fw_list is None:
-                continue
-            for fw in fw_list:
-                fw_copy = fw.copy()
-                fw_copy["category"] = category
-                frameworks.append(fw_copy)
-        return frameworks
+        if tag is not None and category is not None:
+            in_category = set(self._by_category.get(category, []))
+            ids = [i for i in self._by_tag.get(tag, []) if i in in_category]
+        elif tag is not None:
+            ids = self._by_tag.get(tag, [])
+        elif category is not None:
+            ids = self._by_category.get(category, [])
+        else:
+            ids = list(self._by_id)
+
+        return [self._by_id[framework_id].copy() for framework_id in ids]
 
     def get_framework(self, framework_id: str) -> Optional[dict[str, Any]]:
         """
@@ -70,13 +148,8 @@ class FrameworkRegistry:
         Returns:
             Framework metadata or None if not found
         """
-        for category, fw_list in self.registry.get("frameworks", {}).items():
-            for fw in fw_list:
-                if fw["id"] == framework_id:
-                    fw_copy = fw.copy()
-                    fw_copy["category"] = category
-                    return fw_copy
-        return None
+        entry = self._by_id.get(framework_id)
+        return entry.copy() if entry is not None else None
 
     def load_framework_spec(self, framework_id: str) -> dict[str, Any]:
         """
@@ -92,25 +165,14 @@ class FrameworkRegistry:
             ValueError: If framework not found
             FileNotFoundError: If framework file doesn't exist
         """
-        framework = self.get_framework(framework_id)
-        if not framework:
-            raise ValueError(
-                f"Framework '{framework_id}' not found in registry. "
-                f"Available frameworks: {', '.join(f['id'] for f in self.list_frameworks())}"
-            )
-
-        # Construct path to framework spec
-        spec_path = self.frameworks_dir / framework_id / "framework.yaml"
+        spec_path = self.get_framework_dir(framework_id) / "framework.yaml"
 
         if not spec_path.exists():
             raise FileNotFoundError(
                 f"Framework specification not found at {spec_path}"
             )
 
-        with open(spec_path, "r") as f:
-            spec = yaml.safe_load(f)
-
-        return spec
+        return load_yaml(spec_path)  # type: ignore[no-any-return]
 
     def get_framework_dir(self, framework_id: str) -> Path:
         """
@@ -125,8 +187,11 @@ class FrameworkRegistry:
         Raises:
             ValueError: If framework not found
         """
-        framework = self.get_framework(framework_id)
-        if not framework:
-            raise ValueError(f"Framework '{framework_id}' not found")
+        registry_dir = self._dirs.get(framework_id)
+        if registry_dir is None:
+            raise ValueError(
+                f"Framework '{framework_id}' not found in registry. "
+                f"Available frameworks: {', '.join(self._by_id)}"
+            )
 
-        return self.frameworks_dir / framework_id
+        return registry_dir / framework_id
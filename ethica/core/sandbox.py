@@ -0,0 +1,259 @@
+# ABOUTME: Runs plugin checks in reusable worker subprocesses with time and memory limits
+# ABOUTME: A check that hangs or exhausts memory times out instead of stalling the run
+
+"""
+Sandboxed execution of untrusted checks.
+
+Check types from plugins and custom checks can do anything, including loop
+forever. The engine runs them in a small pool of worker subprocesses. Each
+worker caps its own memory with resource.setrlimit, the parent bounds how long
+it waits for each check, and a worker that overruns is killed and replaced.
+
+Linux doesn't enforce RLIMIT_RSS, so the memory limit caps the address space
+the check may add on top of what the worker had mapped when it started.
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Optional
+
+from ethica.checks.base import BaseCheck, CheckResult, CheckStatus
+from ethica.core.context import Probe, ProjectContext
+from ethica.core.metrics import CheckMetrics
+from ethica.core.vfs import FileSystem
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Defaults for 'ethica check'
+DEFAULT_CHECK_TIMEOUT = 60.0
+DEFAULT_CHECK_MEMORY_MB = 1024
+
+
+class SandboxLimits:
+    """Bounds on sandboxed checks and on a whole run"""
+
+    def __init__(
+        self,
+        check_timeout: Optional[float] = DEFAULT_CHECK_TIMEOUT,
+        check_memory_mb: Optional[int] = DEFAULT_CHECK_MEMORY_MB,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize limits.
+
+        Args:
+            check_timeout: Wall-clock seconds each sandboxed check may take
+                (None for no limit)
+            check_memory_mb: Memory each sandboxed check may allocate
+                (None for no limit)
+            deadline: Wall-clock seconds for the whole run. Checks still
+                running or not started by then time out. (None for no limit)
+        """
+        self.check_timeout = check_timeout
+        self.check_memory_mb = check_memory_mb
+        self.deadline = deadline
+
+
+def aborted_result(check: BaseCheck, status: CheckStatus, message: str) -> CheckResult:
+    """Result for a check that was stopped or couldn't finish"""
+    return CheckResult(
+        check_id=check.check_id,
+        name=check.name,
+        status=status,
+        message=message,
+        severity=check.severity,
+    )
+
+
+class _Worker:
+    """One worker subprocess and the parent's end of its pipe"""
+
+    def __init__(self, memory_mb: Optional[int]) -> None:
+        context = multiprocessing.get_context()
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, memory_mb), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        """Stop the worker, whatever it is doing"""
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        """Ask an idle worker to exit"""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class SandboxPool:
+    """Reusable worker subprocesses that run checks under limits"""
+
+    def __init__(
+        self, limits: SandboxLimits, workers: int = 1, deadline_at: Optional[float] = None
+    ) -> None:
+        """
+        Initialize a pool. Workers are started on first use.
+
+        Args:
+            limits: Per-check limits
+            workers: Most checks to run at once
+            deadline_at: time.monotonic() value at which the run times out
+        """
+        self.limits = limits
+        self.workers = max(1, workers)
+        self.deadline_at = deadline_at
+        self._idle: "queue.SimpleQueue[_Worker]" = queue.SimpleQueue()
+        # Held while a check runs, so at most `workers` workers are busy
+        self._slots = threading.BoundedSemaphore(self.workers)
+
+    def __enter__(self) -> "SandboxPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def run(
+        self, check: BaseCheck, project_path: Path, fs: Optional[FileSystem] = None
+    ) -> tuple[CheckResult, set[Probe], CheckMetrics, bool]:
+        """
+        Run a check in a worker.
+
+        Args:
+            check: Check to run
+            project_path: Project directory
+            fs: Filesystem the worker reads the project through
+
+        Returns:
+            (result, probes, metrics, complete). complete is False when the
+            check was stopped by a limit, in which case the result is a
+            timeout or skip that mustn't be cached.
+        """
+        with self._slots:
+            return self._run(check, project_path, fs)
+
+    def _run(
+        self, check: BaseCheck, project_path: Path, fs: Optional[FileSystem]
+    ) -> tuple[CheckResult, set[Probe], CheckMetrics, bool]:
+        started = time.perf_counter()
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            worker = _Worker(self.limits.check_memory_mb)
+
+        wait = self.limits.check_timeout
+        deadline_hit = False
+        if self.deadline_at is not None:
+            remaining = max(0.0, self.deadline_at - time.monotonic())
+            if wait is None or remaining < wait:
+                wait, deadline_hit = remaining, True
+
+        try:
+            worker.conn.send((check, project_path, fs))
+        except Exception as e:
+            # Nothing was written, so the worker is still usable
+            self._idle.put(worker)
+            message = f"Check can't be sandboxed: {e}"
+            return self._aborted(check, CheckStatus.SKIPPED, message, started)
+
+        try:
+            ready = worker.conn.poll(wait)
+            reply = worker.conn.recv() if ready else None
+        except (EOFError, OSError):
+            # The worker died, e.g. killed by the kernel
+            worker.kill()
+            message = f"Check worker exited unexpectedly (code {worker.process.exitcode})"
+            return self._aborted(check, CheckStatus.SKIPPED, message, started)
+
+        if reply is None:
+            worker.kill()
+            if deadline_hit:
+                message = f"Run deadline of {self.limits.deadline:g}s reached"
+            else:
+                message = f"Check exceeded its {self.limits.check_timeout:g}s time limit"
+            return self._aborted(check, CheckStatus.TIMEOUT, message, started)
+
+        self._idle.put(worker)
+        kind, payload = reply
+        if kind == "ok":
+            result, probes, metrics = payload
+            return result, probes, metrics, True
+        if kind == "memory":
+            message = f"Check exceeded its {self.limits.check_memory_mb} MB memory limit"
+        else:
+            message = f"Check raised {payload}"
+        return self._aborted(check, CheckStatus.SKIPPED, message, started)
+
+    def close(self) -> None:
+        """Stop all idle workers"""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            worker.stop()
+
+    @staticmethod
+    def _aborted(
+        check: BaseCheck, status: CheckStatus, message: str, started: float
+    ) -> tuple[CheckResult, set[Probe], CheckMetrics, bool]:
+        result = aborted_result(check, status, message)
+        return result, set(), CheckMetrics(time.perf_counter() - started, 0.0, 0, 0), False
+
+
+def _worker_main(conn: Connection, memory_mb: Optional[int]) -> None:
+    """Run checks sent by the parent until told to stop"""
+    from ethica.core.checker import _run_measured
+
+    if memory_mb is not None and resource is not None:
+        limit = _mapped_bytes() + memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+
+        check, project_path, fs = task
+        try:
+            reply: tuple[str, Any] = (
+                "ok",
+                _run_measured(check, project_path, ProjectContext(project_path, fs=fs)),
+            )
+        except MemoryError:
+            reply = ("memory", None)
+        except Exception as e:
+            reply = ("error", f"{type(e).__name__}: {e}")
+        conn.send(reply)
+
+
+def _mapped_bytes() -> int:
+    """Address space this process has mapped"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Without /proc, the peak RSS is the best available estimate
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return int(usage) * (1 if os.uname().sysname == "Darwin" else 1024)
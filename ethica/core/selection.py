@@ -0,0 +1,125 @@
+# ABOUTME: Git-diff-aware check selection for pre-commit and CI
+# ABOUTME: Re-runs only checks whose declared inputs intersect the changed files
+
+"""
+Run only the checks a set of changed files can affect.
+
+Each check declares the paths and globs it depends on via input_globs().
+Checks that no changed file matches reuse their last cached result.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Any, Optional
+
+from ethica.checks.base import CheckResult
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.planning import CheckPlan, ComplianceLevel
+from ethica.utils.globs import match_any
+
+
+def changed_files(
+    project_path: Path,
+    since: Optional[str] = None,
+    staged: bool = False,
+) -> set[str]:
+    """
+    Files changed in git, relative to the project directory.
+
+    Args:
+        project_path: Project directory inside a git work tree
+        since: Compare the work tree (plus untracked files) against this ref
+        staged: Only consider changes staged in the index
+
+    Returns:
+        Changed paths relative to project_path
+
+    Raises:
+        RuntimeError: If git fails, e.g. outside a repository or on a bad ref
+    """
+    if staged:
+        commands = [["diff", "--name-only", "--no-renames", "--relative", "--cached"]]
+    else:
+        commands = [
+            ["diff", "--name-only", "--no-renames", "--relative", since or "HEAD"],
+            ["ls-files", "--others", "--exclude-standard"],
+        ]
+
+    changed: set[str] = set()
+    for args in commands:
+        try:
+            output = subprocess.run(
+                ["git", *args],
+                cwd=project_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        except FileNotFoundError as e:
+            raise RuntimeError("git is not installed") from e
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"git {args[0]} failed: {e.stderr.strip()}") from e
+        changed.update(line for line in output.splitlines() if line)
+
+    return changed
+
+
+def affected_checks(engine: CheckEngine, changed: set[str]) -> list[int]:
+    """
+    Positions of the checks whose declared inputs match a changed path.
+
+    Args:
+        engine: Engine with loaded checks
+        changed: Changed paths relative to the project
+
+    Returns:
+        Positions in engine.checks
+    """
+    return [
+        index
+        for index, check in enumerate(engine.checks)
+        if any(match_any(path, check.input_globs()) for path in changed)
+    ]
+
+
+def run_changed(
+    engine: CheckEngine,
+    project_path: Path,
+    changed: set[str],
+    cache: Optional[ResultCache],
+    level: Optional[ComplianceLevel] = None,
+) -> tuple[dict[str, Any], list[int]]:
+    """
+    Run affected checks and reuse the last results for the rest.
+
+    Checks without a previous result are always run.
+
+    Args:
+        engine: Engine with loaded checks
+        project_path: Project directory
+        changed: Changed paths relative to the project
+        cache: Cache holding the last results
+        level: Compliance level to evaluate; checks it doesn't need are
+            neither run nor reported (default: every check, no level)
+
+    Returns:
+        Full report, with a "compliance" entry when there is a level, and
+        the positions of the checks that ran
+    """
+    plan = CheckPlan(engine, level)
+    affected = set(affected_checks(engine, changed))
+    results: dict[int, CheckResult] = {}
+
+    if cache is not None:
+        for index in plan.indexes:
+            if index not in affected:
+                result = cache.last_result(engine.cache_key(engine.checks[index]))
+                if result is not None:
+                    results[index] = result
+
+    to_run = sorted(index for index in plan.indexes if index not in results)
+    for index, (result, _) in zip(to_run, engine.execute(project_path, cache, to_run)):
+        results[index] = result
+
+    return plan.evaluate(results), to_run
@@ -0,0 +1,273 @@
+# ABOUTME: Long-running check daemon serving requests over a local Unix socket
+# ABOUTME: Keeps the registry and compiled engines warm and reloads changed frameworks
+
+"""
+Check daemon for CI fleets.
+
+The daemon speaks newline-delimited JSON over a Unix socket: each connection
+sends one request object and receives one response object. Frameworks are
+loaded once and kept as ready CheckEngine instances; a framework is reloaded
+when its framework.yaml changes on disk. Projects with their own registry
+under .ethica/frameworks get frameworks from it, as a local run would.
+
+Requests:
+    {"command": "ping"}
+    {"command": "check", "project": "/abs/path", "framework": null,
+     "level": null, "use_cache": true}
+    {"command": "shutdown"}
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from ethica import __version__
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.config import enabled_frameworks, load_project_config
+from ethica.core.planning import CheckPlan, ComplianceLevel
+from ethica.core.registry import FrameworkRegistry, default_search_paths
+from ethica.utils.paths import user_cache_dir
+
+
+def default_socket_path() -> Path:
+    """
+    Socket the daemon listens on and clients connect to.
+
+    Honors ETHICA_SOCKET, then XDG_RUNTIME_DIR, then the user cache dir.
+    """
+    override = os.environ.get("ETHICA_SOCKET")
+    if override:
+        return Path(override)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "ethica.sock"
+
+    return user_cache_dir() / "ethica.sock"
+
+
+class EnginePool:
+    """Warm framework registry and engines shared by all requests"""
+
+    def __init__(self, registry: Optional[FrameworkRegistry] = None, jobs: int = 1) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            registry: Registry to load every project's frameworks from. If
+                None, the built-in and user registries are shared and each
+                project's own registry is merged in for its requests.
+            jobs: Concurrent checks per request
+        """
+        self.registry = registry
+        self.jobs = jobs
+        # Project registry file (None for projects without one) -> registry
+        self._registries: dict[Optional[Path], FrameworkRegistry] = {}
+        self._engines: dict[
+            tuple[Optional[Path], str], tuple[Any, dict[str, Any], CheckEngine]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def _registry_for(
+        self, project_path: Optional[Path]
+    ) -> tuple[Optional[Path], FrameworkRegistry]:
+        """The registry a local run in the project would use, and its key"""
+        if self.registry is not None:
+            return None, self.registry
+
+        search_paths = default_search_paths(project_path or Path.cwd())
+        project_registry: Optional[Path] = search_paths[-1]
+        if not search_paths[-1].exists():
+            # Shared by every project without a registry of its own
+            project_registry = None
+            search_paths = search_paths[:-1]
+
+        registry = self._registries.get(project_registry)
+        if registry is None:
+            registry = self._registries[project_registry] = FrameworkRegistry(
+                search_paths=search_paths
+            )
+        return project_registry, registry
+
+    def get(
+        self, framework_id: str, project_path: Optional[Path] = None
+    ) -> tuple[dict[str, Any], CheckEngine]:
+        """
+        Get the spec and engine for a framework, reloading it if its YAML changed.
+
+        Args:
+            framework_id: Framework identifier
+            project_path: Project whose registry, if it has one, takes precedence
+
+        Returns:
+            Framework spec and a ready engine
+        """
+        with self._lock:
+            project_registry, registry = self._registry_for(project_path)
+            registry.refresh()
+            spec_path = registry.get_framework_dir(framework_id) / "framework.yaml"
+            st = spec_path.stat()
+            signature = (st.st_mtime_ns, st.st_size)
+
+            key = (project_registry, framework_id)
+            cached = self._engines.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1], cached[2]
+
+            spec = registry.load_framework_spec(framework_id)
+            engine = CheckEngine(spec, jobs=self.jobs)
+            self._engines[key] = (signature, spec, engine)
+            return spec, engine
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Serve a single request.
+
+        Args:
+            request: Decoded request object
+
+        Returns:
+            Response object
+        """
+        command = request.get("command")
+
+        if command == "ping":
+            return {"ok": True, "version": __version__}
+
+        if command == "check":
+            project_path = Path(request["project"])
+            enabled = enabled_frameworks(load_project_config(project_path))
+            framework_id = request.get("framework") or enabled[0]["id"]
+            level = request.get("level") or enabled[0].get("compliance_level", "standard")
+
+            spec, engine = self.get(framework_id, project_path)
+            # Plan the checks as a local run would, so the report carries the
+            # level's verdict and leaves out checks the level doesn't need
+            compliance = None
+            if "compliance_levels" in spec:
+                compliance = ComplianceLevel.from_framework(spec, level)
+            plan = CheckPlan(engine, compliance)
+            if request.get("use_cache", True):
+                with ResultCache(project_path) as cache:
+                    results = plan.run(project_path, cache=cache)
+            else:
+                results = plan.run(project_path)
+
+            return {
+                "ok": True,
+                "framework_id": framework_id,
+                "compliance_level": level,
+                "principles": spec["principles"],
+                "results": results,
+            }
+
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON response line"""
+
+    server: "CheckServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get("command") == "shutdown":
+                # shutdown() blocks until serve_forever exits, so call it elsewhere
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                response: dict[str, Any] = {"ok": True}
+            else:
+                response = self.server.pool.handle(request)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class CheckServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server handling concurrent check requests"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, pool: EnginePool) -> None:
+        """
+        Bind the server, replacing a stale socket file left by a dead daemon.
+
+        Args:
+            socket_path: Where to listen
+            pool: Engines used to serve requests
+
+        Raises:
+            RuntimeError: If another daemon is already listening
+        """
+        self.socket_path = Path(socket_path)
+        self.pool = pool
+
+        if self.socket_path.exists():
+            if daemon_running(self.socket_path):
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(self.socket_path), _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+
+def send_request(
+    request: dict[str, Any],
+    socket_path: Optional[Path] = None,
+    timeout: Optional[float] = None,
+    connect_timeout: Optional[float] = None,
+) -> dict[str, Any]:
+    """
+    Send a request to a running daemon.
+
+    Args:
+        request: Request object
+        socket_path: Daemon socket (default: default_socket_path())
+        timeout: Seconds to wait for the response, and for the connection
+            unless connect_timeout is given
+        connect_timeout: Seconds to wait for the daemon to accept the connection
+
+    Returns:
+        Response object
+
+    Raises:
+        OSError: If no daemon is reachable or it times out (socket.timeout)
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout if connect_timeout is None else connect_timeout)
+        sock.connect(str(socket_path or default_socket_path()))
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+
+        chunks = []
+        while True:
+            chunk = sock.recv(64 * 1024)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+
+    return json.loads(b"".join(chunks))  # type: ignore[no-any-return]
+
+
+def daemon_running(socket_path: Optional[Path] = None) -> bool:
+    """Whether a daemon answers on the socket"""
+    try:
+        return bool(send_request({"command": "ping"}, socket_path, timeout=1.0).get("ok"))
+    except (OSError, ValueError):
+        return False
@@ -0,0 +1,120 @@
+# ABOUTME: Compiled cache for parsed YAML framework specs and registries
+# ABOUTME: Stores one pickled parse result per source path, valid while its mtime and size hold
+
+"""
+Compiled on-disk cache for framework YAML files.
+
+Parsing YAML dominates CLI latency once frameworks grow to hundreds of checks.
+Parsed documents are pickled into the user cache directory and reused while
+the source file's mtime and size are unchanged. Each source path has a single
+cache file that is overwritten when the source changes, and files not
+rewritten for CACHE_MAX_AGE (such as those of deleted paths) are removed
+whenever a file is written. Parsing itself uses PyYAML's C loader when
+libyaml is available.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Union
+
+import yaml
+
+from ethica import __version__
+from ethica.utils.paths import user_cache_dir
+
+# Prefer the libyaml-backed loader, falling back to pure Python
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bumped whenever the cache file layout changes
+_FORMAT = 2
+
+# Seconds after which a cache file that hasn't been rewritten is pruned
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Pickled documents already loaded by this process, by cache key
+_memory: dict[str, bytes] = {}
+_memory_lock = threading.Lock()
+
+
+def safe_load(stream: Union[str, bytes, IO[Any]]) -> Any:
+    """yaml.safe_load using the fastest available loader"""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_yaml(path: Path) -> Any:
+    """
+    Load a YAML file, reusing a compiled copy when the file is unchanged.
+
+    Each call returns a fresh object, so callers may mutate the result.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        Parsed document
+
+    Raises:
+        FileNotFoundError: If path doesn't exist
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    key = hashlib.sha256(
+        f"{_FORMAT}:{__version__}:{yaml.__version__}:{path}:{st.st_mtime_ns}:{st.st_size}".encode()
+    ).hexdigest()
+
+    with _memory_lock:
+        compiled = _memory.get(key)
+    if compiled is not None:
+        return pickle.loads(compiled)
+
+    # One file per path, holding the key it was compiled under and the pickle
+    cache_dir = user_cache_dir() / "specs"
+    cache_path = cache_dir / f"{hashlib.sha256(f'{_FORMAT}:{path}'.encode()).hexdigest()}.pickle"
+    try:
+        stored_key, _, compiled = cache_path.read_bytes().partition(b"\0")
+        if stored_key.decode() != key:
+            raise ValueError("stale")
+        data = pickle.loads(compiled)
+    except Exception:
+        # Missing, stale, truncated or incompatible cache file: parse from source
+        with open(path, "rb") as f:
+            data = safe_load(f)
+        compiled = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        _write_atomic(cache_path, key.encode() + b"\0" + compiled)
+        _prune(cache_dir)
+
+    with _memory_lock:
+        _memory[key] = compiled
+
+    return data
+
+
+def _prune(cache_dir: Path) -> None:
+    """Remove cache files that haven't been rewritten for CACHE_MAX_AGE"""
+    cutoff = time.time() - CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            # Already removed by another process
+            pass
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    """Write via a temp file; an unwritable cache dir just disables caching"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
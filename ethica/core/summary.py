@@ -0,0 +1,238 @@
+# ABOUTME: One-pass, mergeable reducers that summarize check results
+# ABOUTME: Produce per-principle, per-framework and fleet-wide counters in bounded memory
+
+"""
+Streaming summary reducers.
+
+A SummaryReducer consumes check results one at a time and keeps only
+counters (plus, optionally, the per-check dicts for detailed reports). Its
+summary() has exactly the structure CheckEngine.run_checks returns. Reducers
+built by separate workers can be merged, so fleet totals are computed without
+re-walking any results.
+"""
+
+from typing import Any, Optional
+
+# Statuses with their own per-principle counter
+COUNTED_STATUSES = ("passed", "failed", "skipped", "timeout")
+
+
+def overall_status(error_failures: int, failures: int) -> tuple[str, str]:
+    """
+    Overall status and its display color.
+
+    Args:
+        error_failures: Failed checks with error severity
+        failures: All failed checks
+
+    Returns:
+        (status, color)
+    """
+    if error_failures > 0:
+        return "failed", "red"
+    if failures > 0:
+        return "passed with warnings", "yellow"
+    return "passed", "green"
+
+
+class SummaryReducer:
+    """Counters for one framework's results, over one or many projects"""
+
+    def __init__(
+        self, framework_id: str, framework_version: str, keep_checks: bool = True
+    ) -> None:
+        """
+        Initialize an empty reducer.
+
+        Args:
+            framework_id: Framework the results belong to
+            framework_version: Framework version
+            keep_checks: Retain each check dict for the detailed report.
+                Without it, memory is bounded by the number of principles.
+        """
+        self.framework_id = framework_id
+        self.framework_version = framework_version
+        self.keep_checks = keep_checks
+        self.principles: dict[str, dict[str, Any]] = {}
+        self.total = 0
+        self.error_failures = 0
+
+    def add(self, principle: str, check: dict[str, Any]) -> None:
+        """
+        Count one check result.
+
+        Args:
+            principle: Principle the check belongs to
+            check: CheckResult.to_dict() output
+        """
+        counters = self._principle(principle)
+        status = check["status"]
+
+        if status in COUNTED_STATUSES:
+            counters[status] += 1
+        # A timed-out error check can't show compliance, so it fails the run
+        if status in ("failed", "timeout") and check["severity"] == "error":
+            self.error_failures += 1
+        if self.keep_checks:
+            counters["checks"].append(check)
+        self.total += 1
+
+    def merge(self, other: "SummaryReducer") -> None:
+        """
+        Fold in counters from a reducer over the same framework.
+
+        Args:
+            other: Partial summary, e.g. from another worker
+        """
+        for principle, theirs in other.principles.items():
+            counters = self._principle(principle)
+            for status in COUNTED_STATUSES:
+                counters[status] += theirs[status]
+            if self.keep_checks:
+                counters["checks"].extend(theirs["checks"])
+
+        self.total += other.total
+        self.error_failures += other.error_failures
+
+    @property
+    def status(self) -> str:
+        """Overall status of the results seen so far"""
+        return overall_status(self.error_failures, self._count("failed"))[0]
+
+    def summary(self, include_checks: Optional[bool] = None) -> dict[str, Any]:
+        """
+        Build the report dict in the shape run_checks returns.
+
+        Args:
+            include_checks: Include per-check dicts under each principle
+                (default: whether they were kept)
+
+        Returns:
+            Dictionary with structured results
+        """
+        if include_checks is None:
+            include_checks = self.keep_checks
+
+        principles = []
+        for principle_id, counters in self.principles.items():
+            entry: dict[str, Any] = {"id": principle_id}
+            if include_checks:
+                entry["checks"] = list(counters["checks"])
+            for status in COUNTED_STATUSES:
+                entry[status] = counters[status]
+
+            if counters["failed"] > 0:
+                entry["status"] = "failed"
+            elif counters["timeout"] > 0:
+                entry["status"] = "timeout"
+            elif counters["passed"] > 0:
+                entry["status"] = "passed"
+            else:
+                entry["status"] = "skipped"
+            principles.append(entry)
+
+        passed = self._count("passed")
+        failed = self._count("failed")
+        status, color = overall_status(self.error_failures, failed)
+
+        return {
+            "framework_id": self.framework_id,
+            "framework_version": self.framework_version,
+            "principles": principles,
+            "total_checks": self.total,
+            "checks_passed": passed,
+            "checks_failed": failed,
+            "checks_skipped": self._count("skipped"),
+            "checks_timed_out": self._count("timeout"),
+            "pass_rate": passed / self.total if self.total > 0 else 0.0,
+            "overall_status": status,
+            "overall_status_color": color,
+        }
+
+    def _principle(self, principle: str) -> dict[str, Any]:
+        counters = self.principles.get(principle)
+        if counters is None:
+            counters = {"checks": [], "passed": 0, "failed": 0, "skipped": 0, "timeout": 0}
+            self.principles[principle] = counters
+        return counters
+
+    def _count(self, status: str) -> int:
+        return sum(counters[status] for counters in self.principles.values())
+
+
+class FleetReducer:
+    """Project counts plus per-framework totals across a fleet"""
+
+    def __init__(self) -> None:
+        self.frameworks: dict[str, SummaryReducer] = {}
+        self.projects = 0
+        self.failed = 0
+        self.warned = 0
+        self.errored = 0
+
+    def add_project(self, reducer: Optional[SummaryReducer], reached: bool = True) -> None:
+        """
+        Count one project.
+
+        Args:
+            reducer: The project's results, or None if it couldn't be checked
+            reached: Whether the project reached its compliance level; a
+                project that didn't counts as failed
+        """
+        self.projects += 1
+
+        if reducer is None:
+            self.errored += 1
+            return
+
+        status = reducer.status
+        if status == "failed" or not reached:
+            self.failed += 1
+        elif status == "passed with warnings":
+            self.warned += 1
+
+        totals = self.frameworks.get(reducer.framework_id)
+        if totals is None:
+            totals = SummaryReducer(
+                reducer.framework_id, reducer.framework_version, keep_checks=False
+            )
+            self.frameworks[reducer.framework_id] = totals
+        totals.merge(reducer)
+
+    def merge(self, other: "FleetReducer") -> None:
+        """Fold in counts from another partial fleet"""
+        self.projects += other.projects
+        self.failed += other.failed
+        self.warned += other.warned
+        self.errored += other.errored
+
+        for framework_id, theirs in other.frameworks.items():
+            totals = self.frameworks.get(framework_id)
+            if totals is None:
+                totals = SummaryReducer(
+                    theirs.framework_id, theirs.framework_version, keep_checks=False
+                )
+                self.frameworks[framework_id] = totals
+            totals.merge(theirs)
+
+    def summary(self) -> dict[str, Any]:
+        """Fleet-wide counters, status and per-framework totals"""
+        if self.errored or self.failed:
+            status, color = "failed", "red"
+        elif self.warned:
+            status, color = "passed with warnings", "yellow"
+        else:
+            status, color = "passed", "green"
+
+        return {
+            "total_projects": self.projects,
+            "projects_passed": self.projects - self.errored - self.failed,
+            "projects_failed": self.failed,
+            "projects_errored": self.errored,
+            "overall_status": status,
+            "overall_status_color": color,
+            "frameworks": {
+                framework_id: totals.summary()
+                for framework_id, totals in self.frameworks.items()
+            },
+        }
@@ -0,0 +1,338 @@
+# ABOUTME: Read-only virtual filesystems that checks see a project through
+# ABOUTME: Serves project files from a directory or straight out of a zip or tar archive
+
+"""
+Virtual filesystems for project access.
+
+ProjectContext does all project I/O through a FileSystem, so checks run
+unchanged against a source tree or a build artifact. Archive filesystems
+index members from the zip central directory or the tar headers and read only
+the members checks ask for, into memory; nothing is extracted to disk.
+
+Paths are relative to the project root, use '/' and never start with './'.
+An archive whose members all sit under one top-level directory, like an
+sdist, is rooted at that directory.
+"""
+
+import io
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any, NamedTuple, Optional, Union
+
+# Suffixes 'ethica check --target' recognizes as archives
+ARCHIVE_SUFFIXES = (
+    ".whl",
+    ".zip",
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tar.xz",
+)
+
+
+class FileStat(NamedTuple):
+    """The parts of a stat result checks use"""
+
+    st_size: int
+    st_mtime_ns: int
+
+
+# (directory, subdirectory names, file names), like os.walk
+WalkEntry = tuple[str, list[str], list[str]]
+
+
+class FileSystem(ABC):
+    """Read-only view of a project's files"""
+
+    # Whether paths map to real files that can be opened by other processes
+    is_local = False
+    # Whether this is a built package, such as a wheel, rather than a source tree
+    is_build_artifact = False
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        """Whether a file or directory exists"""
+
+    @abstractmethod
+    def stat(self, path: str) -> Optional[FileStat]:
+        """Size and modification time, or None if the path doesn't exist"""
+
+    @abstractmethod
+    def open(self, path: str) -> IO[bytes]:
+        """
+        Open a file for binary reading.
+
+        Raises:
+            OSError: If the file doesn't exist or can't be read
+        """
+
+    @abstractmethod
+    def walk(self, path: str) -> Iterator[WalkEntry]:
+        """
+        Walk a directory top-down like os.walk.
+
+        Directories are yielded relative to the project ('.' for the root).
+        Removing names from the yielded subdirectory list prunes the walk.
+        Nothing is yielded if the directory doesn't exist.
+        """
+
+    def read_bytes(self, path: str) -> bytes:
+        """
+        Read a whole file.
+
+        Raises:
+            OSError: If the file doesn't exist or can't be read
+        """
+        with self.open(path) as f:
+            return f.read()
+
+    def local_path(self, path: str) -> Optional[Path]:
+        """The real file behind a path, or None if there isn't one"""
+        return None
+
+    def content_id(self, path: str) -> Optional[str]:
+        """
+        An ID that stays the same exactly as long as a file's content does.
+
+        Returns:
+            The ID, or None if this filesystem can't tell without reading
+            the file
+        """
+        return None
+
+    def close(self) -> None:
+        """Release any open handles"""
+
+
+class LocalFileSystem(FileSystem):
+    """A project directory on disk"""
+
+    is_local = True
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def exists(self, path: str) -> bool:
+        return (self.root / path).exists()
+
+    def stat(self, path: str) -> Optional[FileStat]:
+        try:
+            st = (self.root / path).stat()
+        except OSError:
+            return None
+        return FileStat(st.st_size, st.st_mtime_ns)
+
+    def open(self, path: str) -> IO[bytes]:
+        return open(self.root / path, "rb")
+
+    def read_bytes(self, path: str) -> bytes:
+        return (self.root / path).read_bytes()
+
+    def walk(self, path: str) -> Iterator[WalkEntry]:
+        for dirpath, dirnames, filenames in os.walk(self.root / path):
+            yield Path(dirpath).relative_to(self.root).as_posix(), dirnames, filenames
+
+    def local_path(self, path: str) -> Optional[Path]:
+        return self.root / path
+
+
+class _Node:
+    """A directory in an archive's member tree"""
+
+    __slots__ = ("dirs", "files")
+
+    def __init__(self) -> None:
+        self.dirs: dict[str, "_Node"] = {}
+        # File name -> (stat, member handle)
+        self.files: dict[str, tuple[FileStat, Any]] = {}
+
+
+class ArchiveFileSystem(FileSystem):
+    """Members of an archive file, indexed on first use"""
+
+    # Root the tree at a lone top-level directory
+    strip_root = True
+    is_build_artifact = True
+
+    def __init__(self, archive_path: Path) -> None:
+        """
+        Initialize a view of an archive. Nothing is read until first use.
+
+        Args:
+            archive_path: Archive file
+        """
+        self.archive_path = Path(archive_path)
+        self._handle: Any = None
+        self._tree: Optional[_Node] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker processes reopen the archive themselves
+        return {"archive_path": self.archive_path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["archive_path"])  # type: ignore[misc]
+
+    @abstractmethod
+    def _open_archive(self) -> Any:
+        """Open the archive, reading its index"""
+
+    @abstractmethod
+    def _members(self, handle: Any) -> Iterator[tuple[str, bool, FileStat, Any]]:
+        """(name, is directory, stat, member) for each member"""
+
+    @abstractmethod
+    def _read_member(self, handle: Any, member: Any) -> bytes:
+        """Read one member's content; called with the lock held"""
+
+    def exists(self, path: str) -> bool:
+        return self._lookup(path) is not None
+
+    def stat(self, path: str) -> Optional[FileStat]:
+        found = self._lookup(path)
+        if found is None:
+            return None
+        return found[0] if isinstance(found, tuple) else FileStat(0, 0)
+
+    def open(self, path: str) -> IO[bytes]:
+        return io.BytesIO(self.read_bytes(path))
+
+    def read_bytes(self, path: str) -> bytes:
+        found = self._lookup(path)
+        if not isinstance(found, tuple):
+            raise FileNotFoundError(f"{self.archive_path}: no file {path}")
+        with self._lock:
+            return self._read_member(self._handle, found[1])
+
+    def walk(self, path: str) -> Iterator[WalkEntry]:
+        start = self._lookup(path)
+        if not isinstance(start, _Node):
+            return
+        pending = [(_normalize(path) or ".", start)]
+        while pending:
+            dirpath, node = pending.pop()
+            dirnames = sorted(node.dirs)
+            yield dirpath, dirnames, sorted(node.files)
+            # Visit in order, skipping directories the caller pruned
+            for name in reversed(dirnames):
+                child = name if dirpath == "." else f"{dirpath}/{name}"
+                pending.append((child, node.dirs[name]))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+                self._tree = None
+
+    def _lookup(self, path: str) -> Union[_Node, tuple[FileStat, Any], None]:
+        """The directory node or (stat, member) of a file at path"""
+        node = self._index()
+        parts = [part for part in _normalize(path).split("/") if part]
+        for i, part in enumerate(parts):
+            if part in node.dirs:
+                node = node.dirs[part]
+            elif i == len(parts) - 1 and part in node.files:
+                return node.files[part]
+            else:
+                return None
+        return node
+
+    def _index(self) -> _Node:
+        """Build the member tree on first use"""
+        if self._tree is not None:
+            return self._tree
+        with self._lock:
+            if self._tree is None:
+                self._handle = self._open_archive()
+                root = _Node()
+                for name, is_dir, stat, member in self._members(self._handle):
+                    parts = [part for part in name.split("/") if part and part != "."]
+                    if not parts or ".." in parts:
+                        continue
+                    node = root
+                    for part in parts[:-1] if not is_dir else parts:
+                        node = node.dirs.setdefault(part, _Node())
+                    if not is_dir:
+                        node.files[parts[-1]] = (stat, member)
+
+                # An sdist and most zipped projects wrap everything in one directory
+                if self.strip_root and not root.files and len(root.dirs) == 1:
+                    root = next(iter(root.dirs.values()))
+                self._tree = root
+        return self._tree
+
+
+class ZipFileSystem(ArchiveFileSystem):
+    """A zip archive, such as a wheel, read via its central directory"""
+
+    def _open_archive(self) -> Any:
+        return zipfile.ZipFile(self.archive_path)
+
+    def _members(self, handle: Any) -> Iterator[tuple[str, bool, FileStat, Any]]:
+        for info in handle.infolist():
+            try:
+                mtime = int(time.mktime(info.date_time + (0, 0, -1))) * 10**9
+            except (OverflowError, ValueError):
+                mtime = 0
+            yield info.filename, info.is_dir(), FileStat(info.file_size, mtime), info
+
+    def _read_member(self, handle: Any, member: Any) -> bytes:
+        return handle.read(member)  # type: ignore[no-any-return]
+
+
+class TarFileSystem(ArchiveFileSystem):
+    """A tar archive, optionally compressed, read via its member headers"""
+
+    def _open_archive(self) -> Any:
+        return tarfile.open(self.archive_path, "r:*")
+
+    def _members(self, handle: Any) -> Iterator[tuple[str, bool, FileStat, Any]]:
+        for member in handle.getmembers():
+            if member.isdir() or member.isfile():
+                stat = FileStat(member.size, int(member.mtime) * 10**9)
+                yield member.name, member.isdir(), stat, member
+
+    def _read_member(self, handle: Any, member: Any) -> bytes:
+        f = handle.extractfile(member)
+        return f.read() if f is not None else b""
+
+
+def _normalize(path: str) -> str:
+    """Project-relative path without './' or trailing slashes"""
+    path = path.replace("\\", "/").strip("/")
+    while path.startswith("./"):
+        path = path[2:]
+    return "" if path == "." else path
+
+
+def open_filesystem(target: Path) -> FileSystem:
+    """
+    The filesystem for a project directory or archive.
+
+    Args:
+        target: Project directory, or a zip (including wheels) or tar archive
+
+    Returns:
+        A view of the project's files
+
+    Raises:
+        ValueError: If target is a file but not a supported archive
+    """
+    target = Path(target)
+    if not target.is_file():
+        return LocalFileSystem(target)
+    if zipfile.is_zipfile(target):
+        return ZipFileSystem(target)
+    if tarfile.is_tarfile(target):
+        return TarFileSystem(target)
+    raise ValueError(
+        f"{target} is not a directory or a supported archive ({', '.join(ARCHIVE_SUFFIXES)})"
+    )
@@ -0,0 +1,322 @@
+# ABOUTME: Watch mode that re-runs only the checks whose inputs changed
+# ABOUTME: Provides inotify and polling file watchers plus a warm check session
+
+"""
+Change-driven re-evaluation for `ethica check --watch`.
+
+A WatchSession keeps the engine and the last result of every check in memory,
+along with the paths each check probed. When a watcher reports changed paths,
+only the checks that probed those paths (or paths beneath them) are re-run.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import posixpath
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ethica.checks.base import CheckResult
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.context import PROBE_LIST, Probe
+from ethica.core.planning import CheckPlan, ComplianceLevel
+
+# Events are coalesced for this long after the first one arrives, so an
+# editor's save (write, rename, chmod) triggers a single re-run
+DEBOUNCE_SECONDS = 0.05
+
+# inotify event masks (see inotify(7))
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_IGNORED = 0x8000
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _is_under(path: str, ancestor: str) -> bool:
+    """Whether path equals ancestor or lies beneath it"""
+    return path == ancestor or path.startswith(ancestor.rstrip("/") + "/")
+
+
+def _probe_affected(probe: Probe, changed: str) -> bool:
+    """Whether a change invalidates a probe; listings also see their entries change"""
+    kind, path = probe
+    if _is_under(path, changed):
+        return True
+    return kind == PROBE_LIST and (posixpath.dirname(changed) or ".") == path
+
+
+class PollingWatcher:
+    """Portable watcher that stats each watched path on an interval"""
+
+    def __init__(self, root: Path, interval: float = 0.25) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            root: Project directory watched paths are relative to
+            interval: Seconds between polls
+        """
+        self.root = Path(root)
+        self.interval = interval
+        self._snapshot: dict[str, Optional[tuple[int, int, int]]] = {}
+
+    def watch(self, paths: set[str]) -> None:
+        """Replace the set of watched relative paths"""
+        self._snapshot = {path: self._stat(path) for path in paths}
+
+    def wait(self, timeout: Optional[float] = None) -> set[str]:
+        """
+        Block until at least one watched path changes.
+
+        Args:
+            timeout: Seconds to wait before giving up (default: forever)
+
+        Returns:
+            Changed relative paths, empty on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            changed = {
+                path for path, signature in self._snapshot.items()
+                if self._stat(path) != signature
+            }
+            if changed:
+                time.sleep(DEBOUNCE_SECONDS)
+                self.watch(set(self._snapshot))
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+    def close(self) -> None:
+        pass
+
+    def _stat(self, relative_path: str) -> Optional[tuple[int, int, int]]:
+        try:
+            st = (self.root / relative_path).stat()
+        except OSError:
+            return None
+        return (st.st_mode, st.st_size, st.st_mtime_ns)
+
+
+class InotifyWatcher:
+    """Linux watcher using inotify on the directories holding watched paths"""
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            root: Project directory watched paths are relative to
+
+        Raises:
+            OSError: If inotify is unavailable
+        """
+        self.root = Path(root)
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, str] = {}
+
+    def watch(self, paths: set[str]) -> None:
+        """
+        Watch the nearest existing directory above each path.
+
+        Watching parents rather than the paths themselves catches creation of
+        missing files and directories as well as edits. Watched paths that are
+        directories are also watched themselves, so changes to their entries
+        (e.g. files added to a listed directory) are reported.
+        """
+        for path in paths:
+            if (self.root / path).is_dir():
+                self._add_watch(Path(path).as_posix())
+            directory = Path(path).parent
+            while directory != Path(".") and not (self.root / directory).is_dir():
+                directory = directory.parent
+            self._add_watch(directory.as_posix())
+
+    def wait(self, timeout: Optional[float] = None) -> set[str]:
+        """
+        Block until something changes in a watched directory.
+
+        Args:
+            timeout: Seconds to wait before giving up (default: forever)
+
+        Returns:
+            Changed relative paths, empty on timeout
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        time.sleep(DEBOUNCE_SECONDS)
+        changed: set[str] = set()
+
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0").decode(errors="replace")
+                offset += name_len
+
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    del self._dirs[wd]
+                    continue
+                if name:
+                    changed.add(name if directory == "." else f"{directory}/{name}")
+                else:
+                    changed.add(directory)
+
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+    def _add_watch(self, directory: str) -> None:
+        if directory in self._dirs.values():
+            return
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(self.root / directory), _IN_MASK
+        )
+        if wd >= 0:
+            self._dirs[wd] = directory
+
+
+Watcher = Union[InotifyWatcher, PollingWatcher]
+
+
+def create_watcher(root: Path, polling: bool = False) -> Watcher:
+    """
+    Create the best available watcher for this platform.
+
+    Args:
+        root: Project directory to watch
+        polling: Force the polling watcher
+
+    Returns:
+        An inotify watcher on Linux, otherwise a polling watcher
+    """
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root)
+
+
+class WatchSession:
+    """Warm engine state for re-running checks as project files change"""
+
+    def __init__(
+        self,
+        engine: CheckEngine,
+        project_path: Path,
+        cache: Optional[ResultCache] = None,
+        level: Optional[ComplianceLevel] = None,
+    ) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            engine: Engine with the framework already loaded
+            project_path: Project being watched
+            cache: Result cache kept up to date as checks re-run
+            level: Compliance level to evaluate; checks it doesn't need are
+                never run (default: every check, no level)
+        """
+        self.engine = engine
+        self.project_path = Path(project_path)
+        self.cache = cache
+        self.plan = CheckPlan(engine, level)
+        # Last result and probes of each planned check, by position in engine.checks
+        self.results: dict[int, CheckResult] = {}
+        self.probes: dict[int, set[Probe]] = {}
+
+    def start(self) -> dict[str, Any]:
+        """Run every planned check and return the full report"""
+        self._run(self.plan.indexes)
+        return self.plan.evaluate(self.results)
+
+    def watched_paths(self) -> set[str]:
+        """Every path probed by any check in the last run"""
+        return {path for probes in self.probes.values() for _, path in probes}
+
+    def affected(self, changed: set[str]) -> list[int]:
+        """
+        Checks that probed a changed path or a path beneath one, or listed
+        the directory holding one.
+
+        Args:
+            changed: Changed paths relative to the project
+
+        Returns:
+            Positions in engine.checks
+        """
+        return [
+            index
+            for index, probes in sorted(self.probes.items())
+            if any(_probe_affected(probe, c) for probe in probes for c in changed)
+        ]
+
+    def update(self, changed: set[str]) -> tuple[dict[str, Any], list[int]]:
+        """
+        Re-run the checks affected by changed paths.
+
+        Args:
+            changed: Changed paths relative to the project
+
+        Returns:
+            The updated full report and the positions of the checks re-run
+        """
+        indexes = self.affected(changed)
+
+        if indexes:
+            self._run(indexes)
+
+        return self.plan.evaluate(self.results), indexes
+
+    def _run(self, indexes: list[int]) -> None:
+        outcomes = self.engine.execute(self.project_path, cache=self.cache, indexes=indexes)
+        for index, (result, probes) in zip(indexes, outcomes):
+            self.results[index] = result
+            self.probes[index] = probes
+        self._flush_cache()
+
+    def _flush_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,115 @@
+# ABOUTME: Newline-delimited JSON writer for streaming check results
+# ABOUTME: Emits one compact line per check as it finishes, then a summary line
+
+"""
+Streaming NDJSON output.
+
+Each line is a self-contained JSON object with a "type" field:
+
+    {"type": "check", "framework_id": ..., "principle": ..., "check_id": ...}
+    {"type": "project", "path": ..., "error": ...}
+    {"type": "summary", "overall_status": ..., ...}
+
+Lines are written straight to the stream and flushed, so consumers see each
+result as soon as its check completes.
+"""
+
+import json
+import threading
+from typing import Any, Optional, TextIO
+
+from ethica.checks.base import BaseCheck, CheckResult
+
+
+def _dumps(obj: dict[str, Any]) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def _without_checks(report: dict[str, Any]) -> dict[str, Any]:
+    """A framework report with per-check details dropped from its principles"""
+    if "principles" not in report:
+        return report
+    return {
+        **report,
+        "principles": [
+            {k: v for k, v in p.items() if k != "checks"} for p in report["principles"]
+        ],
+    }
+
+
+class NDJSONWriter:
+    """Thread-safe writer of NDJSON result lines"""
+
+    def __init__(self, stream: TextIO) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Text stream to write to, usually sys.stdout
+        """
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def check(
+        self,
+        framework_id: str,
+        check: BaseCheck,
+        result: CheckResult,
+        project: Optional[str] = None,
+    ) -> None:
+        """
+        Write one check result.
+
+        Args:
+            framework_id: Framework the check belongs to
+            check: Check that produced the result
+            result: The result
+            project: Project path, for fleet runs
+        """
+        self.check_dict(framework_id, check.principle, result.to_dict(), project)
+
+    def check_dict(
+        self,
+        framework_id: str,
+        principle: str,
+        check: dict[str, Any],
+        project: Optional[str] = None,
+    ) -> None:
+        """Write one check result already converted to a dict"""
+        line: dict[str, Any] = {"type": "check"}
+        if project is not None:
+            line["project"] = project
+        line["framework_id"] = framework_id
+        line["principle"] = principle
+        line.update(check)
+        self._write(line)
+
+    def project_error(self, path: str, error: str) -> None:
+        """Write a project that couldn't be checked"""
+        self._write({"type": "project", "path": path, "error": error})
+
+    def summary(self, results: dict[str, Any]) -> None:
+        """
+        Write the trailing summary line.
+
+        Per-check details are dropped; they were already streamed.
+
+        Args:
+            results: Report from run_checks, run_fleet or a FrameworkSet
+        """
+        line: dict[str, Any] = {"type": "summary"}
+        for key, value in results.items():
+            if key == "principles":
+                value = [{k: v for k, v in p.items() if k != "checks"} for p in value]
+            elif key == "frameworks":
+                value = {fid: _without_checks(report) for fid, report in value.items()}
+            elif key == "projects":
+                continue
+            line[key] = value
+        self._write(line)
+
+    def _write(self, line: dict[str, Any]) -> None:
+        text = _dumps(line) + "\n"
+        with self._lock:
+            self.stream.write(text)
+            self.stream.flush()
@@ -0,0 +1,48 @@
+# ABOUTME: CSV and NDJSON writers for compliance history time series
+# ABOUTME: Writes one row per commit as soon as the commit has been evaluated
+
+"""
+Compliance history output.
+
+CSV has one column per summary field and one per principle, holding the
+principle's status at that commit. NDJSON writes each point as it is, with
+principle statuses under "principles".
+"""
+
+import csv
+import json
+from typing import Any, Optional, TextIO
+
+TIMESERIES_FORMATS = ("csv", "ndjson")
+
+
+class TimeSeriesWriter:
+    """Streams history points to a text stream"""
+
+    def __init__(self, stream: TextIO, output: str, principles: list[str]) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Text stream to write to
+            output: Format, one of TIMESERIES_FORMATS
+            principles: Principle IDs, in column order for CSV
+        """
+        self.stream = stream
+        self.output = output
+        self.principles = principles
+        self._csv: Optional[Any] = None
+
+    def point(self, point: dict[str, Any]) -> None:
+        """Write one commit's point"""
+        if self.output == "ndjson":
+            self.stream.write(json.dumps(point, separators=(",", ":")) + "\n")
+        else:
+            row = {k: v for k, v in point.items() if k != "principles"}
+            for principle in self.principles:
+                row[principle] = point["principles"].get(principle, "")
+            if self._csv is None:
+                self._csv = csv.DictWriter(self.stream, fieldnames=list(row), lineterminator="\n")
+                self._csv.writeheader()
+            self._csv.writerow(row)
+        self.stream.flush()
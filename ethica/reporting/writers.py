@@ -0,0 +1,253 @@
+# ABOUTME: Compact JSON, SARIF 2.1 and JUnit XML report writers
+# ABOUTME: Write finished reports as bytes straight to a file or stdout, bypassing rich
+
+"""
+Machine-readable report files.
+
+Each writer takes a report as returned by run_checks, FrameworkSet.run or
+run_fleet and writes it to a binary stream. Nothing goes through a rich
+Console, so large reports are written in one pass and markup-like text in
+check messages, such as "[red]", is kept verbatim. JSON is encoded with
+orjson when it is installed.
+
+SARIF rules are identified as '<framework>/<check>'. Only failed and
+timed-out checks become SARIF results; every check is a JUnit test case.
+"""
+
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from ethica import __version__
+from ethica.core.config import CONFIG_FILENAME
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+INFORMATION_URI = "https://github.com/shellen/ethica"
+
+# Check severity -> SARIF level
+_SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact JSON encoding of a report"""
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(obj, default=str)
+        return encoded
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
+def iter_reports(results: dict[str, Any]) -> Iterator[tuple[Optional[str], dict[str, Any]]]:
+    """
+    Single-framework reports within any report.
+
+    Args:
+        results: Report of one framework, several frameworks or a fleet
+
+    Yields:
+        (project path or None, framework report) pairs; fleet projects that
+        couldn't be checked are left out
+    """
+    if "projects" in results:
+        for project in results["projects"]:
+            if "results" in project:
+                yield project["path"], project["results"]
+    elif "frameworks" in results:
+        for report in results["frameworks"].values():
+            yield None, report
+    else:
+        yield None, results
+
+
+def write_json(results: dict[str, Any], stream: BinaryIO) -> None:
+    """Write a report as compact JSON followed by a newline"""
+    stream.write(dumps(results))
+    stream.write(b"\n")
+
+
+def write_sarif(results: dict[str, Any], stream: BinaryIO) -> None:
+    """
+    Write a report as a SARIF 2.1.0 log with one run.
+
+    Each result is located at the project's .ai-ethics.yaml, which is where
+    the framework was enabled; code scanning services require a location.
+    """
+    rules: dict[str, dict[str, Any]] = {}
+    findings = []
+
+    for project, report in iter_reports(results):
+        framework_id = report["framework_id"]
+        config_uri = f"{project}/{CONFIG_FILENAME}" if project else CONFIG_FILENAME
+        for principle in report["principles"]:
+            for check in principle.get("checks", ()):
+                rule_id = f"{framework_id}/{check['id']}"
+                level = _SARIF_LEVELS.get(check["severity"], "warning")
+                if rule_id not in rules:
+                    rules[rule_id] = {
+                        "id": rule_id,
+                        "shortDescription": {"text": check["name"]},
+                        "defaultConfiguration": {"level": level},
+                        "properties": {
+                            "framework": framework_id,
+                            "principle": principle["id"],
+                        },
+                    }
+                if check["status"] not in ("failed", "timeout"):
+                    continue
+
+                finding: dict[str, Any] = {
+                    "ruleId": rule_id,
+                    # A timed-out check couldn't tell either way
+                    "kind": "fail" if check["status"] == "failed" else "open",
+                    "level": level if check["status"] == "failed" else "none",
+                    "message": {"text": check["message"]},
+                    "locations": [
+                        {"physicalLocation": {"artifactLocation": {"uri": config_uri}}}
+                    ],
+                }
+                if check.get("suggestion"):
+                    finding["properties"] = {"suggestion": check["suggestion"]}
+                findings.append(finding)
+
+    log = {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "ethica",
+                        "version": __version__,
+                        "informationUri": INFORMATION_URI,
+                        "rules": list(rules.values()),
+                    }
+                },
+                "results": findings,
+            }
+        ],
+    }
+    stream.write(dumps(log))
+    stream.write(b"\n")
+
+
+def write_junit(results: dict[str, Any], stream: BinaryIO) -> None:
+    """
+    Write a report as JUnit XML with one test suite per framework report.
+
+    Failed checks are failures, timed-out checks errors and skipped checks
+    skipped; the suite counts come from the report's principle counters.
+    """
+    reports = list(iter_reports(results))
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    for _, report in reports:
+        totals["tests"] += report["total_checks"]
+        totals["failures"] += report["checks_failed"]
+        totals["errors"] += report["checks_timed_out"]
+        totals["skipped"] += report["checks_skipped"]
+
+    def write(text: str) -> None:
+        stream.write(text.encode())
+
+    write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    write(f'<testsuites name="ethica"{_counts(totals)}>\n')
+
+    for project, report in reports:
+        framework_id = report["framework_id"]
+        suite = f"{project}:{framework_id}" if project else framework_id
+        counts = {
+            "tests": report["total_checks"],
+            "failures": report["checks_failed"],
+            "errors": report["checks_timed_out"],
+            "skipped": report["checks_skipped"],
+        }
+        write(f"  <testsuite name={quoteattr(suite)}{_counts(counts)}>\n")
+
+        for principle in report["principles"]:
+            classname = quoteattr(f"{suite}.{principle['id']}")
+            for check in principle.get("checks", ()):
+                name = quoteattr(f"{check['id']}: {check['name']}")
+                message = quoteattr(check["message"])
+                status = check["status"]
+                if status == "passed":
+                    write(f"    <testcase classname={classname} name={name}/>\n")
+                    continue
+
+                write(f"    <testcase classname={classname} name={name}>\n")
+                if status == "failed":
+                    body = check["message"]
+                    if check.get("suggestion"):
+                        body += f"\nSuggestion: {check['suggestion']}"
+                    write(
+                        f'      <failure message={message} type="{check["severity"]}">'
+                        f"{escape(body)}</failure>\n"
+                    )
+                elif status == "timeout":
+                    write(f'      <error message={message} type="timeout"/>\n')
+                else:
+                    write(f"      <skipped message={message}/>\n")
+                write("    </testcase>\n")
+
+        write("  </testsuite>\n")
+
+    write("</testsuites>\n")
+
+
+def _counts(counts: dict[str, int]) -> str:
+    return "".join(f' {name}="{value}"' for name, value in counts.items())
+
+
+# Format -> (file name in the report directory, writer)
+REPORT_FORMATS: dict[str, tuple[str, Callable[[dict[str, Any], BinaryIO], None]]] = {
+    "json": ("ethica-report.json", write_json),
+    "sarif": ("ethica-report.sarif", write_sarif),
+    "junit": ("ethica-report.junit.xml", write_junit),
+}
+
+
+def write_report(output: str, results: dict[str, Any], stream: Optional[BinaryIO] = None) -> None:
+    """
+    Write a report in one format.
+
+    Args:
+        output: Format, a key of REPORT_FORMATS
+        results: Report to write
+        stream: Binary stream to write to (default: stdout)
+    """
+    if stream is None:
+        # Anything printed before goes first
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+    REPORT_FORMATS[output][1](results, stream)
+    stream.flush()
+
+
+def write_reports(results: dict[str, Any], formats: list[str], output_dir: Path) -> list[Path]:
+    """
+    Write a report to files in several formats.
+
+    Args:
+        results: Report to write
+        formats: Formats to write; ones not in REPORT_FORMATS, such as
+            'text', are skipped
+        output_dir: Directory for the files, created if missing
+
+    Returns:
+        Paths of the files written
+    """
+    written = []
+    for output in dict.fromkeys(formats):
+        if output not in REPORT_FORMATS:
+            continue
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / REPORT_FORMATS[output][0]
+        with open(path, "wb") as f:
+            REPORT_FORMATS[output][1](results, f)
+        written.append(path)
+    return written
@@ -0,0 +1,57 @@
+# ABOUTME: Glob matching for project-relative POSIX paths
+# ABOUTME: Supports '*', '?' and '**' spanning directories, compiled once per pattern
+
+"""
+Path glob matching.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Pattern
+
+
+@lru_cache(maxsize=1024)
+def compile_glob(pattern: str) -> Pattern[str]:
+    """
+    Compile a glob to a regex matching whole relative paths.
+
+    '*' and '?' never cross '/', '**/' matches zero or more directories and a
+    trailing '**' matches everything below.
+
+    Args:
+        pattern: Glob such as 'docs/**/*.md'
+
+    Returns:
+        Compiled regex
+    """
+    parts = []
+    i = 0
+
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+
+    return re.compile("".join(parts) + r"\Z")
+
+
+def match_any(path: str, patterns: Iterable[str]) -> bool:
+    """Whether a relative path matches any of the globs"""
+    return any(compile_glob(pattern).match(path) for pattern in patterns)
+
+
+def has_magic(pattern: str) -> bool:
+    """Whether a path contains glob wildcards"""
+    return "*" in pattern or "?" in pattern
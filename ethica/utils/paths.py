@@ -0,0 +1,78 @@
+# ABOUTME: Per-user and per-project locations used by ethica
+# ABOUTME: Resolves cache and config directories following platform conventions
+
+"""
+Standard filesystem locations.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Project-local directory for custom frameworks and other ethica state
+PROJECT_DIRNAME = ".ethica"
+
+# Project-local directory holding the result cache
+CACHE_DIRNAME = ".ethica-cache"
+
+# Directories that never hold project files worth walking
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".tox",
+        ".nox",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".ipynb_checkpoints",
+        CACHE_DIRNAME,
+    }
+)
+
+
+def user_cache_dir() -> Path:
+    """
+    Per-user cache directory for ethica.
+
+    Honors ETHICA_CACHE_DIR, then the platform convention
+    (XDG_CACHE_HOME on Linux).
+    """
+    override = os.environ.get("ETHICA_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+
+    return base / "ethica"
+
+
+def user_config_dir() -> Path:
+    """
+    Per-user config directory for ethica.
+
+    Honors ETHICA_CONFIG_DIR, then the platform convention
+    (XDG_CONFIG_HOME on Linux).
+    """
+    override = os.environ.get("ETHICA_CONFIG_DIR")
+    if override:
+        return Path(override)
+
+    if sys.platform == "win32":
+        base = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
+
+    return base / "ethica"
@@ -0,0 +1,26 @@
+# ABOUTME: Shared pytest fixtures for the unit and integration tests
+# ABOUTME: Isolates the user cache from the developer's and runs git for repository tests
+
+"""
+Shared test fixtures.
+"""
+
+import subprocess
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_user_cache(tmp_path_factory, monkeypatch):
+    """Point the user cache (compiled specs, plugin index, imports) at a temp dir"""
+    monkeypatch.setenv("ETHICA_CACHE_DIR", str(tmp_path_factory.mktemp("ethica-cache")))
+
+
+@pytest.fixture
+def git():
+    """Run a git command in a directory, failing the test if git fails"""
+
+    def run(path, *args):
+        subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+    return run
@@ -0,0 +1,82 @@
+# ABOUTME: Smoke tests for the benchmark suite
+# ABOUTME: Keeps the synthetic generator and runner working as the engine changes
+
+"""
+Tests for the benchmark generator and runner.
+"""
+
+import json
+
+import pytest
+
+from benchmarks.generate import FRAMEWORK_ID, generate_framework, generate_monorepo
+from benchmarks.run import compare, main
+from ethica.core.checker import CheckEngine
+from ethica.core.registry import FrameworkRegistry
+
+
+def test_generated_tree_is_checkable(tmp_path):
+    """Test that generated projects run against the generated framework"""
+    registry_path = generate_framework(tmp_path / "frameworks", checks=40)
+    projects = generate_monorepo(tmp_path, projects=3, files=8, manifest_size=20)
+
+    spec = FrameworkRegistry(registry_path).load_framework_spec(FRAMEWORK_ID)
+    engine = CheckEngine(spec)
+    results = engine.run_checks(projects[0])
+
+    assert len(engine.checks) == 40
+    assert results["total_checks"] == 40
+    assert len(projects) == 3
+
+
+def test_generation_is_deterministic(tmp_path):
+    """Test that the same seed produces the same tree"""
+    first = generate_monorepo(tmp_path / "a", projects=2, files=4, manifest_size=10)
+    second = generate_monorepo(tmp_path / "b", projects=2, files=4, manifest_size=10)
+
+    def listing(root):
+        return sorted(
+            (p.relative_to(root).as_posix(), p.read_text()) for p in root.rglob("*") if p.is_file()
+        )
+
+    assert listing(tmp_path / "a") == listing(tmp_path / "b")
+    assert len(first) == len(second)
+
+
+def test_runner_writes_results(tmp_path):
+    """Test that results are machine-readable and comparable"""
+    output = tmp_path / "results.json"
+    status = main([
+        "--projects", "2", "--files", "2", "--checks", "10", "--manifest-size", "10",
+        "--repeat", "1", "--number", "1", "--filter", "parser", "--output", str(output),
+    ])
+
+    results = json.loads(output.read_text())
+    assert status == 0
+    assert set(results["results"]) == {
+        "parser.requirements",
+        "parser.pyproject",
+        "parser.setup_py",
+        "parser.poetry_lock",
+        "parser.pipfile_lock",
+    }
+    assert results["meta"]["params"]["checks"] == 10
+
+    slower = json.loads(output.read_text())
+    for stats in slower["results"].values():
+        stats["min"] *= 2
+    assert sorted(compare(results, slower, threshold=1.5)) == sorted(slower["results"])
+
+
+def test_cli_benchmarks_fail_on_errors(tmp_path):
+    """Test CLI benchmarks run real commands and raise rather than time an error"""
+    from benchmarks.run import _benchmarks
+
+    generate_framework(tmp_path / "frameworks", checks=10)
+    projects = generate_monorepo(tmp_path, projects=1, files=2, manifest_size=10)
+    benchmarks = _benchmarks(tmp_path, projects, 10)
+
+    assert b"ethica" in benchmarks["cli.version"]().stdout
+    (projects[0] / ".ai-ethics.yaml").write_text("frameworks:\n  - id: missing\n")
+    with pytest.raises(RuntimeError, match="exited"):
+        benchmarks["cli.check"]()
@@ -0,0 +1,135 @@
+# ABOUTME: Unit tests for the incremental result cache
+# ABOUTME: Tests warm hits, input-driven invalidation, and eviction
+
+"""
+Tests for the on-disk result cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from ethica.checks.manifests import ManifestIndex
+from ethica.core import cache as cache_module
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.registry import FrameworkRegistry
+
+
+@pytest.fixture
+def engine():
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    return CheckEngine(spec)
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+    (tmp_path / "requirements.txt").write_text("shap\n")
+    return tmp_path
+
+
+@pytest.fixture
+def build_count(monkeypatch):
+    """Count how often manifests are parsed"""
+    builds = []
+    original_build = ManifestIndex.build.__func__
+
+    def counting_build(cls, context):
+        builds.append(context)
+        return original_build(cls, context)
+
+    monkeypatch.setattr(ManifestIndex, "build", classmethod(counting_build))
+    return builds
+
+
+def _run(engine, project):
+    with ResultCache(project) as cache:
+        return engine.run_checks(project, cache=cache)
+
+
+def test_warm_run_does_not_reparse(engine, project, build_count):
+    """Test that an unchanged project is served entirely from the cache"""
+    cold = _run(engine, project)
+    assert len(build_count) == 1
+
+    warm = _run(engine, project)
+    assert len(build_count) == 1
+    assert warm == cold
+
+
+def test_manifest_change_invalidates(engine, project, build_count):
+    """Test that editing a manifest re-runs dependency checks"""
+    _run(engine, project)
+    (project / "requirements.txt").write_text("shap\nfairlearn\n")
+
+    results = _run(engine, project)
+
+    assert len(build_count) == 2
+    fairness = next(p for p in results["principles"] if p["id"] == "fairness")
+    assert fairness["status"] == "passed"
+
+
+def test_new_file_invalidates(engine, project):
+    """Test that creating a probed path re-runs file checks"""
+    _run(engine, project)
+    (project / "docs").mkdir()
+    (project / "docs" / "PRIVACY_IMPACT_ASSESSMENT.md").write_text("# PIA")
+
+    results = _run(engine, project)
+
+    privacy = next(p for p in results["principles"] if p["id"] == "privacy")
+    assert privacy["status"] == "passed"
+
+
+def test_glob_listing_invalidates(project):
+    """Test that adding a file matched by a glob re-runs content checks"""
+    spec = {
+        "metadata": {"id": "test", "version": "1.0"},
+        "checks": [
+            {
+                "id": "content-001",
+                "name": "No placeholders",
+                "principle": "transparency",
+                "severity": "error",
+                "description": "Docs have no template placeholders",
+                "type": "file-content",
+                "config": {"paths": ["docs/*.md"], "forbidden": ["TODO"]},
+            }
+        ],
+    }
+    engine = CheckEngine(spec)
+    (project / "docs").mkdir()
+    (project / "docs" / "a.md").write_text("done\n")
+
+    assert _run(engine, project)["checks_passed"] == 1
+
+    (project / "docs" / "b.md").write_text("TODO\n")
+
+    assert _run(engine, project)["checks_failed"] == 1
+
+
+def test_prune_by_age_and_size(project, engine):
+    """Test eviction of old entries and entries over the size budget"""
+    _run(engine, project)
+    cache = ResultCache(project, max_bytes=0)
+    entries = sorted(cache.results_dir.iterdir())
+    assert len(entries) == 5
+
+    old = time.time() - 3600
+    os.utime(entries[0], (old, old))
+    ResultCache(project, max_age=60).prune()
+    assert len(list(cache.results_dir.iterdir())) == 4
+
+    cache.prune()
+    assert list(cache.results_dir.iterdir()) == []
+
+
+def test_upgrade_invalidates(engine, project, build_count, monkeypatch):
+    """Test that results cached by another ethica release are not reused"""
+    _run(engine, project)
+    monkeypatch.setattr(cache_module, "__version__", "999.0.0")
+    _run(engine, project)
+
+    assert len(build_count) == 2
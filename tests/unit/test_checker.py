@@ -0,0 +1,147 @@
+# ABOUTME: Unit tests for the check engine
+# ABOUTME: Tests concurrent execution matches serial results exactly
+
+"""
+Tests for CheckEngine execution modes.
+"""
+
+import time
+
+import pytest
+from pathlib import Path
+
+from ethica.checks.base import CheckStatus
+from ethica.checks.file_checks import FileExistsCheck
+from ethica.core import checker
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.registry import FrameworkRegistry
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+class SlowFileExistsCheck(FileExistsCheck):
+    """File check that takes a while, to shuffle completion order"""
+
+    def run(self, project_path, context=None):
+        time.sleep(0.05 if self.check_id.endswith("1") else 0)
+        return super().run(project_path, context)
+
+
+class CpuBoundFileExistsCheck(FileExistsCheck):
+    """File check flagged to run in the process pool"""
+
+    cpu_bound = True
+
+
+def _spec_with_types(check_type: str) -> dict:
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    for check in spec["checks"]:
+        if check["type"] == "file-exists":
+            check["type"] = check_type
+    return spec
+
+
+@pytest.mark.parametrize("project", ["compliant_project", "non_compliant_project"])
+def test_parallel_matches_serial(project, monkeypatch):
+    """Test that --jobs output is identical to the serial path"""
+    monkeypatch.setitem(CheckEngine.CHECK_TYPES, "slow-file-exists", SlowFileExistsCheck)
+    spec = _spec_with_types("slow-file-exists")
+
+    serial = CheckEngine(spec).run_checks(FIXTURES / project)
+    parallel = CheckEngine(spec, jobs=4).run_checks(FIXTURES / project)
+
+    assert parallel == serial
+
+
+def test_cpu_bound_checks_use_processes(tmp_path, monkeypatch):
+    """Test CPU-bound checks in the process pool still cache their probes"""
+    monkeypatch.setitem(CheckEngine.CHECK_TYPES, "cpu-file-exists", CpuBoundFileExistsCheck)
+    spec = _spec_with_types("cpu-file-exists")
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+
+    serial = CheckEngine(spec).run_checks(tmp_path)
+    with ResultCache(tmp_path) as cache:
+        parallel = CheckEngine(spec, jobs=2).run_checks(tmp_path, cache=cache)
+
+    assert parallel == serial
+
+    # The file check's probes came back from the worker, so deleting the
+    # model card must invalidate its cached result
+    (tmp_path / "MODEL_CARD.md").unlink()
+    with ResultCache(tmp_path) as cache:
+        results = CheckEngine(spec).run_checks(tmp_path, cache=cache)
+
+    transparency = next(p for p in results["principles"] if p["id"] == "transparency")
+    assert transparency["checks"][0]["status"] == CheckStatus.FAILED.value
+
+
+def test_builtin_cpu_bound_checks_use_processes(tmp_path, monkeypatch):
+    """Test content and import checks run in the process pool with serial results"""
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    spec["checks"] += [
+        {
+            "id": "transparency-003",
+            "name": "Model Card Sections",
+            "principle": "transparency",
+            "severity": "warning",
+            "type": "file-content",
+            "description": "Model card documents intended use",
+            "config": {"paths": ["MODEL_CARD.md"], "required": ["## Intended Use"]},
+        },
+        {
+            "id": "transparency-004",
+            "name": "Explainability Usage",
+            "principle": "transparency",
+            "severity": "warning",
+            "type": "import-usage",
+            "description": "Code imports an explainability library",
+            "config": {"modules": ["shap"]},
+        },
+    ]
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card\n## Intended Use\n")
+    (tmp_path / "app.py").write_text("import shap\n")
+
+    pools = []
+
+    class RecordingPool(checker.ProcessPoolExecutor):
+        def submit(self, fn, check, *args, **kwargs):
+            pools.append(check.check_id)
+            return super().submit(fn, check, *args, **kwargs)
+
+    monkeypatch.setattr(checker, "ProcessPoolExecutor", RecordingPool)
+
+    serial = CheckEngine(spec).run_checks(tmp_path)
+    parallel = CheckEngine(spec, jobs=2).run_checks(tmp_path)
+
+    assert sorted(pools) == ["transparency-003", "transparency-004"]
+    assert parallel == serial
+    transparency = next(p for p in parallel["principles"] if p["id"] == "transparency")
+    assert [check["status"] for check in transparency["checks"][2:]] == [
+        CheckStatus.PASSED.value,
+        CheckStatus.PASSED.value,
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_on_result_streams_every_check(jobs, monkeypatch):
+    """Test that on_result sees each check once, fast checks first when parallel"""
+    monkeypatch.setitem(CheckEngine.CHECK_TYPES, "slow-file-exists", SlowFileExistsCheck)
+    engine = CheckEngine(_spec_with_types("slow-file-exists"), jobs=jobs)
+
+    seen = []
+    results = engine.run_checks(
+        FIXTURES / "compliant_project",
+        on_result=lambda check, result: seen.append((check.check_id, result.status)),
+    )
+
+    assert sorted(seen) == sorted(
+        (c["id"], CheckStatus(c["status"])) for p in results["principles"] for c in p["checks"]
+    )
+    if jobs > 1:
+        # The slow file checks finish last
+        assert {check_id for check_id, _ in seen[-3:]} == {
+            "transparency-001",
+            "privacy-001",
+            "accountability-001",
+        }
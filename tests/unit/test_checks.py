@@ -1,5 +1,5 @@
 # ABOUTME: Unit tests for compliance checks
-# ABOUTME: Tests file-exists and dependency-check implementations
+# ABOUTME: Tests file-exists, file-content, dependency-check and import-usage implementations
 
 """
 Tests for compliance checks.
@@ -9,8 +9,10 @@ import pytest
 from pathlib import Path
 
 from ethica.checks.base import CheckStatus, CheckSeverity
-from ethica.checks.file_checks import FileExistsCheck
+from ethica.checks.file_checks import FileContentCheck, FileExistsCheck
+from ethica.core.context import ProjectContext
 from ethica.checks.dependency_checks import DependencyCheck
+from ethica.checks.import_checks import ImportUsageCheck
 
 
 class TestFileExistsCheck:
@@ -104,6 +106,161 @@ class TestFileExistsCheck:
         assert result.status == CheckStatus.PASSED
 
 
+def _content_spec(check_id, **config):
+    return {
+        "id": check_id,
+        "name": "Test Content Check",
+        "principle": "test",
+        "severity": "error",
+        "description": "Test check",
+        "config": config,
+    }
+
+
+class TestFileContentCheck:
+    """Tests for FileContentCheck"""
+
+    def test_required_pattern_found(self, tmp_path):
+        """Test that a check passes when every required pattern appears in some file"""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "a.md").write_text("## Intended Use\n")
+        (tmp_path / "docs" / "b.md").write_text("## Limitations\n")
+
+        check = FileContentCheck(
+            _content_spec(
+                "test-001",
+                paths=["docs/*.md"],
+                required=["^## Intended Use", "^## Limitations"],
+            )
+        )
+        result = check.run(tmp_path)
+
+        assert result.status == CheckStatus.PASSED
+        assert "2 file(s)" in result.message
+
+    def test_required_pattern_missing(self, tmp_path):
+        """Test that missing required content fails with the pattern named"""
+        (tmp_path / "MODEL_CARD.md").write_text("## intended use\n")
+
+        check = FileContentCheck(
+            _content_spec("test-001", paths=["MODEL_CARD.md"], required=["## Intended Use"])
+        )
+        result = check.run(tmp_path)
+
+        assert result.status == CheckStatus.FAILED
+        assert "## Intended Use" in result.message
+        assert result.suggestion is not None
+
+        check = FileContentCheck(
+            _content_spec(
+                "test-002",
+                paths=["MODEL_CARD.md"],
+                required=["## Intended Use"],
+                ignore_case=True,
+            )
+        )
+        assert check.run(tmp_path).status == CheckStatus.PASSED
+
+    def test_forbidden_pattern(self, tmp_path):
+        """Test that a forbidden pattern fails the check and names the file"""
+        (tmp_path / "MODEL_CARD.md").write_text("# [Your Model Name]\n")
+
+        check = FileContentCheck(
+            _content_spec("test-001", paths=["*.md"], forbidden=[r"\[Your Model Name\]"])
+        )
+        result = check.run(tmp_path)
+
+        assert result.status == CheckStatus.FAILED
+        assert "MODEL_CARD.md" in result.message
+
+    def test_no_matching_files_skips(self, tmp_path):
+        """Test that a check with nothing to scan is skipped"""
+        check = FileContentCheck(
+            _content_spec("test-001", paths=["docs/**/*.md"], required=["x"])
+        )
+
+        assert check.run(tmp_path).status == CheckStatus.SKIPPED
+
+    def test_invalid_pattern_fails(self, tmp_path):
+        """Test that a bad regex fails only its own check"""
+        (tmp_path / "README.md").write_text("hello\n")
+        checks = [
+            FileContentCheck(_content_spec("bad", paths=["README.md"], required=["("])),
+            FileContentCheck(_content_spec("good", paths=["README.md"], required=["hello"])),
+        ]
+        FileContentCheck.prepare(checks)
+
+        assert checks[0].run(tmp_path).status == CheckStatus.FAILED
+        assert checks[1].run(tmp_path).status == CheckStatus.PASSED
+
+    def test_shared_matcher_scans_each_file_once(self, tmp_path, monkeypatch):
+        """Test that checks sharing a matcher map each file only once per context"""
+        (tmp_path / "README.md").write_text("alpha beta gamma\n")
+        checks = [
+            FileContentCheck(_content_spec("a", paths=["README.md"], required=["alpha"])),
+            FileContentCheck(_content_spec("b", paths=["*.md"], forbidden=["delta"])),
+            FileContentCheck(
+                _content_spec("c", paths=["README.md"], required=["gamma", "alpha beta"])
+            ),
+        ]
+        FileContentCheck.prepare(checks)
+
+        mapped = []
+        original = ProjectContext.map_file
+        monkeypatch.setattr(
+            ProjectContext,
+            "map_file",
+            lambda self, path: mapped.append(path) or original(self, path),
+        )
+
+        context = ProjectContext(tmp_path)
+        statuses = [check.run(tmp_path, context).status for check in checks]
+
+        assert statuses == [CheckStatus.PASSED] * 3
+        assert mapped == ["README.md"]
+
+    def test_overlapping_patterns(self, tmp_path):
+        """Test that a pattern overlapping another's match is still found"""
+        (tmp_path / "README.md").write_text("model card\n")
+        checks = [
+            FileContentCheck(_content_spec("a", paths=["README.md"], required=["model card"])),
+            FileContentCheck(_content_spec("b", paths=["README.md"], required=["card"])),
+            FileContentCheck(_content_spec("c", paths=["README.md"], required=[r"(\w)\1?odel"])),
+        ]
+        FileContentCheck.prepare(checks)
+
+        assert [check.run(tmp_path).status for check in checks] == [CheckStatus.PASSED] * 3
+
+    def test_patterns_found_in_one_pass(self, tmp_path):
+        """Test that patterns are found without searching for any of them on its own"""
+        (tmp_path / "README.md").write_text("model card\n" * 1000)
+        checks = [
+            FileContentCheck(_content_spec("a", paths=["README.md"], required=["model"])),
+            FileContentCheck(_content_spec("b", paths=["README.md"], required=["model card"])),
+            FileContentCheck(
+                _content_spec("c", paths=["README.md"], forbidden=["TODO", "lorem ipsum"])
+            ),
+        ]
+        FileContentCheck.prepare(checks)
+        # Any search for a single pattern would fail
+        checks[0].matcher._regexes = []
+
+        statuses = [check.run(tmp_path).status for check in checks]
+
+        assert statuses == [CheckStatus.PASSED] * 3
+
+    def test_glob_skips_tool_directories(self, tmp_path):
+        """Test that globs don't descend into directories like node_modules"""
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "README.md").write_text("secret\n")
+        (tmp_path / "README.md").write_text("fine\n")
+
+        context = ProjectContext(tmp_path)
+
+        assert context.glob("**/README.md") == ["README.md"]
+        assert context.glob("*/*/README.md") == []
+
+
 class TestDependencyCheck:
     """Tests for DependencyCheck"""
 
@@ -202,3 +359,58 @@ dependencies = [
         result = check.run(tmp_path)
 
         assert result.status == CheckStatus.PASSED
+
+
+class TestImportUsageCheck:
+    """Tests for ImportUsageCheck"""
+
+    def _spec(self, **config):
+        return {
+            "id": "test-003",
+            "name": "Test Import Check",
+            "principle": "test",
+            "severity": "warning",
+            "description": "Test check",
+            "config": config,
+        }
+
+    def test_import_found_with_location(self, tmp_path):
+        """Test that the check passes and reports where the module is imported"""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "explain.py").write_text("import numpy\nimport shap.plots\n")
+
+        check = ImportUsageCheck(self._spec(modules=["shap", "lime"]))
+        result = check.run(tmp_path)
+
+        assert result.status == CheckStatus.PASSED
+        assert "src/explain.py:2" in result.message
+
+    def test_declared_but_unused_fails(self, tmp_path):
+        """Test that declaring a package without importing it fails"""
+        (tmp_path / "requirements.txt").write_text("shap\n")
+        (tmp_path / "train.py").write_text("import sklearn\n")
+
+        check = ImportUsageCheck(self._spec(modules=["shap"]))
+        result = check.run(tmp_path)
+
+        assert result.status == CheckStatus.FAILED
+        assert result.suggestion is not None
+
+    def test_require_all_and_notebooks(self, tmp_path):
+        """Test require_all across Python files and opted-in notebooks"""
+        (tmp_path / "train.py").write_text("import fairlearn\n")
+        (tmp_path / "explain.ipynb").write_text(
+            '{"cells": [{"cell_type": "code", "source": ["import shap"]}]}'
+        )
+
+        without = ImportUsageCheck(self._spec(modules=["shap", "fairlearn"], require_all=True))
+        result = without.run(tmp_path)
+        assert result.status == CheckStatus.FAILED
+        assert "shap" in result.message
+
+        check = ImportUsageCheck(
+            self._spec(modules=["shap", "fairlearn"], require_all=True, notebooks=True)
+        )
+        result = check.run(tmp_path)
+        assert result.status == CheckStatus.PASSED
+        assert "explain.ipynb:cell1:1" in result.message
@@ -0,0 +1,63 @@
+# ABOUTME: Unit tests for the shared project context
+# ABOUTME: Tests manifest index contents and one-parse-per-run sharing
+
+"""
+Tests for project context and manifest index.
+"""
+
+from ethica.checks.dependency_checks import DependencyCheck
+from ethica.checks.manifests import ManifestIndex, normalize_name
+from ethica.core.context import ProjectContext
+
+
+def _dependency_spec(check_id: str, packages: list[str]) -> dict:
+    return {
+        "id": check_id,
+        "name": "Test Dependency Check",
+        "principle": "test",
+        "severity": "warning",
+        "description": "Test check",
+        "config": {"packages": packages},
+    }
+
+
+def test_normalize_name():
+    """Test PEP 503 name normalization"""
+    assert normalize_name("Themis_ML") == "themis-ml"
+    assert normalize_name("zope.interface") == "zope-interface"
+
+
+def test_manifest_index_sources(tmp_path):
+    """Test that the index records the file each package came from"""
+    (tmp_path / "requirements.txt").write_text("numpy>=1.20\nScikit_Learn==1.0\n")
+    (tmp_path / "setup.py").write_text('setup(install_requires=["shap>=0.40"])')
+
+    index = ProjectContext(tmp_path).manifest_index
+
+    assert "scikit-learn" in index
+    assert index.source("numpy") == "requirements.txt"
+    assert index.source("shap") == "setup.py"
+    assert index.source("lime") is None
+
+
+def test_manifest_index_parsed_once(tmp_path, monkeypatch):
+    """Test that dependency checks sharing a context parse manifests once"""
+    (tmp_path / "requirements.txt").write_text("shap\nfairlearn\n")
+
+    builds = []
+    original_build = ManifestIndex.build.__func__
+
+    def counting_build(cls, context):
+        builds.append(context)
+        return original_build(cls, context)
+
+    monkeypatch.setattr(ManifestIndex, "build", classmethod(counting_build))
+
+    context = ProjectContext(tmp_path)
+    first = DependencyCheck(_dependency_spec("dep-001", ["shap"])).run(tmp_path, context)
+    second = DependencyCheck(_dependency_spec("dep-002", ["fairlearn"])).run(tmp_path, context)
+
+    assert first.status.value == "passed"
+    assert second.status.value == "passed"
+    assert "requirements.txt" in first.message
+    assert len(builds) == 1
@@ -0,0 +1,161 @@
+# ABOUTME: Unit tests for fleet mode
+# ABOUTME: Tests project discovery, CPU detection, and merged fleet reports
+
+"""
+Tests for fleet mode.
+"""
+
+import pytest
+from pathlib import Path
+
+from ethica.core.fleet import available_cpus, discover_projects, run_fleet
+
+CONFIG = """
+frameworks:
+  - id: unesco-2021
+    compliance_level: standard
+"""
+
+
+def _make_project(path: Path, compliant: bool = True, config: str = CONFIG) -> None:
+    """Create a project directory with a config"""
+    path.mkdir(parents=True, exist_ok=True)
+    (path / ".ai-ethics.yaml").write_text(config)
+    if compliant:
+        (path / "MODEL_CARD.md").write_text("# Model Card")
+        (path / "PRIVACY_IMPACT_ASSESSMENT.md").write_text("# PIA")
+        (path / ".git").mkdir()
+        (path / "requirements.txt").write_text("shap\nfairlearn\n")
+
+
+def test_discover_projects(tmp_path):
+    """Test that discovery finds configs and skips vendored directories"""
+    _make_project(tmp_path / "services" / "a")
+    _make_project(tmp_path / "models" / "b")
+    _make_project(tmp_path / "node_modules" / "c")
+
+    projects = discover_projects(tmp_path)
+
+    assert projects == [tmp_path / "models" / "b", tmp_path / "services" / "a"]
+
+
+def test_available_cpus():
+    """Test that CPU detection returns a usable worker count"""
+    assert available_cpus() >= 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_fleet(tmp_path, workers):
+    """Test merged report and fleet status across projects"""
+    _make_project(tmp_path / "good")
+    _make_project(tmp_path / "bad", compliant=False)
+
+    fleet = run_fleet(tmp_path, workers=workers)
+
+    assert fleet["total_projects"] == 2
+    assert [p["path"] for p in fleet["projects"]] == ["bad", "good"]
+
+    bad, good = fleet["projects"]
+    assert good["results"]["overall_status"] == "passed"
+    assert bad["results"]["overall_status"] == "failed"
+    assert fleet["projects_failed"] == 1
+    assert fleet["overall_status"] == "failed"
+
+
+def test_run_fleet_config_error(tmp_path):
+    """Test that a project with a bad config is reported, not fatal"""
+    _make_project(tmp_path / "good")
+    _make_project(tmp_path / "broken", config="frameworks: []\n")
+
+    specs: dict = {}
+    fleet = run_fleet(tmp_path, workers=1, specs=specs)
+
+    broken = fleet["projects"][0]
+    assert "No frameworks configured" in broken["error"]
+    assert fleet["projects_errored"] == 1
+    assert fleet["overall_status"] == "failed"
+    assert list(specs) == ["unesco-2021"]
+
+
+def test_run_fleet_skips_disabled_frameworks(tmp_path):
+    """Test disabled frameworks are passed over, and projects with none enabled error"""
+    _make_project(
+        tmp_path / "good",
+        config="frameworks:\n  - id: missing\n    enabled: false\n  - id: unesco-2021\n",
+    )
+    _make_project(
+        tmp_path / "off", config="frameworks:\n  - id: unesco-2021\n    enabled: false\n"
+    )
+
+    fleet = run_fleet(tmp_path, workers=1)
+
+    good, off = fleet["projects"]
+    assert good["framework_id"] == "unesco-2021"
+    assert "results" in good
+    assert "No enabled frameworks" in off["error"]
+
+
+def test_run_fleet_counters_only(tmp_path):
+    """Test that keep_checks=False leaves only counters and framework totals"""
+    _make_project(tmp_path / "good")
+    _make_project(tmp_path / "bad", compliant=False)
+
+    streamed = []
+    fleet = run_fleet(
+        tmp_path,
+        workers=1,
+        keep_checks=False,
+        on_project=lambda entry: streamed.append(len(entry["results"]["principles"][0]["checks"])),
+    )
+
+    assert all(count > 0 for count in streamed)
+    for project in fleet["projects"]:
+        assert all("checks" not in p for p in project["results"]["principles"])
+
+    totals = fleet["frameworks"]["unesco-2021"]
+    assert totals["total_checks"] == 2 * project["results"]["total_checks"]
+    assert totals["overall_status"] == "failed"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_fleet_project_failure(tmp_path, workers):
+    """Test that a project whose checks fail to run is reported, not fatal"""
+    _make_project(tmp_path / "good")
+    _make_project(tmp_path / "broken", config="frameworks:\n  - id: broken\n")
+
+    fleet = run_fleet(tmp_path, workers=workers, specs={"broken": {"checks": [{}]}})
+
+    broken, good = fleet["projects"]
+    assert broken["error"]
+    assert "results" not in broken
+    assert good["results"]["overall_status"] == "passed"
+    assert fleet["projects_errored"] == 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_fleet_evaluates_compliance_level(tmp_path, workers):
+    """Test that a project short of its level fails the fleet like a plain check"""
+    _make_project(tmp_path / "short")
+    (tmp_path / "short" / "requirements.txt").write_text("")
+    _make_project(tmp_path / "pruned", config=CONFIG.replace("standard", "basic"))
+
+    fleet = run_fleet(tmp_path, workers=workers)
+
+    pruned, short = fleet["projects"]
+    assert short["results"]["overall_status"] == "passed with warnings"
+    assert short["results"]["compliance"]["reached"] is False
+    assert pruned["results"]["compliance"]["reached"] is True
+    assert pruned["results"]["compliance"]["checks_pruned"] == 2
+    assert pruned["results"]["total_checks"] == 3
+    assert fleet["projects_failed"] == 1
+    assert fleet["overall_status"] == "failed"
+
+
+def test_run_fleet_unknown_level(tmp_path):
+    """Test that an unknown compliance level is a per-project error"""
+    _make_project(tmp_path / "good")
+
+    fleet = run_fleet(tmp_path, level="platinum", workers=1)
+
+    assert "Unknown compliance level 'platinum'" in fleet["projects"][0]["error"]
+    assert fleet["projects_errored"] == 1
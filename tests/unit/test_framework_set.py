@@ -0,0 +1,98 @@
+# ABOUTME: Unit tests for multi-framework runs
+# ABOUTME: Tests cross-framework check deduplication, attribution and merged reports
+
+"""
+Tests for FrameworkSet.
+"""
+
+import copy
+
+import pytest
+
+from ethica.checks.manifests import ManifestIndex
+from ethica.core.framework_set import FrameworkSet, check_fingerprint
+from ethica.core.planning import ComplianceLevel
+from ethica.core.registry import FrameworkRegistry
+
+
+@pytest.fixture
+def unesco():
+    return FrameworkRegistry().load_framework_spec("unesco-2021")
+
+
+@pytest.fixture
+def other(unesco):
+    """A second framework sharing most checks with UNESCO"""
+    spec = copy.deepcopy(unesco)
+    spec["metadata"]["id"] = "acme-ai-policy"
+    spec["metadata"]["version"] = "2.0.0"
+    spec.pop("compliance_levels")
+    for check in spec["checks"]:
+        check["id"] = "acme-" + check["id"]
+        check["severity"] = "warning"
+    # One check of its own
+    spec["checks"][0]["config"] = {"paths": ["MODEL_CARD.md"]}
+    return spec
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+    (tmp_path / "requirements.txt").write_text("shap\n")
+    return tmp_path
+
+
+def test_fingerprint_ignores_identity(unesco, other):
+    """Test that only what a check does is part of its fingerprint"""
+    assert check_fingerprint(unesco["checks"][1]) == check_fingerprint(other["checks"][1])
+    assert check_fingerprint(unesco["checks"][0]) != check_fingerprint(other["checks"][0])
+
+
+def test_shared_checks_run_once(unesco, other, project, monkeypatch):
+    """Test that identical checks run once and manifests are parsed once"""
+    builds = []
+    original_build = ManifestIndex.build.__func__
+    monkeypatch.setattr(
+        ManifestIndex,
+        "build",
+        classmethod(lambda cls, ctx: builds.append(ctx) or original_build(cls, ctx)),
+    )
+    seen = []
+
+    framework_set = FrameworkSet([(unesco, None), (other, None)])
+    results = framework_set.run(project, on_result=lambda fid, check, result: seen.append(fid))
+
+    assert len(framework_set.engine.checks) == 6
+    assert results["unique_checks"] == 6
+    assert results["checks_deduplicated"] == 4
+    assert results["total_checks"] == 10
+    assert len(builds) == 1
+    assert seen.count("unesco-2021") == seen.count("acme-ai-policy") == 5
+
+
+def test_results_attributed_per_framework(unesco, other, project):
+    """Test that a shared result carries each framework's check identity"""
+    results = FrameworkSet([(unesco, None), (other, None)]).run(project)
+
+    acme = results["frameworks"]["acme-ai-policy"]
+    checks = {c["id"]: c for p in acme["principles"] for c in p["checks"]}
+
+    assert checks["acme-privacy-001"]["status"] == "failed"
+    assert checks["acme-privacy-001"]["severity"] == "warning"
+    # Only warnings fail in acme, errors fail in UNESCO
+    assert acme["overall_status"] == "passed with warnings"
+    assert results["frameworks"]["unesco-2021"]["overall_status"] == "failed"
+    assert results["overall_status"] == "failed"
+
+
+def test_levels_evaluated_per_framework(unesco, other, project):
+    """Test that each framework is planned and evaluated at its own level"""
+    basic = ComplianceLevel.from_framework(unesco, "basic")
+
+    results = FrameworkSet([(unesco, basic), (other, None)]).run(project)
+
+    unesco_report = results["frameworks"]["unesco-2021"]
+    assert unesco_report["total_checks"] == 3
+    assert unesco_report["compliance"]["checks_pruned"] == 2
+    assert "compliance" not in results["frameworks"]["acme-ai-policy"]
+    assert results["frameworks"]["acme-ai-policy"]["total_checks"] == 5
@@ -0,0 +1,148 @@
+# ABOUTME: Unit tests for checking git revisions from the object store
+# ABOUTME: Tests tree listing, cat-file reads, the blob cache and ethica check --rev
+
+"""
+Tests for GitTreeFileSystem.
+"""
+
+import subprocess
+
+import pytest
+
+from ethica.core import gitfs
+from ethica.core.checker import CheckEngine
+from ethica.core.context import ProjectContext
+from ethica.core.gitfs import BlobCache, GitTreeFileSystem
+from ethica.core.registry import FrameworkRegistry
+
+
+@pytest.fixture
+def repo(tmp_path, git):
+    """A repo whose v1 tag has a model card that was later deleted"""
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+    (tmp_path / "requirements.txt").write_text("shap\n")
+    (tmp_path / "svc").mkdir()
+    (tmp_path / "svc" / "requirements.txt").write_text("lime\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "v1")
+    git(tmp_path, "tag", "v1")
+
+    (tmp_path / "MODEL_CARD.md").unlink()
+    git(tmp_path, "commit", "-q", "-a", "-m", "drop model card")
+    # Uncommitted work isn't seen either
+    (tmp_path / "requirements.txt").write_text("numpy\n")
+    return tmp_path
+
+
+def test_tree_is_read_from_the_commit(repo):
+    """Test files come from the revision, not the work tree"""
+    context = ProjectContext(repo, fs=GitTreeFileSystem(repo, "v1"))
+
+    assert context.exists("MODEL_CARD.md")
+    assert context.read_text("requirements.txt") == "shap\n"
+    assert context.glob("**/requirements.txt") == ["requirements.txt", "svc/requirements.txt"]
+
+    head = ProjectContext(repo, fs=GitTreeFileSystem(repo, "HEAD"))
+    assert not head.exists("MODEL_CARD.md")
+
+
+def test_subdirectory_project(repo):
+    """Test a project below the repository root sees only its subtree"""
+    fs = GitTreeFileSystem(repo / "svc", "v1")
+
+    assert fs.read_bytes("requirements.txt") == b"lime\n"
+    assert not fs.exists("MODEL_CARD.md")
+    # A checkout of svc/ has no .git of its own
+    assert not fs.exists(".git")
+    fs.close()
+
+
+def test_git_directory_present(repo):
+    """Test the repository's .git is present at the top level as in a checkout"""
+    fs = GitTreeFileSystem(repo, "v1")
+
+    assert fs.exists(".git")
+    assert fs.stat(".git") is not None
+    assert next(fs.walk(".git")) == (".git", [], [])
+    fs.close()
+
+
+def test_blobs_read_once_through_one_process(repo, monkeypatch):
+    """Test one cat-file process serves all reads and blobs are cached by SHA"""
+    monkeypatch.setattr(gitfs, "blob_cache", BlobCache())
+    started = []
+    original = subprocess.Popen
+    monkeypatch.setattr(
+        gitfs.subprocess, "Popen", lambda *a, **kw: started.append(a) or original(*a, **kw)
+    )
+
+    v1 = GitTreeFileSystem(repo, "v1")
+    head = GitTreeFileSystem(repo, "HEAD")
+    assert v1.read_bytes("requirements.txt") == b"shap\n"
+    assert v1.read_bytes("svc/requirements.txt") == b"lime\n"
+    # Unchanged between the revisions, so served from the cache
+    assert head.read_bytes("svc/requirements.txt") == b"lime\n"
+
+    assert [args[0][1] for args in started].count("cat-file") == 1
+    assert head.blob_sha("svc/requirements.txt") == v1.blob_sha("svc/requirements.txt")
+    v1.close()
+    head.close()
+
+
+def test_bad_revision(repo):
+    """Test an unknown revision is reported as a git error"""
+    with pytest.raises(RuntimeError, match="git log failed"):
+        GitTreeFileSystem(repo, "no-such-tag")
+
+
+def test_engine_checks_revision(repo):
+    """Test a framework runs against a revision"""
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    fs = GitTreeFileSystem(repo, "v1")
+
+    results = CheckEngine(spec, jobs=4).run_checks(repo, fs=fs)
+
+    checks = {c["id"]: c for p in results["principles"] for c in p["checks"]}
+    assert checks["transparency-001"]["status"] == "passed"
+    assert "shap" in checks["transparency-002"]["message"]
+    fs.close()
+
+
+def test_check_rev_command(repo, monkeypatch):
+    """Test ethica check --rev reports on the revision"""
+    from typer.testing import CliRunner
+
+    from ethica.__main__ import app
+
+    (repo / ".ai-ethics.yaml").write_text("frameworks:\n  - id: unesco-2021\n")
+    monkeypatch.chdir(repo)
+
+    result = CliRunner().invoke(app, ["check", "--rev", "v1"])
+
+    assert "Checking at v1 against unesco-2021" in result.stdout
+    assert "Checks Passed: 3/5" in result.stdout
+
+
+def test_check_rev_matches_check_on_clean_tree(repo, git, monkeypatch):
+    """Test check and check --rev HEAD give the same report when nothing is uncommitted"""
+    import json
+
+    from typer.testing import CliRunner
+
+    from ethica.__main__ import app
+
+    (repo / ".ai-ethics.yaml").write_text("frameworks:\n  - id: unesco-2021\n")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "config")
+    monkeypatch.chdir(repo)
+    runner = CliRunner()
+
+    local = runner.invoke(app, ["check", "--output", "json", "--no-cache"])
+    at_head = runner.invoke(app, ["check", "--output", "json", "--rev", "HEAD"])
+
+    assert (at_head.exit_code, json.loads(at_head.stdout)) == (
+        local.exit_code, json.loads(local.stdout)
+    )
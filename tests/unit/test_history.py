@@ -0,0 +1,136 @@
+# ABOUTME: Unit tests for compliance history over a range of git commits
+# ABOUTME: Tests the commit log, blob-level result reuse and ethica history output
+
+"""
+Tests for ComplianceHistory.
+"""
+
+import csv
+import io
+
+import pytest
+
+from ethica.core.checker import CheckEngine
+from ethica.core.gitfs import GitTreeFileSystem
+from ethica.core.history import ComplianceHistory, commit_log, point
+from ethica.core.planning import CheckPlan, ComplianceLevel
+from ethica.core.registry import FrameworkRegistry
+
+
+@pytest.fixture
+def repo(tmp_path, git):
+    """A repo whose model card comes, goes and comes back unchanged"""
+
+    def commit(message, files):
+        """Write (or with None, delete) files and commit them"""
+        for name, content in files.items():
+            target = tmp_path / name
+            if content is None:
+                target.unlink()
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text(content)
+        git(tmp_path, "add", "-A")
+        git(tmp_path, "commit", "-q", "--allow-empty", "-m", message)
+
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    commit("start", {"requirements.txt": "numpy\n", "src/app.py": "import numpy\n"})
+    commit("add card", {"MODEL_CARD.md": "# Model Card"})
+    commit("notes", {"notes.txt": "hello"})
+    commit("drop card", {"MODEL_CARD.md": None})
+    commit("restore card", {"MODEL_CARD.md": "# Model Card"})
+    commit("explain", {"requirements.txt": "numpy\nshap\n", "src/app.py": None})
+    return tmp_path
+
+
+def _plan():
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    return CheckPlan(CheckEngine(spec), ComplianceLevel.from_framework(spec, "standard"))
+
+
+def test_commit_log(repo):
+    """Test commits come oldest first with their changes and sizes"""
+    commits = commit_log(repo)
+
+    assert [c.subject for c in commits] == [
+        "start", "add card", "notes", "drop card", "restore card", "explain"
+    ]
+    assert commits[3].changes == [("MODEL_CARD.md", None)]
+    assert commits[3].added_or_removed == {"MODEL_CARD.md"}
+    path, (sha, size) = commits[1].changes[0]
+    assert (path, size) == ("MODEL_CARD.md", len("# Model Card"))
+    assert sha == GitTreeFileSystem(repo, commits[4].sha).blob_sha("MODEL_CARD.md")
+    assert [c.subject for c in commit_log(repo, "HEAD~2..HEAD")] == ["restore card", "explain"]
+
+
+def test_advance_matches_listing(repo):
+    """Test applying changes gives the same tree as listing the commit"""
+    commits = commit_log(repo)
+    fs = GitTreeFileSystem(repo, commits[0].sha)
+    for c in commits[1:]:
+        fs.advance(c.sha, c.timestamp, c.changes)
+
+    head = GitTreeFileSystem(repo, "HEAD")
+    assert list(fs.walk(".")) == list(head.walk("."))
+    # src/ was emptied, and git has no empty directories
+    assert not fs.exists("src")
+    fs.close()
+    head.close()
+
+
+def test_history_matches_checking_each_commit(repo):
+    """Test every point equals a full run at that commit"""
+    points = ComplianceHistory(_plan()).run(repo)
+
+    for c, data in zip(commit_log(repo), points):
+        fs = GitTreeFileSystem(repo, c.sha)
+        expected = point(c, _plan().run(repo, fs=fs), data["checks_run"])
+        fs.close()
+        assert data == expected
+
+    assert [p["principles"]["transparency"] for p in points] == [
+        "failed", "failed", "failed", "failed", "failed", "passed"
+    ]
+
+
+def test_history_matches_local_run(repo):
+    """Test the last point equals checking the clean work tree of that commit"""
+    points = ComplianceHistory(_plan()).run(repo)
+
+    expected = point(commit_log(repo)[-1], _plan().run(repo), points[-1]["checks_run"])
+    assert points[-1] == expected
+    assert points[-1]["principles"]["accountability"] == "passed"
+
+
+def test_results_reused_by_blob(repo):
+    """Test only checks whose inputs changed run, and reverted content reuses results"""
+    history = ComplianceHistory(_plan())
+
+    points = history.run(repo)
+
+    # start: all 5; add card: the model card check; notes: nothing; drop
+    # and restore card: back to states already seen, so nothing; explain:
+    # the two dependency checks reading requirements.txt
+    assert [p["checks_run"] for p in points] == [5, 1, 0, 0, 0, 2]
+    assert history.checks_run == 8
+    assert history.checks_reused == 22
+
+
+def test_history_command(repo, monkeypatch):
+    """Test ethica history writes one CSV row per commit"""
+    from typer.testing import CliRunner
+
+    from ethica.__main__ import app
+
+    (repo / ".ai-ethics.yaml").write_text("frameworks:\n  - id: unesco-2021\n")
+    monkeypatch.chdir(repo)
+
+    result = CliRunner().invoke(app, ["history", "--output-file", "history.csv"])
+
+    assert result.exit_code == 0
+    rows = list(csv.DictReader(io.StringIO((repo / "history.csv").read_text())))
+    assert [row["subject"] for row in rows][-2:] == ["restore card", "explain"]
+    assert rows[-1]["transparency"] == "passed"
+    assert rows[-1]["checks_passed"] == "3"
@@ -0,0 +1,147 @@
+# ABOUTME: Unit tests for source import scanning
+# ABOUTME: Tests AST and notebook extraction, the import index and its per-file cache
+
+"""
+Tests for import extraction and the import index.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from ethica.checks import imports
+from ethica.checks.imports import ImportIndex, extract_imports, extract_notebook_imports
+from ethica.core.context import ProjectContext
+
+
+def _age(path):
+    """Backdate a file past the racy-mtime window so its scan is cached"""
+    old = time.time() - 60
+    os.utime(path, (old, old))
+
+
+def _write_sources(root, count):
+    (root / "pkg").mkdir()
+    for i in range(count):
+        path = root / "pkg" / f"m{i}.py"
+        path.write_text(f"import os\nfrom sklearn.metrics import f1_score  # {i}\n")
+        _age(path)
+
+
+def test_extract_imports():
+    """Test absolute, from, dynamic and relative imports"""
+    source = (
+        "import shap, numpy.linalg as la\n"
+        "from fairlearn.metrics import MetricFrame\n"
+        "from . import sibling\n"
+        "def f():\n"
+        "    import importlib\n"
+        "    return importlib.import_module('lime')\n"
+    )
+
+    found = extract_imports(source)
+
+    assert found == {
+        "shap": ["1"],
+        "numpy.linalg": ["1"],
+        "fairlearn.metrics": ["2"],
+        "importlib": ["5"],
+        "lime": ["6"],
+    }
+    with pytest.raises(SyntaxError):
+        extract_imports("import (")
+
+
+def test_extract_notebook_imports():
+    """Test code cells are scanned with magics blanked and cell locations"""
+    notebook = {
+        "cells": [
+            {"cell_type": "markdown", "source": ["import nothing"]},
+            {"cell_type": "code", "source": ["%matplotlib inline\n", "import shap\n"]},
+            {"cell_type": "code", "source": "x = (\n"},
+            {"cell_type": "code", "source": "!pip install lime\nfrom lime import lime_tabular"},
+        ]
+    }
+
+    found = extract_notebook_imports(json.dumps(notebook))
+
+    assert found == {"shap": ["cell2:2"], "lime": ["cell4:2"]}
+
+
+def test_index_locations_and_submodules(tmp_path):
+    """Test submodule imports count for their package and report locations"""
+    (tmp_path / "train.py").write_text("import os\nfrom shap.plots import waterfall\n")
+    (tmp_path / "broken.py").write_text("def (\n")
+    (tmp_path / "nb.ipynb").write_text(
+        json.dumps({"cells": [{"cell_type": "code", "source": "import fairlearn"}]})
+    )
+
+    index = ProjectContext(tmp_path).import_index()
+
+    assert "shap" in index
+    assert "sha" not in index
+    assert index.locations("shap") == ["train.py:2"]
+    assert "fairlearn" not in index
+    assert "broken.py" in index.errors
+
+    with_notebooks = ProjectContext(tmp_path).import_index(notebooks=True)
+    assert with_notebooks.locations("fairlearn") == ["nb.ipynb:cell1:1"]
+
+
+def test_rescan_only_parses_changed_files(tmp_path, monkeypatch):
+    """Test that cached per-file imports are reused until a file changes"""
+    _write_sources(tmp_path, 5)
+    cache_dir = tmp_path / ".ethica-cache"
+
+    first = ProjectContext(tmp_path, cache_dir=cache_dir).import_index()
+    assert len(first.locations("sklearn")) == 5
+    assert (cache_dir / ".gitignore").exists()
+
+    parsed = []
+    original = imports._extract_file
+    monkeypatch.setattr(imports, "_extract_file", lambda p: parsed.append(p) or original(p))
+
+    changed = tmp_path / "pkg" / "m3.py"
+    changed.write_text("import shap\n")
+    second = ProjectContext(tmp_path, cache_dir=cache_dir).import_index()
+
+    assert parsed == [str(changed)]
+    assert second.locations("shap") == ["pkg/m3.py:1"]
+    assert len(second.locations("sklearn")) == 4
+
+
+def test_parallel_extraction_matches_serial(tmp_path, monkeypatch):
+    """Test that the process pool gives the same index as a serial scan"""
+    _write_sources(tmp_path, 12)
+    serial = ImportIndex.build(ProjectContext(tmp_path))
+
+    monkeypatch.setattr(imports, "PARALLEL_MIN_FILES", 2)
+    parallel = ImportIndex.build(ProjectContext(tmp_path))
+
+    assert parallel.modules == serial.modules
+    assert parallel.files == 12
+
+
+@pytest.mark.parametrize("nested", [True, False])
+def test_extraction_falls_back_to_serial(tmp_path, monkeypatch, nested):
+    """Test that worker processes scan serially and a refused pool isn't fatal"""
+    _write_sources(tmp_path, 12)
+    pools = []
+
+    def refuse_pool(*args, **kwargs):
+        # A daemonic process can't have children
+        pools.append(kwargs)
+        raise AssertionError("daemonic processes are not allowed to have children")
+
+    monkeypatch.setattr(imports, "PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(imports, "ProcessPoolExecutor", refuse_pool)
+    monkeypatch.setattr("ethica.core.fleet.available_cpus", lambda: 4)
+    if nested:
+        monkeypatch.setattr(imports.multiprocessing, "parent_process", lambda: object())
+
+    index = ImportIndex.build(ProjectContext(tmp_path))
+
+    assert index.files == 12
+    assert len(pools) == (0 if nested else 1)
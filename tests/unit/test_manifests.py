@@ -0,0 +1,166 @@
+# ABOUTME: Unit tests for manifest parsers and the dependency index
+# ABOUTME: Tests requirements, pyproject, setup.py and streaming lockfile parsing
+
+"""
+Tests for manifest parsing.
+"""
+
+import json
+
+import pytest
+
+from ethica.checks.manifests import (
+    ManifestError,
+    ManifestIndex,
+    parse_pipfile_lock,
+    parse_pyproject_toml,
+    parse_requirements,
+    parse_setup_py,
+    parse_toml_lock,
+    requirement_name,
+)
+from ethica.core.context import PROBE_READ, ProjectContext
+
+
+@pytest.mark.parametrize(
+    "requirement,name",
+    [
+        ("shap", "shap"),
+        ("zope.interface>=5", "zope.interface"),
+        ("fairlearn[customplots]>=0.8", "fairlearn"),
+        ('aif360; python_version < "3.12"', "aif360"),
+        ("lime @ https://example.com/lime.whl", "lime"),
+        (">=1.0", None),
+    ],
+)
+def test_requirement_name(requirement, name):
+    """Test PEP 508 name extraction"""
+    assert requirement_name(requirement) == name
+
+
+def test_parse_requirements():
+    """Test pins, hashes, continuations, editables and includes"""
+    includes: list = []
+    content = """
+# comment
+shap==0.42.1 \\
+    --hash=sha256:abc
+Fairlearn[extra]>=0.8  # inline comment
+-e git+https://github.com/example/lime.git@v1#egg=lime
+--index-url https://pypi.example.com/simple
+-c constraints.txt
+-r dev.txt
+--requirement=test.txt
+./local/package
+"""
+    assert parse_requirements(content, includes) == ["shap", "Fairlearn", "lime"]
+    assert includes == ["dev.txt", "test.txt"]
+
+
+def test_parse_pyproject_toml():
+    """Test PEP 621, PEP 735 and Poetry tables"""
+    content = """
+[project]
+dependencies = ["numpy>=1.20", "zope.interface"]
+
+[project.optional-dependencies]
+explain = ["shap[plots]>=0.40; python_version >= '3.9'"]
+
+[dependency-groups]
+test = ["pytest", {include-group = "lint"}]
+
+[tool.poetry.dependencies]
+python = "^3.9"
+fairlearn = "^0.8"
+
+[tool.poetry.group.docs.dependencies]
+mkdocs = "*"
+"""
+    assert set(parse_pyproject_toml(content)) == {
+        "numpy", "zope.interface", "shap", "pytest", "fairlearn", "mkdocs",
+    }
+
+
+def test_parse_pyproject_toml_invalid():
+    """Test that broken TOML is reported instead of ignored"""
+    with pytest.raises(ManifestError, match="invalid TOML"):
+        parse_pyproject_toml("[project\ndependencies = [")
+
+
+def test_parse_setup_py():
+    """Test literal and name-referenced requirements without running setup.py"""
+    content = """
+import setuptools
+
+REQUIRES = ["shap>=0.40", "numpy"]
+
+setuptools.setup(
+    name="example",
+    install_requires=REQUIRES,
+    extras_require={"fair": ["fairlearn"], "docs": "mkdocs\\nsphinx"},
+)
+"""
+    assert parse_setup_py(content) == ["shap", "numpy", "fairlearn", "mkdocs", "sphinx"]
+
+    with pytest.raises(ManifestError, match="invalid Python"):
+        parse_setup_py("setup(")
+
+
+def test_parse_toml_lock():
+    """Test poetry.lock / uv.lock package streaming"""
+    lines = iter([
+        "version = 1\n",
+        "[[package]]\n",
+        'name = "shap"\n',
+        'version = "0.42.1"\n',
+        "[package.dependencies]\n",
+        'name = "not-a-package"\n',
+        "[[package]]\n",
+        'name = "numpy"\n',
+        "[metadata]\n",
+        'name = "ignored"\n',
+    ])
+    assert list(parse_toml_lock(lines)) == ["shap", "numpy"]
+
+
+def test_parse_pipfile_lock_chunked():
+    """Test that package keys are found however the text is split"""
+    lock = {
+        "_meta": {"hash": {"sha256": "x"}, "sources": [{"name": "pypi", "url": "u"}]},
+        "default": {"shap": {"version": "==0.42", "markers": "x"}, "numpy": {}},
+        "develop": {"pytest": {"hashes": ['sha256:a"b']}},
+    }
+    text = json.dumps(lock, indent=4)
+
+    for size in (1, 7, len(text)):
+        chunks = (text[i:i + size] for i in range(0, len(text), size))
+        assert list(parse_pipfile_lock(chunks)) == ["shap", "numpy", "pytest"]
+
+    with pytest.raises(ManifestError):
+        list(parse_pipfile_lock(['{"default": {"shap": {}']))
+
+
+def test_index_follows_includes(tmp_path):
+    """Test -r includes are indexed and recorded as probes"""
+    (tmp_path / "requirements").mkdir()
+    (tmp_path / "requirements.txt").write_text("-r requirements/base.txt\nshap\n")
+    (tmp_path / "requirements" / "base.txt").write_text("-r ../requirements.txt\nnumpy\n")
+
+    context = ProjectContext(tmp_path)
+    with context.track() as probes:
+        index = ManifestIndex.build(context)
+
+    assert index.source("shap") == "requirements.txt"
+    assert index.source("numpy") == "requirements/base.txt"
+    assert (PROBE_READ, "requirements/base.txt") in probes
+
+
+def test_index_records_parse_errors(tmp_path):
+    """Test that unparseable manifests are surfaced on the index"""
+    (tmp_path / "pyproject.toml").write_text("[project\n")
+    (tmp_path / "poetry.lock").write_text('[[package]]\nname = "Shap"\n')
+
+    index = ManifestIndex.build(ProjectContext(tmp_path))
+
+    assert "pyproject.toml" in index.errors
+    assert index.source("shap") == "poetry.lock"
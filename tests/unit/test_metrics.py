@@ -0,0 +1,111 @@
+# ABOUTME: Unit tests for check instrumentation
+# ABOUTME: Tests per-check metrics, I/O counters, hooks and the profile report
+
+"""
+Tests for per-check timing, I/O counters and hooks.
+"""
+
+import json
+import threading
+
+import pytest
+
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.context import ProjectContext
+from ethica.core.metrics import CheckHook, profile_report
+from ethica.core.registry import FrameworkRegistry
+
+
+class RecordingHook(CheckHook):
+    """Hook that records every callback"""
+
+    def __init__(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def on_check_start(self, check):
+        with self.lock:
+            self.events.append(("start", check.check_id))
+
+    def on_check_finish(self, check, result, metrics):
+        with self.lock:
+            self.events.append(("finish", check.check_id, metrics))
+
+
+@pytest.fixture
+def spec():
+    return FrameworkRegistry().load_framework_spec("unesco-2021")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+    (tmp_path / "requirements.txt").write_text("shap\nfairlearn\n")
+    return tmp_path
+
+
+def test_context_counts_io(project):
+    """Test that stats and bytes read are counted per scope"""
+    context = ProjectContext(project)
+
+    with context.measure() as outer:
+        context.exists("MODEL_CARD.md")
+        with context.measure() as inner:
+            context.read_text("requirements.txt")
+
+    assert (inner.stats, inner.bytes_read) == (1, len("shap\nfairlearn\n"))
+    assert (outer.stats, outer.bytes_read) == (2, len("shap\nfairlearn\n"))
+
+
+def test_profile_attaches_metrics(spec, project):
+    """Test that profiled results carry metrics and unprofiled ones don't"""
+    results = CheckEngine(spec, profile=True).run_checks(project)
+    checks = [c for p in results["principles"] for c in p["checks"]]
+
+    assert all(c["metrics"]["wall_time"] >= 0 for c in checks)
+    assert sum(c["metrics"]["bytes_read"] for c in checks) > 0
+    assert sum(c["metrics"]["files_stat"] for c in checks) > 0
+
+    plain = CheckEngine(spec).run_checks(project)
+    assert all("metrics" not in c for p in plain["principles"] for c in p["checks"])
+
+
+def test_cache_hits_are_marked(spec, project):
+    """Test that cached results report cached metrics and aren't stored with metrics"""
+    engine = CheckEngine(spec, profile=True)
+    with ResultCache(project) as cache:
+        engine.run_checks(project, cache=cache)
+    with ResultCache(project) as cache:
+        results = engine.run_checks(project, cache=cache)
+
+    checks = [c for p in results["principles"] for c in p["checks"]]
+    assert all(c["metrics"]["cached"] for c in checks)
+
+    entries = (project / ".ethica-cache" / "results").glob("*.json")
+    assert all("metrics" not in json.loads(e.read_text())["result"] for e in entries)
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_hooks_wrap_every_check(spec, project, jobs):
+    """Test that start and finish hooks fire once per check"""
+    hook = RecordingHook()
+    engine = CheckEngine(spec, jobs=jobs, hooks=[hook])
+    engine.run_checks(project)
+
+    ids = sorted(c.check_id for c in engine.checks)
+    assert sorted(e[1] for e in hook.events if e[0] == "start") == ids
+    assert sorted(e[1] for e in hook.events if e[0] == "finish") == ids
+    assert all(e[2].wall_time >= 0 for e in hook.events if e[0] == "finish")
+
+
+def test_profile_report_ranks_slowest(spec, project):
+    """Test that the report sorts checks and sums principles"""
+    results = CheckEngine(spec, profile=True).run_checks(project)
+    report = profile_report(results, limit=2)
+
+    walls = [c["wall_time"] for c in report["checks"]]
+    assert len(walls) == 2
+    assert walls == sorted(walls, reverse=True)
+    assert {p["id"] for p in report["principles"]} == {p["id"] for p in results["principles"]}
+    assert report["total"]["bytes_read"] == sum(p["bytes_read"] for p in report["principles"])
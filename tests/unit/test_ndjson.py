@@ -0,0 +1,62 @@
+# ABOUTME: Unit tests for NDJSON output
+# ABOUTME: Tests the line writer and `ethica check --output ndjson`
+
+"""
+Tests for streaming NDJSON output.
+"""
+
+import io
+import json
+
+from ethica.checks.base import CheckResult, CheckSeverity, CheckStatus
+from ethica.checks.file_checks import FileExistsCheck
+from ethica.reporting.ndjson import NDJSONWriter
+
+
+def test_writer_lines():
+    """Test that each line is a compact, self-contained JSON object"""
+    stream = io.StringIO()
+    writer = NDJSONWriter(stream)
+    check = FileExistsCheck({
+        "id": "t-001",
+        "name": "Model Card",
+        "principle": "transparency",
+        "severity": "error",
+        "description": "Model card",
+        "config": {"paths": ["MODEL_CARD.md"]},
+    })
+    result = CheckResult("t-001", "Model Card", CheckStatus.PASSED, "ok", CheckSeverity.ERROR)
+
+    writer.check("local", check, result)
+    writer.summary({
+        "framework_id": "local",
+        "principles": [{"id": "transparency", "checks": [result.to_dict()], "passed": 1}],
+        "overall_status": "passed",
+    })
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert '": ' not in lines[0]
+    first, summary = map(json.loads, lines)
+    assert first["type"] == "check"
+    assert first["principle"] == "transparency"
+    assert first["status"] == "passed"
+    assert summary["type"] == "summary"
+    assert summary["principles"] == [{"id": "transparency", "passed": 1}]
+
+
+def test_check_command_ndjson(tmp_path, monkeypatch):
+    """Test that ndjson output has one line per check and nothing else"""
+    from typer.testing import CliRunner
+
+    from ethica.__main__ import app
+
+    (tmp_path / ".ai-ethics.yaml").write_text(
+        "frameworks:\n  - id: unesco-2021\n    compliance_level: standard\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(app, ["check", "--output", "ndjson", "--no-cache"])
+
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["type"] for line in lines] == ["check"] * 5 + ["summary"]
+    assert lines[-1]["total_checks"] == 5
@@ -0,0 +1,85 @@
+# ABOUTME: Unit tests for compliance-level planning
+# ABOUTME: Tests pruning, cheap-first ordering, level evaluation and fail-fast stops
+
+"""
+Tests for CheckPlan and compliance level evaluation.
+"""
+
+import pytest
+from pathlib import Path
+
+from ethica.core.checker import CheckEngine
+from ethica.core.planning import CheckPlan, ComplianceLevel
+from ethica.core.registry import FrameworkRegistry
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def spec():
+    return FrameworkRegistry().load_framework_spec("unesco-2021")
+
+
+def _plan(spec, level_id, jobs=1):
+    engine = CheckEngine(spec, jobs=jobs)
+    return CheckPlan(engine, ComplianceLevel.from_framework(spec, level_id))
+
+
+def test_unknown_level(spec):
+    """Test that an undefined level names the available ones"""
+    with pytest.raises(ValueError, match="basic, standard, verified"):
+        ComplianceLevel.from_framework(spec, "gold")
+
+
+def test_plan_prunes_and_orders_cheap_first(spec):
+    """Test that basic only plans required principles, file checks first"""
+    plan = _plan(spec, "basic")
+    checks = [plan.engine.checks[i] for i in plan.indexes]
+
+    assert {check.principle for check in checks} == {"transparency", "accountability"}
+    assert plan.pruned == 2
+    assert [check.cost for check in checks] == sorted(check.cost for check in checks)
+
+
+def test_level_reached(spec, tmp_path):
+    """Test a project meeting every requirement of the basic level"""
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+    (tmp_path / ".git").mkdir()
+
+    report = _plan(spec, "basic").run(tmp_path)
+
+    assert report["total_checks"] == 3
+    assert report["compliance"]["reached"] is True
+    assert report["compliance"]["checks_pruned"] == 2
+    # Report principles stay in framework order
+    assert [p["id"] for p in report["principles"]] == ["transparency", "accountability"]
+
+
+def test_warning_failures_only_count_against_pass_rate(spec, tmp_path):
+    """Test that failed warnings don't unmeet a principle but lower the pass rate"""
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "PRIVACY_IMPACT_ASSESSMENT.md").write_text("# PIA")
+
+    report = _plan(spec, "standard").run(tmp_path)
+
+    assert report["compliance"]["unmet_principles"] == []
+    assert report["compliance"]["pass_rate"] == pytest.approx(0.6)
+    assert report["compliance"]["reached"] is False
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_fail_fast_stops_once_unreachable(spec, jobs):
+    """Test that fail-fast stops after the first failed required error check"""
+    project = FIXTURES / "non_compliant_project"
+
+    full = _plan(spec, "verified", jobs=jobs).run(project)
+    fast = _plan(spec, "verified", jobs=jobs).run(project, fail_fast=True)
+
+    assert full["compliance"]["reached"] is False
+    assert fast["compliance"]["reached"] is False
+    assert fast["total_checks"] == fast["compliance"]["checks_run"]
+    if jobs == 1:
+        assert fast["compliance"]["stopped_early"] is True
+        assert fast["total_checks"] == 1 < full["total_checks"]
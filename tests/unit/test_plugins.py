@@ -0,0 +1,159 @@
+# ABOUTME: Unit tests for check type plugins and project custom checks
+# ABOUTME: Tests the cached entry point index, lazy plugin imports and custom_checks
+
+"""
+Tests for plugin discovery and custom checks.
+"""
+
+import sys
+
+import pytest
+
+from ethica.checks.base import CheckStatus
+from ethica.core import plugins
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.config import with_custom_checks
+from ethica.core.plugins import PluginIndex
+from ethica.core.registry import FrameworkRegistry
+
+PLUGIN_SOURCE = '''
+from ethica.checks.base import BaseCheck, CheckStatus
+
+
+class LicenseCheck(BaseCheck):
+    def run(self, project_path, context=None):
+        context = self._get_context(project_path, context)
+        if context.exists(self.config.get("path", "LICENSE")):
+            return self._create_result(CheckStatus.PASSED, "License found")
+        return self._create_result(CheckStatus.FAILED, "No license")
+'''
+
+
+@pytest.fixture
+def plugin_env(tmp_path, monkeypatch):
+    """An installed distribution providing the 'license' check type"""
+    site = tmp_path / "site"
+    site.mkdir()
+    (site / "acme_checks.py").write_text(PLUGIN_SOURCE)
+    dist_info = site / "acme_checks-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: acme-checks\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[ethica.checks]\nlicense = acme_checks:LicenseCheck\nbroken = acme_checks:Missing\n"
+    )
+
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.setenv("ETHICA_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delitem(sys.modules, "acme_checks", raising=False)
+    plugins.reset()
+    yield site
+    plugins.reset()
+    sys.modules.pop("acme_checks", None)
+
+
+def _spec(*checks):
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    spec["checks"] = [
+        {
+            "id": check_id,
+            "name": check_id,
+            "principle": "transparency",
+            "severity": "error",
+            "description": check_id,
+            "type": check_type,
+        }
+        for check_id, check_type in checks
+    ]
+    return spec
+
+
+def test_index_is_cached_until_environment_changes(plugin_env, tmp_path, monkeypatch):
+    """Test that a warm index never scans installed distributions"""
+    index = PluginIndex.load()
+    assert index.entries["license"] == "acme_checks:LicenseCheck"
+    assert "acme_checks" not in sys.modules
+
+    def scan():
+        raise AssertionError("scanned entry points")
+
+    monkeypatch.setattr(PluginIndex, "discover", classmethod(lambda cls: scan()))
+    assert "license" in PluginIndex.load()
+
+    # Installing another distribution invalidates the index
+    (plugin_env / "other-1.0.dist-info").mkdir()
+    with pytest.raises(AssertionError, match="scanned"):
+        PluginIndex.load()
+
+
+def test_plugin_imported_only_when_referenced(plugin_env, tmp_path):
+    """Test that plugins load lazily and run like built-in checks"""
+    CheckEngine(_spec(("t-1", "file-exists")))
+    assert "acme_checks" not in sys.modules
+
+    engine = CheckEngine(_spec(("t-1", "license")))
+    assert "acme_checks" in sys.modules
+
+    (tmp_path / "LICENSE").write_text("Apache-2.0")
+    results = engine.execute(tmp_path)
+    assert results[0][0].status == CheckStatus.PASSED
+
+
+def test_unavailable_types_are_reported_not_cached(plugin_env, tmp_path):
+    """Test that unknown or broken types give an uncached skipped result"""
+    engine = CheckEngine(_spec(("t-1", "nonexistent"), ("t-2", "broken")))
+
+    with ResultCache(tmp_path) as cache:
+        results = [result for result, _ in engine.execute(tmp_path, cache=cache)]
+
+    with ResultCache(tmp_path) as cache:
+        key = cache.check_key(engine.framework_spec["metadata"], engine.checks[0].spec)
+        assert cache.last_result(key) is None
+
+    assert [result.status for result in results] == [CheckStatus.SKIPPED] * 2
+    assert "Is the plugin that provides it installed?" in results[0].message
+    assert "Could not load check type 'broken'" in results[1].message
+
+
+def test_plugin_upgrade_invalidates_cached_results(plugin_env, tmp_path):
+    """Test cached plugin results are keyed by the providing distribution's version"""
+    engine = CheckEngine(_spec(("t-1", "license")))
+    assert plugins.plugin_index().provider("license") == (
+        "acme_checks:LicenseCheck (acme-checks 1.0)"
+    )
+    with ResultCache(tmp_path) as cache:
+        engine.execute(tmp_path, cache=cache)
+        assert cache.last_result(engine.cache_key(engine.checks[0])) is not None
+
+    dist_info = plugin_env / "acme_checks-1.1.dist-info"
+    (plugin_env / "acme_checks-1.0.dist-info").rename(dist_info)
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: acme-checks\nVersion: 1.1\n")
+    plugins.reset()
+
+    upgraded = CheckEngine(_spec(("t-1", "license")))
+    with ResultCache(tmp_path) as cache:
+        assert cache.last_result(upgraded.cache_key(upgraded.checks[0])) is None
+
+
+def test_custom_checks(plugin_env, tmp_path):
+    """Test custom checks from .ai-ethics.yaml run alongside the framework"""
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    config = {
+        "custom_checks": [
+            {"id": "custom-001", "type": "license", "config": {"path": "COPYING"}},
+        ]
+    }
+
+    combined = with_custom_checks(spec, config)
+
+    assert len(combined["checks"]) == len(spec["checks"]) + 1
+    results = CheckEngine(combined).run_checks(tmp_path)
+    custom = next(p for p in results["principles"] if p["id"] == "custom")
+    assert custom["checks"][0]["status"] == "failed"
+    assert custom["checks"][0]["severity"] == "warning"
+
+    assert with_custom_checks(spec, {"custom_checks": []}) is spec
+    with pytest.raises(ValueError, match="already used"):
+        with_custom_checks(spec, {"custom_checks": [{**spec["checks"][0]}]})
+    with pytest.raises(ValueError, match="need an id and a type"):
+        with_custom_checks(spec, {"custom_checks": [{"id": "custom-002"}]})
@@ -84,3 +84,73 @@ def test_framework_spec_structure():
         assert "type" in check
         assert "severity" in check
         assert "principle" in check
+
+
+def _write_registry(base: Path, frameworks: dict) -> Path:
+    """Write a registry.yaml with a framework.yaml for each entry"""
+    import yaml
+
+    base.mkdir(parents=True, exist_ok=True)
+    for fw_list in frameworks.values():
+        for fw in fw_list or []:
+            fw_dir = base / fw["id"]
+            fw_dir.mkdir(exist_ok=True)
+            (fw_dir / "framework.yaml").write_text(
+                yaml.dump({"metadata": {"id": fw["id"], "source": str(base)}})
+            )
+
+    registry_path = base / "registry.yaml"
+    registry_path.write_text(yaml.dump({"frameworks": frameworks}))
+    return registry_path
+
+
+def test_search_paths_merge_and_override(tmp_path):
+    """Test that later registries add to and override earlier ones"""
+    builtin = _write_registry(tmp_path / "builtin", {
+        "international": [{"id": "a", "name": "A", "tags": ["gov"]}],
+        "industry": None,
+    })
+    project = _write_registry(tmp_path / "project", {
+        "internal": [
+            {"id": "a", "name": "A (patched)", "tags": ["gov"]},
+            {"id": "b", "name": "B", "tags": ["gov", "internal"]},
+        ],
+    })
+
+    registry = FrameworkRegistry(search_paths=[builtin, tmp_path / "missing.yaml", project])
+
+    assert [fw["id"] for fw in registry.list_frameworks()] == ["a", "b"]
+    assert registry.get_framework("a")["name"] == "A (patched)"
+    assert registry.get_framework("a")["category"] == "internal"
+    assert registry.get_framework_dir("a") == tmp_path / "project" / "a"
+    assert registry.load_framework_spec("a")["metadata"]["source"] == str(tmp_path / "project")
+
+
+def test_tag_and_category_indexes(tmp_path):
+    """Test filtered listing by tag and category"""
+    registry_path = _write_registry(tmp_path, {
+        "international": [{"id": "a", "name": "A", "tags": ["gov"]}],
+        "internal": [{"id": "b", "name": "B", "tags": ["gov", "internal"]}],
+    })
+    registry = FrameworkRegistry(registry_path)
+
+    assert sorted(fw["id"] for fw in registry.list_frameworks(tag="gov")) == ["a", "b"]
+    assert [fw["id"] for fw in registry.list_frameworks(category="internal")] == ["b"]
+    assert registry.list_frameworks(tag="gov", category="international")[0]["id"] == "a"
+    assert registry.list_frameworks(tag="missing") == []
+
+
+def test_refresh_picks_up_changes(tmp_path):
+    """Test that refresh reloads only when a registry file changed"""
+    registry_path = _write_registry(tmp_path, {"international": [{"id": "a", "name": "A"}]})
+    registry = FrameworkRegistry(registry_path)
+
+    assert registry.refresh() is False
+
+    _write_registry(tmp_path, {"international": [
+        {"id": "a", "name": "A"},
+        {"id": "b", "name": "B, a longer entry"},
+    ]})
+
+    assert registry.refresh() is True
+    assert registry.get_framework("b") is not None
@@ -0,0 +1,145 @@
+# ABOUTME: Unit tests for sandboxed execution of plugin checks
+# ABOUTME: Tests per-check time and memory limits, worker reuse and the run deadline
+
+"""
+Tests for SandboxPool and engine limits.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+from ethica.checks.base import BaseCheck, CheckStatus
+from ethica.core import plugins
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.registry import FrameworkRegistry
+from ethica.core.sandbox import SandboxLimits
+
+
+class PidCheck(BaseCheck):
+    """Passes, reporting the process it ran in"""
+
+    def run(self, project_path, context=None):
+        return self._create_result(CheckStatus.PASSED, str(os.getpid()))
+
+
+class HangingCheck(BaseCheck):
+    """Never finishes"""
+
+    def run(self, project_path, context=None):
+        while True:
+            time.sleep(1)
+
+
+class HungryCheck(BaseCheck):
+    """Allocates far more memory than it's allowed"""
+
+    def run(self, project_path, context=None):
+        data = bytearray(2 * 1024 ** 3)
+        return self._create_result(CheckStatus.PASSED, str(len(data)))
+
+
+class SlowCheck(BaseCheck):
+    """Built-in style check that takes a while in-process"""
+
+    def run(self, project_path, context=None):
+        time.sleep(0.3)
+        return self._create_result(CheckStatus.PASSED, "done")
+
+
+@pytest.fixture(autouse=True)
+def plugin_types(monkeypatch):
+    """Register the test checks as plugin-provided types"""
+    for name, check_class in [
+        ("pid", PidCheck),
+        ("hang", HangingCheck),
+        ("hungry", HungryCheck),
+    ]:
+        monkeypatch.setitem(plugins._loaded, name, check_class)
+    monkeypatch.setitem(CheckEngine.CHECK_TYPES, "slow", SlowCheck)
+
+
+def _spec(*types, severity="error"):
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    spec["checks"] = [
+        {
+            "id": f"t-{i}",
+            "name": f"{check_type} check",
+            "principle": "transparency",
+            "severity": severity,
+            "description": check_type,
+            "type": check_type,
+        }
+        for i, check_type in enumerate(types)
+    ]
+    return spec
+
+
+def _statuses(engine, project_path, **kwargs):
+    return [result.status for result, _ in engine.execute(project_path, **kwargs)]
+
+
+def test_plugin_checks_run_in_reused_worker(tmp_path):
+    """Test that plugin checks share one worker process and built-ins stay in-process"""
+    engine = CheckEngine(_spec("pid", "pid", "slow"))
+
+    results = [result for result, _ in engine.execute(tmp_path)]
+
+    assert [r.status for r in results] == [CheckStatus.PASSED] * 3
+    assert results[0].message == results[1].message != str(os.getpid())
+    assert id(engine.checks[2]) not in engine.sandboxed
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_hanging_check_times_out(tmp_path, jobs):
+    """Test that a hung check times out and later checks still run"""
+    engine = CheckEngine(
+        _spec("hang", "pid", "pid"), jobs=jobs, limits=SandboxLimits(check_timeout=0.5)
+    )
+
+    started = time.perf_counter()
+    with ResultCache(tmp_path) as cache:
+        results = engine.run_checks(tmp_path, cache=cache)
+
+    assert time.perf_counter() - started < 10
+    checks = results["principles"][0]["checks"]
+    assert [c["status"] for c in checks] == ["timeout", "passed", "passed"]
+    assert "0.5s time limit" in checks[0]["message"]
+    assert results["checks_timed_out"] == 1
+    assert results["overall_status"] == "failed"
+
+    # Timeouts aren't cached
+    with ResultCache(tmp_path) as cache:
+        key = cache.check_key(engine.framework_spec["metadata"], engine.checks[0].spec)
+        assert cache.last_result(key) is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no resource limits")
+def test_memory_limit(tmp_path):
+    """Test that a check over its memory limit is stopped and reported"""
+    engine = CheckEngine(_spec("hungry", "pid"), limits=SandboxLimits(check_memory_mb=256))
+
+    results = [result for result, _ in engine.execute(tmp_path)]
+
+    assert results[0].status == CheckStatus.SKIPPED
+    assert "256 MB memory limit" in results[0].message
+    assert results[1].status == CheckStatus.PASSED
+
+
+def test_run_deadline(tmp_path):
+    """Test that checks not finished by the deadline time out"""
+    limits = SandboxLimits(deadline=0.5)
+    engine = CheckEngine(_spec("slow", "slow", "hang", "slow", "pid"), limits=limits)
+
+    statuses = _statuses(engine, tmp_path)
+
+    assert statuses == [
+        CheckStatus.PASSED,
+        CheckStatus.PASSED,
+        CheckStatus.TIMEOUT,
+        CheckStatus.TIMEOUT,
+        CheckStatus.TIMEOUT,
+    ]
@@ -0,0 +1,131 @@
+# ABOUTME: Unit tests for git-diff-aware check selection
+# ABOUTME: Tests glob matching, git change detection and reuse of last results
+
+"""
+Tests for running only the checks affected by changed files.
+"""
+
+import pytest
+
+from ethica.checks.manifests import ManifestIndex
+from ethica.core.cache import ResultCache
+from ethica.core.checker import CheckEngine
+from ethica.core.planning import ComplianceLevel
+from ethica.core.registry import FrameworkRegistry
+from ethica.core.selection import affected_checks, changed_files, run_changed
+from ethica.utils.globs import match_any
+
+
+@pytest.fixture
+def engine():
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    return CheckEngine(spec)
+
+
+@pytest.fixture
+def repo(tmp_path, git):
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "requirements.txt").write_text("shap\n")
+    (tmp_path / "README.md").write_text("# Project")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "path,patterns,expected",
+    [
+        ("MODEL_CARD.md", ["MODEL_CARD.md"], True),
+        ("docs/MODEL_CARD.md", ["MODEL_CARD.md"], False),
+        ("docs/a/b.md", ["docs/**"], True),
+        ("b.md", ["**/*.md"], True),
+        ("docs/a/b.md", ["**/*.md"], True),
+        ("docs/b.py", ["docs/*.md"], False),
+    ],
+)
+def test_match_any(path, patterns, expected):
+    """Test glob matching of relative paths"""
+    assert match_any(path, patterns) is expected
+
+
+def test_affected_checks(engine):
+    """Test that checks are selected by their declared inputs"""
+
+    def ids(indexes):
+        return {engine.checks[i].check_id for i in indexes}
+
+    assert ids(affected_checks(engine, {"docs/MODEL_CARD.md"})) == {"transparency-001"}
+    assert ids(affected_checks(engine, {"requirements.txt"})) == {
+        "fairness-001",
+        "transparency-002",
+    }
+    assert affected_checks(engine, {"src/model.py"}) == []
+
+
+def test_changed_files(repo, git):
+    """Test staged and since-ref change detection"""
+    (repo / "requirements.txt").write_text("shap\nfairlearn\n")
+    (repo / "MODEL_CARD.md").write_text("# Model Card")
+
+    assert changed_files(repo, staged=True) == set()
+    assert changed_files(repo, since="HEAD") == {"requirements.txt", "MODEL_CARD.md"}
+
+    git(repo, "add", "requirements.txt")
+    assert changed_files(repo, staged=True) == {"requirements.txt"}
+
+
+def test_changed_files_bad_ref(repo):
+    """Test that git errors are surfaced"""
+    with pytest.raises(RuntimeError, match="git diff failed"):
+        changed_files(repo, since="no-such-ref")
+
+
+def test_run_changed_reuses_last_results(engine, repo, monkeypatch):
+    """Test that unaffected checks reuse cached results without re-running"""
+    with ResultCache(repo) as cache:
+        engine.run_checks(repo, cache=cache)
+
+    builds = []
+    original_build = ManifestIndex.build.__func__
+    monkeypatch.setattr(
+        ManifestIndex,
+        "build",
+        classmethod(lambda cls, ctx: builds.append(ctx) or original_build(cls, ctx)),
+    )
+
+    (repo / "MODEL_CARD.md").write_text("# Model Card")
+    with ResultCache(repo) as cache:
+        results, ran = run_changed(engine, repo, {"MODEL_CARD.md"}, cache)
+
+    assert [engine.checks[i].check_id for i in ran] == ["transparency-001"]
+    assert builds == []
+    assert results == engine.run_checks(repo)
+
+
+def test_run_changed_without_cache_runs_everything(engine, repo):
+    """Test that checks with no previous result always run"""
+    results, ran = run_changed(engine, repo, set(), None)
+
+    assert len(ran) == len(engine.checks)
+    assert results["total_checks"] == len(engine.checks)
+
+
+def test_run_changed_evaluates_compliance_level(engine, repo):
+    """Test that a level prunes unneeded checks and is evaluated over reused results"""
+    level = ComplianceLevel.from_framework(engine.framework_spec, "basic")
+    with ResultCache(repo) as cache:
+        results, ran = run_changed(engine, repo, set(), cache, level)
+
+    assert {engine.checks[i].principle for i in ran} == {"transparency", "accountability"}
+    assert results["total_checks"] == 3
+    assert results["compliance"]["reached"] is False
+    assert results["compliance"]["unmet_principles"] == ["transparency"]
+
+    (repo / "MODEL_CARD.md").write_text("# Model Card")
+    with ResultCache(repo) as cache:
+        results, ran = run_changed(engine, repo, {"MODEL_CARD.md"}, cache, level)
+
+    assert [engine.checks[i].check_id for i in ran] == ["transparency-001"]
+    assert results["compliance"]["reached"] is True
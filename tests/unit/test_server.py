@@ -0,0 +1,211 @@
+# ABOUTME: Unit tests for the check daemon
+# ABOUTME: Tests request handling, framework reload, concurrency and the client
+
+"""
+Tests for the check daemon.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import yaml
+
+from ethica.core.registry import FrameworkRegistry
+from ethica.core.server import CheckServer, EnginePool, daemon_running, send_request
+
+FRAMEWORK = {
+    "metadata": {"id": "local", "name": "Local", "version": "1.0.0"},
+    "principles": [{"id": "transparency", "name": "Transparency", "weight": "critical"}],
+    "checks": [
+        {
+            "id": "transparency-001",
+            "name": "Model Card",
+            "principle": "transparency",
+            "severity": "error",
+            "type": "file-exists",
+            "description": "Model card",
+            "config": {"paths": ["MODEL_CARD.md"]},
+        }
+    ],
+}
+
+
+@pytest.fixture
+def registry(tmp_path):
+    frameworks_dir = tmp_path / "frameworks"
+    (frameworks_dir / "local").mkdir(parents=True)
+    (frameworks_dir / "local" / "framework.yaml").write_text(yaml.dump(FRAMEWORK))
+    (frameworks_dir / "registry.yaml").write_text(
+        yaml.dump({"frameworks": {"internal": [{"id": "local", "name": "Local"}]}})
+    )
+    return FrameworkRegistry(frameworks_dir / "registry.yaml")
+
+
+@pytest.fixture
+def project(tmp_path):
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    (project_path / ".ai-ethics.yaml").write_text("frameworks:\n  - id: local\n")
+    (project_path / "MODEL_CARD.md").write_text("# Model Card")
+    return project_path
+
+
+@pytest.fixture
+def server(tmp_path, registry):
+    socket_path = tmp_path / "ethica.sock"
+    server = CheckServer(socket_path, EnginePool(registry))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_ping_and_check(server, project):
+    """Test that the daemon answers pings and runs checks"""
+    assert daemon_running(server.socket_path)
+
+    response = send_request(
+        {"command": "check", "project": str(project), "use_cache": False}, server.socket_path
+    )
+
+    assert response["ok"] is True
+    assert response["framework_id"] == "local"
+    assert response["results"]["overall_status"] == "passed"
+
+
+def test_reloads_changed_framework(server, registry, project):
+    """Test that editing framework.yaml takes effect without a restart"""
+    request = {"command": "check", "project": str(project), "use_cache": False}
+    send_request(request, server.socket_path)
+
+    spec_path = registry.get_framework_dir("local") / "framework.yaml"
+    changed = dict(FRAMEWORK, checks=[
+        dict(FRAMEWORK["checks"][0], config={"paths": ["docs/MODEL_CARD.md"]})
+    ])
+    spec_path.write_text(yaml.dump(changed))
+    st = spec_path.stat()
+    os.utime(spec_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    response = send_request(request, server.socket_path)
+
+    assert response["results"]["overall_status"] == "failed"
+
+
+def test_concurrent_requests(server, project):
+    """Test that simultaneous requests are all served"""
+    request = {"command": "check", "project": str(project)}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(
+            lambda _: send_request(request, server.socket_path), range(16)
+        ))
+
+    assert all(r["results"]["overall_status"] == "passed" for r in responses)
+
+
+def test_errors_are_reported(server, tmp_path):
+    """Test that bad requests get an error response instead of a dead socket"""
+    response = send_request({"command": "check", "project": str(tmp_path)}, server.socket_path)
+    assert response["ok"] is False
+
+    response = send_request({"command": "bogus"}, server.socket_path)
+    assert "Unknown command" in response["error"]
+
+
+def test_no_daemon(tmp_path):
+    """Test client behavior with nothing listening"""
+    assert daemon_running(tmp_path / "missing.sock") is False
+
+
+def test_refuses_second_daemon(server, registry):
+    """Test that a live socket isn't stolen by a second daemon"""
+    with pytest.raises(RuntimeError, match="already listening"):
+        CheckServer(server.socket_path, EnginePool(registry))
+
+
+def test_project_registry(project, tmp_path):
+    """Test frameworks come from the requesting project's own registry"""
+    frameworks_dir = project / ".ethica" / "frameworks"
+    (frameworks_dir / "local").mkdir(parents=True)
+    (frameworks_dir / "local" / "framework.yaml").write_text(yaml.dump(FRAMEWORK))
+    (frameworks_dir / "registry.yaml").write_text(
+        yaml.dump({"frameworks": {"internal": [{"id": "local", "name": "Local"}]}})
+    )
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / ".ai-ethics.yaml").write_text("frameworks:\n  - id: local\n")
+    pool = EnginePool()
+
+    response = pool.handle({"command": "check", "project": str(project), "use_cache": False})
+
+    assert response["results"]["overall_status"] == "passed"
+    with pytest.raises(ValueError, match="'local' not found"):
+        pool.handle({"command": "check", "project": str(other), "use_cache": False})
+
+
+def test_wedged_daemon_falls_back(project, tmp_path, monkeypatch):
+    """Test check --daemon runs locally when the daemon never answers"""
+    import socket
+
+    from typer.testing import CliRunner
+
+    from ethica.__main__ import app
+    from ethica.cli import check
+
+    socket_path = tmp_path / "wedged.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen()
+    monkeypatch.setenv("ETHICA_SOCKET", str(socket_path))
+    monkeypatch.setattr(check, "DAEMON_TIMEOUT", 0.2)
+    (project / ".ai-ethics.yaml").write_text("frameworks:\n  - id: unesco-2021\n")
+    monkeypatch.chdir(project)
+
+    with pytest.raises(socket.timeout):
+        send_request({"command": "ping"}, socket_path, timeout=0.2)
+    result = CliRunner().invoke(app, ["check", "--daemon", "--no-cache"])
+    listener.close()
+
+    assert "Checking against unesco-2021" in result.stdout
+    assert "Checks Passed:" in result.stdout
+
+
+def test_skips_disabled_frameworks(server, project):
+    """Test the daemon checks the first enabled framework, as a local run does"""
+    request = {"command": "check", "project": str(project), "use_cache": False}
+    (project / ".ai-ethics.yaml").write_text(
+        "frameworks:\n  - id: unesco-2021\n    enabled: false\n  - id: local\n"
+    )
+
+    response = send_request(request, server.socket_path)
+
+    assert response["framework_id"] == "local"
+    assert response["results"]["overall_status"] == "passed"
+
+    (project / ".ai-ethics.yaml").write_text(
+        "frameworks:\n  - id: local\n    enabled: false\n"
+    )
+    response = send_request(request, server.socket_path)
+    assert "No enabled frameworks" in response["error"]
+
+
+def test_check_evaluates_compliance_level(project):
+    """Test the daemon plans for the level and reports it as a local run does"""
+    from ethica.core.checker import CheckEngine
+    from ethica.core.planning import CheckPlan, ComplianceLevel
+
+    (project / ".ai-ethics.yaml").write_text(
+        "frameworks:\n  - id: unesco-2021\n    compliance_level: basic\n"
+    )
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    plan = CheckPlan(CheckEngine(spec), ComplianceLevel.from_framework(spec, "basic"))
+
+    response = EnginePool().handle(
+        {"command": "check", "project": str(project), "use_cache": False}
+    )
+
+    assert response["results"] == plan.run(project)
+    assert response["results"]["compliance"]["checks_pruned"] > 0
@@ -0,0 +1,104 @@
+# ABOUTME: Unit tests for the compiled framework spec cache
+# ABOUTME: Tests warm loads skip parsing and edits or corruption fall back cleanly
+
+"""
+Tests for the compiled YAML spec cache.
+"""
+
+import os
+
+import pytest
+
+from ethica.core import spec_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Use an empty cache dir and in-memory cache for each test"""
+    monkeypatch.setenv("ETHICA_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(spec_cache, "_memory", {})
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    """Count real YAML parses"""
+    parses = []
+    original = spec_cache.safe_load
+
+    def counting_safe_load(stream):
+        parses.append(stream)
+        return original(stream)
+
+    monkeypatch.setattr(spec_cache, "safe_load", counting_safe_load)
+    return parses
+
+
+def test_warm_load_skips_parsing(tmp_path, parse_count, monkeypatch):
+    """Test that a second process reuses the compiled file"""
+    spec = tmp_path / "framework.yaml"
+    spec.write_text("metadata:\n  id: test\nchecks: []\n")
+
+    assert spec_cache.load_yaml(spec) == {"metadata": {"id": "test"}, "checks": []}
+
+    # Simulate a new process: in-memory cache gone, disk cache remains
+    monkeypatch.setattr(spec_cache, "_memory", {})
+    assert spec_cache.load_yaml(spec)["metadata"]["id"] == "test"
+    assert len(parse_count) == 1
+    assert list((tmp_path / "cache" / "specs").glob("*.pickle"))
+
+
+def test_edit_invalidates(tmp_path, parse_count):
+    """Test that changing the file's mtime or size forces a reparse"""
+    spec = tmp_path / "framework.yaml"
+    spec.write_text("version: 1\n")
+    spec_cache.load_yaml(spec)
+
+    spec.write_text("version: 22\n")
+    st = spec.stat()
+    os.utime(spec, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert spec_cache.load_yaml(spec) == {"version": 22}
+    assert len(parse_count) == 2
+    # The path's compiled copy was overwritten rather than joined by another
+    assert len(list((tmp_path / "cache" / "specs").iterdir())) == 1
+
+
+def test_old_cache_files_pruned(tmp_path):
+    """Test that files not rewritten for CACHE_MAX_AGE go when another is written"""
+    cache_dir = tmp_path / "cache" / "specs"
+    cache_dir.mkdir(parents=True)
+    stale = cache_dir / "deleted-spec.pickle"
+    stale.write_bytes(b"")
+    old = stale.stat().st_mtime - spec_cache.CACHE_MAX_AGE - 60
+    os.utime(stale, (old, old))
+    spec = tmp_path / "framework.yaml"
+    spec.write_text("version: 1\n")
+
+    spec_cache.load_yaml(spec)
+
+    assert not stale.exists()
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_corrupt_cache_falls_back(tmp_path, monkeypatch):
+    """Test that a truncated cache file is ignored and rewritten"""
+    spec = tmp_path / "framework.yaml"
+    spec.write_text("version: 1\n")
+    spec_cache.load_yaml(spec)
+
+    for cached in (tmp_path / "cache" / "specs").glob("*.pickle"):
+        cached.write_bytes(b"\x80garbage")
+    monkeypatch.setattr(spec_cache, "_memory", {})
+
+    assert spec_cache.load_yaml(spec) == {"version": 1}
+
+
+def test_loads_are_independent_copies(tmp_path):
+    """Test that mutating one load doesn't affect the next"""
+    spec = tmp_path / "framework.yaml"
+    spec.write_text("checks:\n  - type: file-exists\n")
+
+    first = spec_cache.load_yaml(spec)
+    first["checks"][0]["type"] = "changed"
+
+    assert spec_cache.load_yaml(spec)["checks"][0]["type"] == "file-exists"
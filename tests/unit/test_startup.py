@@ -0,0 +1,64 @@
+# ABOUTME: Startup regression tests for the CLI entry point
+# ABOUTME: Guards against heavy imports creeping back into ethica startup
+
+"""
+Tests for CLI import cost.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from ethica import __version__
+
+PACKAGE_ROOT = Path(__file__).parent.parent.parent
+
+# Cumulative import budget for ethica.__main__, including typer itself
+IMPORT_BUDGET_US = int(os.environ.get("ETHICA_IMPORT_BUDGET_US", "100000"))
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(PACKAGE_ROOT))
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def test_version_does_not_import_commands():
+    """Test that `ethica version` loads no command modules, rich, or yaml"""
+    script = (
+        "import sys\n"
+        "from ethica.__main__ import app\n"
+        "app(['version'], standalone_mode=False)\n"
+        "heavy = ('rich', 'yaml', 'ethica.cli', 'ethica.core', 'ethica.checks')\n"
+        "print(sorted(m for m in sys.modules if m.startswith(heavy)))\n"
+    )
+    result = _python("-c", script)
+
+    assert result.stdout.splitlines() == [f"ethica version {__version__}", "[]"]
+
+
+def test_import_time_budget():
+    """Test that importing the entry point stays within budget"""
+    result = _python("-X", "importtime", "-c", "import ethica.__main__")
+
+    # Lines look like "import time: <self us> | <cumulative us> | <module>"
+    line = next(
+        line for line in result.stderr.splitlines() if line.rstrip().endswith("| ethica.__main__")
+    )
+    cumulative = int(line.split("|")[1])
+
+    assert cumulative < IMPORT_BUDGET_US
+
+
+def test_lazy_commands_resolve():
+    """Test that every lazily registered command can be loaded"""
+    from typer.testing import CliRunner
+
+    from ethica.__main__ import app
+
+    runner = CliRunner()
+    for command in ("init", "check", "frameworks", "history", "serve"):
+        result = runner.invoke(app, [command, "--help"])
+        assert result.exit_code == 0, result.output
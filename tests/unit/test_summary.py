@@ -0,0 +1,97 @@
+# ABOUTME: Unit tests for the summary reducers
+# ABOUTME: Tests one-pass counters, merging partial summaries and fleet totals
+
+"""
+Tests for streaming summary reducers.
+"""
+
+import pytest
+from pathlib import Path
+
+from ethica.core.checker import CheckEngine
+from ethica.core.registry import FrameworkRegistry
+from ethica.core.summary import FleetReducer, SummaryReducer
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def _check(check_id: str, status: str, severity: str = "error") -> dict:
+    return {"id": check_id, "name": check_id, "status": status, "message": "", "severity": severity}
+
+
+@pytest.fixture
+def engine():
+    return CheckEngine(FrameworkRegistry().load_framework_spec("unesco-2021"))
+
+
+def test_summary_structure():
+    """Test counters, statuses and pass rate in the run_checks shape"""
+    reducer = SummaryReducer("local", "1.0.0")
+    reducer.add("transparency", _check("t-001", "passed"))
+    reducer.add("transparency", _check("t-002", "failed", "warning"))
+    reducer.add("privacy", _check("p-001", "skipped"))
+
+    summary = reducer.summary()
+
+    assert summary["total_checks"] == 3
+    assert summary["checks_passed"] == 1
+    assert summary["checks_failed"] == 1
+    assert summary["checks_skipped"] == 1
+    assert summary["pass_rate"] == pytest.approx(1 / 3)
+    assert summary["overall_status"] == "passed with warnings"
+    assert [p["status"] for p in summary["principles"]] == ["failed", "skipped"]
+    assert [c["id"] for c in summary["principles"][0]["checks"]] == ["t-001", "t-002"]
+
+
+def test_merge_matches_single_pass(engine):
+    """Test that merging per-worker halves equals reducing everything at once"""
+    results = [r for r, _ in engine.execute(FIXTURES / "non_compliant_project")]
+    whole = engine.reduce(results)
+
+    metadata = engine.framework_spec["metadata"]
+    first = SummaryReducer(metadata["id"], metadata["version"])
+    second = SummaryReducer(metadata["id"], metadata["version"])
+    for i, (check, result) in enumerate(zip(engine.checks, results)):
+        (first if i % 2 else second).add(check.principle, result.to_dict())
+    second.merge(first)
+
+    merged = second.summary()
+    assert merged["overall_status"] == whole.summary()["overall_status"] == "failed"
+    assert {k: v for k, v in merged.items() if k != "principles"} == {
+        k: v for k, v in whole.summary().items() if k != "principles"
+    }
+
+
+def test_without_checks_keeps_only_counters():
+    """Test that bounded-memory reducers drop check dicts"""
+    reducer = SummaryReducer("local", "1.0.0", keep_checks=False)
+    for i in range(1000):
+        reducer.add("transparency", _check(f"t-{i}", "passed"))
+
+    assert reducer.principles["transparency"]["checks"] == []
+    assert "checks" not in reducer.summary()["principles"][0]
+    assert reducer.summary()["checks_passed"] == 1000
+
+
+def test_fleet_reducer_merge():
+    """Test fleet-wide counters from partial fleets"""
+    passing = SummaryReducer("local", "1.0.0")
+    passing.add("transparency", _check("t-001", "passed"))
+    failing = SummaryReducer("local", "1.0.0")
+    failing.add("transparency", _check("t-001", "failed"))
+
+    left = FleetReducer()
+    left.add_project(passing)
+    left.add_project(None)
+    right = FleetReducer()
+    right.add_project(failing)
+    left.merge(right)
+
+    summary = left.summary()
+    assert summary["total_projects"] == 3
+    assert summary["projects_passed"] == 1
+    assert summary["projects_failed"] == 1
+    assert summary["projects_errored"] == 1
+    assert summary["overall_status"] == "failed"
+    assert summary["frameworks"]["local"]["total_checks"] == 2
+    assert summary["frameworks"]["local"]["checks_failed"] == 1
@@ -0,0 +1,116 @@
+# ABOUTME: Unit tests for the virtual filesystems behind ProjectContext
+# ABOUTME: Tests checking wheels, sdists and zips without extracting them
+
+"""
+Tests for archive filesystems.
+"""
+
+import io
+import pickle
+import tarfile
+import zipfile
+
+import pytest
+
+from ethica.core.checker import CheckEngine
+from ethica.core.context import ProjectContext
+from ethica.core.registry import FrameworkRegistry
+from ethica.core.vfs import ArchiveFileSystem, TarFileSystem, ZipFileSystem, open_filesystem
+
+WHEEL_METADATA = (
+    "Metadata-Version: 2.1\n"
+    "Name: model\n"
+    "Version: 1.2\n"
+    "Requires-Dist: shap (>=0.40)\n"
+    "Requires-Dist: numpy\n"
+    "\n"
+    "Requires-Dist: not-a-header\n"
+)
+
+
+@pytest.fixture
+def wheel(tmp_path):
+    path = tmp_path / "model-1.2-py3-none-any.whl"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("model/__init__.py", "import shap\n")
+        zf.writestr("model/weights.bin", b"\0" * 100_000)
+        zf.writestr("model-1.2.dist-info/METADATA", WHEEL_METADATA)
+        zf.writestr("MODEL_CARD.md", "# Model Card")
+    return path
+
+
+@pytest.fixture
+def sdist(tmp_path):
+    path = tmp_path / "model-1.2.tar.gz"
+    files = {
+        "model-1.2/PKG-INFO": WHEEL_METADATA,
+        "model-1.2/requirements.txt": "fairlearn\n",
+        "model-1.2/docs/PRIVACY_IMPACT_ASSESSMENT.md": "# PIA",
+        "model-1.2/src/model/train.py": "from fairlearn.metrics import MetricFrame\n",
+    }
+    with tarfile.open(path, "w:gz") as tf:
+        for name, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return path
+
+
+def test_open_filesystem(wheel, sdist, tmp_path):
+    """Test archives are recognized by content and other files rejected"""
+    assert isinstance(open_filesystem(wheel), ZipFileSystem)
+    assert isinstance(open_filesystem(sdist), TarFileSystem)
+    assert open_filesystem(tmp_path).is_local
+
+    (tmp_path / "notes.txt").write_text("hello")
+    with pytest.raises(ValueError, match="not a directory or a supported archive"):
+        open_filesystem(tmp_path / "notes.txt")
+
+
+def test_sdist_is_rooted_at_its_directory(sdist):
+    """Test the single top-level directory of an sdist becomes the root"""
+    context = ProjectContext(sdist)
+
+    assert context.exists("requirements.txt")
+    assert context.exists("docs")
+    assert not context.exists("model-1.2")
+    assert context.read_text("docs/PRIVACY_IMPACT_ASSESSMENT.md") == "# PIA"
+    assert context.stat("requirements.txt").st_size == len("fairlearn\n")
+    assert context.glob("**/*.py") == ["src/model/train.py"]
+    assert "fairlearn" in context.import_index()
+    assert {"shap", "numpy", "fairlearn"} <= set(context.manifest_index.sources)
+
+
+def test_checks_read_only_needed_members(wheel, monkeypatch):
+    """Test a framework runs against a wheel, reading just the members it needs"""
+    read = []
+    original = ZipFileSystem._read_member
+    monkeypatch.setattr(
+        ZipFileSystem,
+        "_read_member",
+        lambda fs, handle, member: read.append(member.filename) or original(fs, handle, member),
+    )
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+
+    results = CheckEngine(spec).run_checks(wheel)
+
+    checks = {c["id"]: c for p in results["principles"] for c in p["checks"]}
+    assert checks["transparency-001"]["status"] == "passed"
+    assert checks["transparency-002"]["status"] == "passed"
+    assert "model-1.2.dist-info/METADATA" in checks["transparency-002"]["message"]
+    assert read == ["model-1.2.dist-info/METADATA"]
+    assert list(wheel.parent.iterdir()) == [wheel]
+
+
+def test_archive_filesystem_pickles_without_handle(wheel):
+    """Test workers get a fresh view that reopens the archive"""
+    fs = open_filesystem(wheel)
+    assert fs.exists("MODEL_CARD.md")
+
+    copy = pickle.loads(pickle.dumps(fs))
+
+    assert isinstance(copy, ArchiveFileSystem)
+    assert copy.read_bytes("MODEL_CARD.md") == b"# Model Card"
+    fs.close()
+    copy.close()
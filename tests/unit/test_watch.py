@@ -0,0 +1,141 @@
+# ABOUTME: Unit tests for watch mode
+# ABOUTME: Tests selective re-runs and the inotify and polling watchers
+
+"""
+Tests for change-driven re-evaluation.
+"""
+
+import sys
+
+import pytest
+
+from ethica.checks.manifests import ManifestIndex
+from ethica.core.checker import CheckEngine
+from ethica.core.planning import ComplianceLevel
+from ethica.core.registry import FrameworkRegistry
+from ethica.core.watch import InotifyWatcher, PollingWatcher, WatchSession, create_watcher
+
+
+@pytest.fixture
+def session(tmp_path):
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    (tmp_path / "requirements.txt").write_text("shap\n")
+    return WatchSession(CheckEngine(spec), tmp_path)
+
+
+def test_update_reruns_only_affected_checks(session, tmp_path, monkeypatch):
+    """Test that a doc edit doesn't re-parse manifests"""
+    session.start()
+
+    builds = []
+    original_build = ManifestIndex.build.__func__
+    monkeypatch.setattr(
+        ManifestIndex,
+        "build",
+        classmethod(lambda cls, ctx: builds.append(ctx) or original_build(cls, ctx)),
+    )
+
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+    results, indexes = session.update({"MODEL_CARD.md"})
+
+    assert [session.engine.checks[i].check_id for i in indexes] == ["transparency-001"]
+    assert builds == []
+    assert results["checks_passed"] == 2
+
+
+def test_directory_creation_affects_nested_probes(session, tmp_path):
+    """Test that creating docs/ re-runs checks probing files inside it"""
+    session.start()
+
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "PRIVACY_IMPACT_ASSESSMENT.md").write_text("# PIA")
+    results, indexes = session.update({"docs"})
+
+    ids = {session.engine.checks[i].check_id for i in indexes}
+    assert ids == {"transparency-001", "privacy-001"}
+    privacy = next(p for p in results["principles"] if p["id"] == "privacy")
+    assert privacy["status"] == "passed"
+
+
+def test_unrelated_change_runs_nothing(session):
+    """Test that files no check reads are ignored"""
+    session.start()
+
+    _, indexes = session.update({"src/model.py"})
+
+    assert indexes == []
+
+
+def test_session_evaluates_compliance_level(tmp_path):
+    """Test that a level prunes unneeded checks and is re-evaluated on updates"""
+    spec = FrameworkRegistry().load_framework_spec("unesco-2021")
+    (tmp_path / "requirements.txt").write_text("shap\n")
+    (tmp_path / ".git").mkdir()
+    level = ComplianceLevel.from_framework(spec, "basic")
+    session = WatchSession(CheckEngine(spec), tmp_path, level=level)
+
+    results = session.start()
+    assert results["total_checks"] == 3
+    assert results["compliance"]["reached"] is False
+
+    (tmp_path / "MODEL_CARD.md").write_text("# Model Card")
+    results, indexes = session.update({"MODEL_CARD.md"})
+
+    assert len(indexes) == 1
+    assert results["compliance"]["reached"] is True
+    assert session.update({"PRIVACY_IMPACT_ASSESSMENT.md"})[1] == []
+
+
+def test_listed_directory_change_affects_glob_checks(tmp_path):
+    """Test that a new file in a globbed directory re-runs the content check"""
+    spec = {
+        "metadata": {"id": "test", "version": "1.0"},
+        "checks": [
+            {
+                "id": "content-001",
+                "name": "No placeholders",
+                "principle": "transparency",
+                "severity": "error",
+                "description": "Docs have no template placeholders",
+                "type": "file-content",
+                "config": {"paths": ["docs/*.md"], "forbidden": ["TODO"]},
+            }
+        ],
+    }
+    (tmp_path / "docs").mkdir()
+    session = WatchSession(CheckEngine(spec), tmp_path)
+    assert session.start()["checks_skipped"] == 1
+
+    (tmp_path / "docs" / "new.md").write_text("TODO\n")
+    results, indexes = session.update({"docs/new.md"})
+
+    assert indexes == [0]
+    assert results["checks_failed"] == 1
+    assert session.update({"docs/sub/deep.md"})[1] == []
+
+
+@pytest.mark.parametrize("polling", [True, False])
+def test_watchers_report_changes(tmp_path, polling):
+    """Test both watchers detect edits and creation of missing paths"""
+    if not polling and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+
+    (tmp_path / "requirements.txt").write_text("shap\n")
+    watcher = create_watcher(tmp_path, polling=polling)
+    assert isinstance(watcher, PollingWatcher if polling else InotifyWatcher)
+    if polling:
+        watcher.interval = 0.01
+
+    try:
+        watcher.watch({"requirements.txt", "docs/MODEL_CARD.md"})
+        assert watcher.wait(timeout=0.05) == set()
+
+        (tmp_path / "requirements.txt").write_text("shap\nfairlearn\n")
+        assert "requirements.txt" in watcher.wait(timeout=2)
+
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "MODEL_CARD.md").write_text("# Model Card")
+        changed = watcher.wait(timeout=2)
+        assert changed & {"docs", "docs/MODEL_CARD.md"}
+    finally:
+        watcher.close()
@@ -0,0 +1,154 @@
+# ABOUTME: Unit tests for the JSON, SARIF and JUnit report writers
+# ABOUTME: Tests encoding with and without orjson, report shapes and reporting config
+
+"""
+Tests for report writers.
+"""
+
+import io
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from ethica.reporting import writers
+from ethica.reporting.writers import write_json, write_junit, write_reports, write_sarif
+
+
+def _check(check_id, status, severity="error", message="msg", suggestion=None):
+    return {
+        "id": check_id,
+        "name": f"Check {check_id}",
+        "status": status,
+        "message": message,
+        "severity": severity,
+        "suggestion": suggestion,
+    }
+
+
+@pytest.fixture
+def report():
+    checks = [
+        _check("t-001", "passed"),
+        _check("t-002", "failed", message="Missing [red]MODEL_CARD.md[/red] & <docs>",
+               suggestion="Add one"),
+        _check("t-003", "timeout", severity="warning"),
+        _check("t-004", "skipped", severity="info"),
+    ]
+    return {
+        "framework_id": "local",
+        "framework_version": "1.0",
+        "principles": [
+            {"id": "transparency", "checks": checks[:2], "passed": 1, "failed": 1},
+            {"id": "safety", "checks": checks[2:], "skipped": 1, "timeout": 1},
+        ],
+        "total_checks": 4,
+        "checks_passed": 1,
+        "checks_failed": 1,
+        "checks_skipped": 1,
+        "checks_timed_out": 1,
+        "overall_status": "failed",
+    }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_is_compact_and_verbatim(report, monkeypatch, use_orjson):
+    """Test JSON output is one compact line that keeps markup-like text"""
+    if not use_orjson:
+        monkeypatch.setattr(writers, "orjson", None)
+    elif writers.orjson is None:
+        pytest.skip("orjson not installed")
+    stream = io.BytesIO()
+
+    write_json(report, stream)
+
+    text = stream.getvalue().decode()
+    assert text.count("\n") == 1
+    assert '": ' not in text
+    assert json.loads(text) == report
+    assert "[red]MODEL_CARD.md[/red]" in text
+
+
+def test_sarif(report):
+    """Test every check is a rule and failures and timeouts are results"""
+    stream = io.BytesIO()
+
+    write_sarif({"frameworks": {"local": report}}, stream)
+
+    log = json.loads(stream.getvalue())
+    assert log["version"] == "2.1.0"
+    run = log["runs"][0]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == [
+        "local/t-001", "local/t-002", "local/t-003", "local/t-004"
+    ]
+    failed, timed_out = run["results"]
+    assert failed["ruleId"] == "local/t-002"
+    assert (failed["kind"], failed["level"]) == ("fail", "error")
+    assert failed["properties"] == {"suggestion": "Add one"}
+    assert failed["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] == (
+        ".ai-ethics.yaml"
+    )
+    assert (timed_out["kind"], timed_out["level"]) == ("open", "none")
+
+
+def test_junit(report):
+    """Test JUnit XML has a suite per framework with failures, errors and skips"""
+    stream = io.BytesIO()
+    fleet = {"projects": [{"path": "svc", "results": report}, {"path": "bad", "error": "x"}]}
+
+    write_junit(fleet, stream)
+
+    root = ET.fromstring(stream.getvalue())
+    assert root.attrib["tests"] == "4"
+    (suite,) = root
+    assert suite.attrib == {
+        "name": "svc:local", "tests": "4", "failures": "1", "errors": "1", "skipped": "1"
+    }
+    cases = {case.attrib["name"]: case for case in suite}
+    assert len(cases["t-001: Check t-001"]) == 0
+    failure = cases["t-002: Check t-002"].find("failure")
+    assert failure.attrib["message"] == "Missing [red]MODEL_CARD.md[/red] & <docs>"
+    assert failure.text.endswith("Suggestion: Add one")
+    assert cases["t-003: Check t-003"].find("error").attrib["type"] == "timeout"
+    assert cases["t-004: Check t-004"].find("skipped") is not None
+    assert cases["t-002: Check t-002"].attrib["classname"] == "svc:local.transparency"
+
+
+def test_write_reports(report, tmp_path):
+    """Test each known format is written once and others are skipped"""
+    written = write_reports(report, ["text", "sarif", "json", "sarif"], tmp_path / "out")
+
+    assert [path.name for path in written] == ["ethica-report.sarif", "ethica-report.json"]
+    assert json.loads((tmp_path / "out" / "ethica-report.json").read_text()) == report
+
+
+def test_check_command_reports(tmp_path, monkeypatch):
+    """Test one check run prints JSON and writes the configured report files"""
+    from typer.testing import CliRunner
+
+    from ethica.__main__ import app
+
+    (tmp_path / ".ai-ethics.yaml").write_text(
+        "frameworks:\n"
+        "  - id: unesco-2021\n"
+        "custom_checks:\n"
+        "  - id: markup\n"
+        "    type: file-exists\n"
+        "    principle: transparency\n"
+        "    config:\n"
+        "      paths: ['[red]notes.md']\n"
+        "reporting:\n"
+        "  formats: [text, sarif, junit]\n"
+        "  output_dir: reports\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(app, ["check", "--output", "json", "--no-cache"])
+
+    results = json.loads(result.stdout)
+    checks = {c["id"]: c for p in results["principles"] for c in p["checks"]}
+    assert "[red]notes.md" in checks["markup"]["message"]
+    assert sorted(path.name for path in (tmp_path / "reports").iterdir()) == [
+        "ethica-report.junit.xml", "ethica-report.sarif"
+    ]
+    ET.parse(tmp_path / "reports" / "ethica-report.junit.xml")